@@ -39,8 +39,9 @@ ELEMENT_TIMEOUT = 60_000   # 等待元素出现超时
 class ChannelsPublisher:
     """微信视频号自动发布器，支持 with 语句"""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, pool=None):
         self.headless = headless
+        self._pool = pool
         self._pw = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
@@ -59,21 +60,25 @@ class ChannelsPublisher:
     # ────────── 生命周期 ──────────
 
     def start(self):
-        """启动浏览器（使用系统 Edge + 持久化上下文保持登录态）"""
+        """启动浏览器（使用系统 Edge + 持久化上下文保持登录态；有共享池时改用池内独立上下文）"""
         BROWSER_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
-        self._pw = sync_playwright().start()
-        self._context = self._pw.chromium.launch_persistent_context(
-            user_data_dir=str(BROWSER_PROFILE_DIR),
-            channel="msedge",
-            headless=self.headless,
-            args=["--disable-blink-features=AutomationControlled"],
-            viewport={"width": 1280, "height": 800},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0"
-            ),
-        )
+        # 尚无登录态快照时仍走持久化上下文，避免在共享池里重新扫码
+        if self._pool is not None and COOKIES_FILE.exists():
+            self._context = self._pool.new_context(COOKIES_FILE)
+        else:
+            self._pw = sync_playwright().start()
+            self._context = self._pw.chromium.launch_persistent_context(
+                user_data_dir=str(BROWSER_PROFILE_DIR),
+                channel="msedge",
+                headless=self.headless,
+                args=["--disable-blink-features=AutomationControlled"],
+                viewport={"width": 1280, "height": 800},
+                user_agent=(
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0"
+                ),
+            )
         self._context.add_init_script(
             "Object.defineProperty(navigator,'webdriver',{get:()=>undefined})"
         )
@@ -1343,9 +1348,9 @@ class ChannelsPublisher:
 # ────────── 便捷函数 ──────────
 
 def publish_channels_text(body: str, image_sources: List[str] = None,
-                          title: str = "", headless: bool = False) -> bool:
-    """一键发布微信视频号图文动态"""
-    with ChannelsPublisher(headless=headless) as pub:
+                          title: str = "", headless: bool = False, pool=None) -> bool:
+    """一键发布微信视频号图文动态（pool: 可选的共享浏览器池）"""
+    with ChannelsPublisher(headless=headless, pool=pool) as pub:
         pub.login()
         time.sleep(settings.channels_publish_delay)
         return pub.publish_text_image(body, image_sources, title=title)
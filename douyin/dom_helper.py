@@ -0,0 +1,546 @@
+"""
+抖音发布页常驻 DOM 辅助脚本
+通过 context.add_init_script 在每次导航时注入，暴露 window.__fm 命名空间。
+Python 侧只需发送简短的调用表达式（如 "window.__fm.removeOverlays()"），
+一次 page.evaluate 即可完成原本需要多次往返的 DOM 探测与操作。
+"""
+
+__all__ = ["FM_HELPER_JS", "FM_MISSING", "FM_HIT_ATTR"]
+
+# window.__fm 尚未注入时调用方收到的哨兵值
+FM_MISSING = "__fm_missing__"
+
+# 页面内选中的元素打上该属性（值唯一），Python 侧按 [data-fm-hit="..."] 精确定位这一个元素
+FM_HIT_ATTR = "data-fm-hit"
+
+FM_HELPER_JS = r"""
+(() => {
+    if (window.__fm) return;
+
+    // ── 通用工具 ──
+    const isVisible = (el) => {
+        if (!el) return false;
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0;
+    };
+    const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+    // 等待下一帧；后台标签页 rAF 会被节流，100ms 兜底
+    const nextFrame = () => new Promise(r => {
+        requestAnimationFrame(() => r());
+        setTimeout(r, 100);
+    });
+    // 元素中心点（视口坐标）；不在视口内时先滚动到中间，便于 Python 侧 mouse.click
+    const clickPoint = (el) => {
+        let r = el.getBoundingClientRect();
+        if (r.bottom < 0 || r.top > window.innerHeight) {
+            el.scrollIntoView({block: 'center'});
+            r = el.getBoundingClientRect();
+        }
+        return {cx: r.x + r.width / 2, cy: r.y + r.height / 2};
+    };
+
+    // "rgb(r, g, b)" / "rgba(...)" 一次正则取出三个分量，按数值判断是否为红色主按钮
+    const RGB_RE = /\d+/g;
+    const PRIMARY_CLASS_RE = /primary|danger|confirm/i;
+    const isRedColor = (color) => {
+        const m = color.match(RGB_RE);
+        if (!m || m.length < 3) return false;
+        return +m[0] > 200 && +m[1] < 100 && +m[2] < 100;
+    };
+
+    const COVER_MODAL_SELECTORS = [
+        '.semi-modal-wrap', '[role="modal"]',
+        '.dy-creator-content-modal-wrap', '.dy-creator-content-portal',
+    ];
+    const ORIGINAL_CONTROL_SEL =
+        'input[type="checkbox"], input[type="radio"], [role="switch"], [role="checkbox"], ' +
+        '[class*="switch"], [class*="Switch"], [class*="toggle"], [class*="Toggle"], ' +
+        '[class*="check"], [class*="Check"], [class*="semi-switch"], [class*="Semi"]';
+    // 文字常量集合在注入时构建一次，热循环里用 Set.has 代替每次新建数组再 includes
+    const COVER_SAVE_TEXTS = new Set(['保存', '确认', '完成', '确定']);
+    const SKIP_INPUT_TYPES = new Set(['file', 'hidden', 'search', 'checkbox', 'radio']);
+    // 文字按包含匹配（与 get_by_text(exact=False) 一致），带图标或附加文字的标签也能命中；
+    // 类名匹配不区分大小写（CSS 属性选择器的 i 标志），Arrow / Expand 等驼峰类名同样收集
+    const MORE_OPTION_TEXTS = ['更多设置', '更多选项', '高级设置', '展开更多', '更多配置'];
+    const MORE_OPTION_LABEL_MAX = 20;   // 超过该长度的文本视为整块容器，不当作展开按钮
+    const MORE_OPTION_CANDIDATE_SEL =
+        'button, [role="button"], [class*="more" i], [class*="expand" i], ' +
+        '[class*="collapse" i], [class*="arrow" i]';
+    const MORE_OPTION_XPATH = '//*[' + MORE_OPTION_TEXTS
+        .map(t => `contains(text(), '${t}')`).join(' or ') + ']';
+    const isMoreOptionLabel = (txt) =>
+        txt.length <= MORE_OPTION_LABEL_MAX && MORE_OPTION_TEXTS.some(t => txt.includes(t));
+
+    // ── DOM 版本号 + 选择器缓存 ──
+    // MutationObserver 在节点增删/文本变化时递增 domVersion；缓存条目版本不一致即失效。
+    // 观察器尚未挂上（body 未就绪）时不做缓存，避免返回陈旧结果。
+    let domVersion = 0;
+    let lastMutationTs = 0;
+    let observing = false;
+    const selectorCache = new Map();
+    const observeDom = () => {
+        if (observing || !document.body) return observing;
+        new MutationObserver(() => { domVersion++; lastMutationTs = Date.now(); })
+            .observe(document.body, {childList: true, subtree: true, characterData: true});
+        observing = true;
+        return true;
+    };
+    if (!observeDom()) document.addEventListener('DOMContentLoaded', observeDom, {once: true});
+
+    const queryCached = (sel) => {
+        if (!observeDom()) return [...document.querySelectorAll(sel)];
+        const hit = selectorCache.get(sel);
+        if (hit && hit.version === domVersion) return hit.els;
+        const els = [...document.querySelectorAll(sel)];
+        selectorCache.set(sel, {version: domVersion, els});
+        return els;
+    };
+    const memo = new Map();
+    // 缓存值若持有已脱离文档的元素（hit.value.el），视为失效重新计算
+    const memoize = (key, compute) => {
+        if (!observeDom()) return compute();
+        const hit = memo.get(key);
+        if (hit && hit.version === domVersion &&
+            (!hit.value || !hit.value.el || hit.value.el.isConnected)) {
+            return hit.value;
+        }
+        const value = compute();
+        memo.set(key, {version: domVersion, value});
+        return value;
+    };
+
+    const fm = {};
+
+    // 包含指定文字的文本节点：原生 XPath 查找（C++ 层遍历），按 DOM 版本缓存
+    fm.findByText = (term) => memoize('text:' + term, () => {
+        const snap = document.evaluate(`//body//text()[contains(., '${term}')]`, document,
+            null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+        return nodes;
+    });
+
+    // 带文字的按钮列表，按 DOM 版本缓存；可见性/禁用状态由调用方按需实时判断
+    fm.getButtons = () => memoize('buttons', () =>
+        queryCached('button').filter(b => b.textContent.trim()));
+
+    // 当前 DOM 版本号 / 最近一次变更时间，供 Python 侧轮询判断页面是否有变化
+    fm.domVersion = () => { observeDom(); return domVersion; };
+    fm.lastMutationTs = () => lastMutationTs;
+
+    // Playwright 风格 "text=xxx" 或 CSS 选择器 → 候选元素；非法选择器视为无匹配
+    const resolveSelector = (sel) => {
+        if (sel.startsWith('text=')) {
+            return fm.findByText(sel.slice(5)).map(n => n.parentElement).filter(Boolean);
+        }
+        try {
+            return queryCached(sel);
+        } catch (e) {
+            return [];
+        }
+    };
+
+    // 按顺序尝试选择器，返回第一个可见元素及其选择器下标（只读，不滚动）
+    const firstVisibleMatch = (selectors) => {
+        for (let i = 0; i < selectors.length; i++) {
+            for (const el of resolveSelector(selectors[i])) {
+                if (el.offsetParent === null || !isVisible(el)) continue;
+                return {index: i, el};
+            }
+        }
+        return null;
+    };
+
+    // 给命中元素打上唯一标记（属性名与 FM_HIT_ATTR 一致）：选择器的第一个匹配可能是隐藏元素，
+    // Python 侧按标记定位才能拿到这里判定为可见的那一个
+    let hitSeq = 0;
+    const hitPrefix = Date.now().toString(36);
+    const tagHit = (el) => {
+        const tag = `${hitPrefix}-${++hitSeq}`;
+        el.setAttribute('data-fm-hit', tag);
+        return tag;
+    };
+
+    // 第一个可见元素的下标与点击坐标；全部未命中返回 null
+    fm.pickVisible = (selectors) => {
+        const hit = firstVisibleMatch(selectors);
+        if (!hit) return null;
+        return {index: hit.index, ...clickPoint(hit.el), text: hit.el.textContent.trim().slice(0, 30)};
+    };
+
+    // 页面内等待任一选择器出现可见元素：DOM 变更时按帧合并复查，另有 250ms 兜底定时器，
+    // 整个等待只占一次 CDP 调用；命中返回选择器下标与元素标记，超时返回 null
+    fm.waitForAnySelector = (selectors, timeoutMs) => new Promise(resolve => {
+        const deadline = Date.now() + timeoutMs;
+        let observer = null, timer = null, scheduled = false, done = false;
+        const check = () => {
+            scheduled = false;
+            if (done) return true;
+            const hit = firstVisibleMatch(selectors);
+            if (!hit && Date.now() < deadline) return false;
+            done = true;
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            resolve(hit ? {index: hit.index, tag: tagHit(hit.el)} : null);
+            return true;
+        };
+        if (check()) return;
+        observer = new MutationObserver(() => {
+            if (scheduled) return;
+            scheduled = true;
+            requestAnimationFrame(check);
+        });
+        observer.observe(document.body || document.documentElement,
+            {childList: true, subtree: true, attributes: true});
+        const tick = () => { if (!check()) timer = setTimeout(tick, 250); };
+        timer = setTimeout(tick, 250);
+    });
+
+    // 一次解析标题与正文编辑区：各自返回第一个可见元素的标记
+    fm.resolveFormHandles = (titleSels, bodySels) => {
+        const title = firstVisibleMatch(titleSels);
+        const body = firstVisibleMatch(bodySels);
+        return {
+            titleTag: title ? tagHit(title.el) : null,
+            bodyTag: body ? tagHit(body.el) : null,
+            exists: {title: !!title, body: !!body},
+        };
+    };
+
+    // 按文字顺序查找可见可用按钮（exact: 全文匹配，last: 取最后一个命中）
+    fm.pickButton = (texts, exact = false, last = false) => {
+        const btns = fm.getButtons().filter(b => b.offsetParent !== null && !b.disabled);
+        for (const t of texts) {
+            const hits = btns.filter(b => {
+                const txt = b.textContent.trim();
+                return exact ? txt === t : txt.includes(t);
+            });
+            if (hits.length === 0) continue;
+            const btn = last ? hits[hits.length - 1] : hits[0];
+            return {text: t, ...clickPoint(btn)};
+        }
+        return null;
+    };
+
+    // 封面模态中的红色/主要保存按钮
+    fm.closeCoverSave = () => {
+        for (const sel of COVER_MODAL_SELECTORS) {
+            for (const modal of document.querySelectorAll(sel)) {
+                if (modal.style.display === 'none') continue;
+                const rect = modal.getBoundingClientRect();
+                if (rect.width === 0 && rect.height === 0) continue;
+
+                let primaryBtn = null;
+                for (const btn of fm.getButtons()) {
+                    if (!modal.contains(btn)) continue;
+                    const text = btn.textContent.trim();
+                    if (text === '取消' || text === '封面检测') continue;
+                    if (btn.offsetParent === null) continue;
+                    if (isRedColor(window.getComputedStyle(btn).backgroundColor) ||
+                        PRIMARY_CLASS_RE.test(btn.className)) {
+                        primaryBtn = btn;
+                        break;
+                    }
+                    if (COVER_SAVE_TEXTS.has(text)) primaryBtn = btn;
+                }
+                if (primaryBtn) {
+                    primaryBtn.click();
+                    return {status: 'clicked', text: primaryBtn.textContent.trim(),
+                            bg: window.getComputedStyle(primaryBtn).backgroundColor};
+                }
+            }
+        }
+        return {status: 'not_found'};
+    };
+
+    // 封面槽位状态：可见的「选择封面」空槽位 + 已上传的封面/缩略图数量（单次调用）
+    fm.verifyCovers = () => {
+        let emptyVisible = 0;
+        for (const node of fm.findByText('选择封面')) {
+            const el = node.parentElement;
+            if (el && el.offsetParent !== null) emptyVisible++;
+        }
+        return {
+            status: emptyVisible === 0 ? 'filled' : 'has_empty',
+            emptyVisible,
+            coverImgs: queryCached('img[src*="cover"], img[src*="image"], img[class*="cover"]').length,
+            thumbImgs: queryCached('[class*="cover"] img, [class*="thumb"] img').length,
+        };
+    };
+
+    // 收集需要隐藏的覆盖层 portal（只读，按 DOM 版本缓存）
+    // 返回 [{el, pointer}]：pointer 为 true 时同时禁用 pointer-events
+    const overlayTargets = () => memoize('overlays', () => {
+        const targets = new Map();
+        const add = (el, pointer = true) => {
+            if (el.style.display === 'none' || targets.has(el)) return;
+            targets.set(el, pointer);
+        };
+        for (const el of queryCached('.dy-creator-content-portal')) {
+            if (el.querySelector('.dy-creator-content-modal-wrap, [class*="modal-wrap"], [class*="preview-"]')) add(el);
+        }
+        for (const el of queryCached('.semi-portal')) {
+            if (el.querySelector('[role="modal"], .semi-modal-wrap')) add(el);
+        }
+        for (const el of queryCached('.ReactCrop')) {
+            const portal = el.closest('.semi-portal, .dy-creator-content-portal');
+            if (portal) add(portal);
+        }
+        for (const el of queryCached('[class*="preview-"], [class*="modal-mask"], [class*="overlay"]')) {
+            const rect = el.getBoundingClientRect();
+            if (rect.width <= 500 || rect.height <= 300) continue;
+            const portal = el.closest('.dy-creator-content-portal, .semi-portal');
+            if (portal) add(portal, false);
+        }
+        return [...targets].map(([el, pointer]) => ({el, pointer}));
+    });
+
+    // 是否存在阻挡交互的覆盖层（同一 DOM 版本内直接复用结果）
+    fm.hasBlockingOverlay = () => overlayTargets().length > 0;
+
+    // 隐藏可能阻挡交互的覆盖层（模态残余、预览面板、ReactCrop 等）
+    // 先读完所有尺寸再统一写样式，避免读写交替引发重复布局；无覆盖层时直接返回
+    fm.removeOverlays = () => {
+        const targets = overlayTargets();
+        if (targets.length === 0) return {status: 'clean', hidden: 0};
+        for (const {el, pointer} of targets) {
+            el.style.display = 'none';
+            if (pointer) el.style.pointerEvents = 'none';
+        }
+        // 仅改样式不会触发 childList 变更，手动失效缓存
+        memo.delete('overlays');
+        return {status: 'ok', hidden: targets.length};
+    };
+
+    // 定位「原创」文字附近的开关（同一 DOM 版本内复用定位结果）
+    const locateOriginal = () => memoize('original', () => {
+        for (const node of fm.findByText('原创')) {
+            const text = node.textContent.trim();
+            if (text.length > 50) continue;
+            const el = node.parentElement;
+            if (!el || el.offsetParent === null) continue;
+
+            let cur = el;
+            for (let depth = 0; depth < 6 && cur && cur !== document.body; depth++) {
+                for (const ctrl of cur.querySelectorAll(ORIGINAL_CONTROL_SEL)) {
+                    if (isVisible(ctrl)) return {el: ctrl, isControl: true, text};
+                }
+                cur = cur.parentElement;
+            }
+            return {el, isControl: false, text};
+        }
+        return null;
+    });
+
+    // 查找「原创」开关并点击
+    fm.findOriginalToggle = () => {
+        const hit = locateOriginal();
+        if (!hit) return {status: 'not_found'};
+        const ctrl = hit.el;
+        if (!hit.isControl) {
+            ctrl.click();
+            return {status: 'clicked_text', text: hit.text.slice(0, 30)};
+        }
+        const checked = ctrl.getAttribute('aria-checked') || String(ctrl.checked);
+        if (checked === 'true') return {status: 'already_checked'};
+        ctrl.click();
+        return {status: 'clicked_control', tag: ctrl.tagName,
+                cls: (ctrl.className || '').toString().slice(0, 60)};
+    };
+
+    // 展开「更多设置」等折叠区域：先查定向候选集，再用原生 XPath 文本匹配兜底
+    fm.expandMoreOptions = () => {
+        const candidates = queryCached(MORE_OPTION_CANDIDATE_SEL);
+        for (const el of candidates) {
+            const txt = el.textContent.trim();
+            if (isMoreOptionLabel(txt) && el.offsetParent !== null) {
+                el.click();
+                return {status: 'expanded', text: txt};
+            }
+        }
+        const snap = document.evaluate(MORE_OPTION_XPATH, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < snap.snapshotLength; i++) {
+            const el = snap.snapshotItem(i);
+            if (el.offsetParent === null) continue;
+            el.click();
+            return {status: 'expanded', text: el.textContent.trim()};
+        }
+        for (const a of candidates) {
+            if (!/arrow|expand|collapse/i.test(a.className || '')) continue;
+            const parent = a.parentElement;
+            if (parent && parent.textContent.includes('设置') && a.offsetParent !== null) {
+                parent.click();
+                return {status: 'expanded', text: 'arrow'};
+            }
+        }
+        return {status: 'not_found'};
+    };
+
+    // 一次滚动到底部（触发懒加载），等下一帧布局完成后再查找原创开关
+    fm.scrollAndFindOriginal = async () => {
+        window.scrollTo(0, document.body.scrollHeight);
+        await nextFrame();
+        return fm.findOriginalToggle();
+    };
+
+    // 发布前准备：清理覆盖层 → 展开折叠区 → 滚动到底 → 查找并勾选原创，一次调用完成
+    fm.finalizePrepare = async (settleMs = 1500) => {
+        const overlays = fm.removeOverlays();
+        const expand = fm.expandMoreOptions();
+        if (expand.status === 'expanded') await sleep(settleMs);
+        const original = await fm.scrollAndFindOriginal();
+        return {status: original.status, overlays, expand, original};
+    };
+
+    // 隐藏 Semi / 抖音 portal 中的模态与预览覆盖层（关闭模态的 JS 兜底）
+    fm.hideModals = () => {
+        document.querySelectorAll('.semi-portal').forEach(el => {
+            if (el.querySelector('[role="modal"], .semi-modal-wrap')) el.style.display = 'none';
+        });
+        document.querySelectorAll('.dy-creator-content-portal').forEach(el => {
+            if (el.querySelector('.dy-creator-content-modal-wrap, [class*="modal"]')) el.style.display = 'none';
+        });
+        document.querySelectorAll('[class*="preview-"]').forEach(el => {
+            if (el.closest('.dy-creator-content-portal')) el.style.display = 'none';
+        });
+        return {status: 'ok'};
+    };
+
+    // 当前可见的封面模态（Semi + 抖音自有模态系统），无则返回 null
+    const COVER_MODAL_SEL =
+        '[role="modal"], .semi-modal-wrap, [class*="semi-modal"], ' +
+        '.dy-creator-content-modal-wrap, [class*="dy-creator-content-modal"]';
+    const visibleCoverModal = () => {
+        for (const el of document.querySelectorAll(COVER_MODAL_SEL)) {
+            if (isVisible(el)) return el;
+        }
+        return null;
+    };
+
+    // 探测 + 关闭封面模态合并为一次调用：取消按钮 → 关闭图标，
+    // 每次点击后在页面内短暂等待并直接观察 DOM。
+    // 页面内派发的 KeyboardEvent 不受信任，模态不会响应，Escape 由 Python 侧用真实按键补发
+    fm.closeAnyCoverModalRetry = async (maxAttempts = 3, delayMs = 300) => {
+        for (let i = 0; i < maxAttempts; i++) {
+            const modal = visibleCoverModal();
+            if (!modal) return {closed: true, attempts: i};
+            const cancel = [...modal.querySelectorAll('button')]
+                .find(b => b.textContent.trim() === '取消' && b.offsetParent !== null);
+            const closeBtn = cancel || modal.querySelector(
+                '.semi-modal-close, [aria-label*="关闭"], [aria-label="Close"], [class*="close-icon"]');
+            if (!closeBtn) return {closed: false, attempts: i};
+            closeBtn.click();
+            await sleep(delayMs);
+        }
+        return {closed: !visibleCoverModal(), attempts: maxAttempts};
+    };
+
+    // 标题兜底：在页面内直接填写第一个可见的文本类 input，只回传布尔值
+    // 通过原生 value setter 赋值，React 受控组件才能感知到 input 事件
+    const nativeValueSetter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    fm.fillFirstTextInput = (value) => {
+        for (const inp of document.querySelectorAll('input')) {
+            if (SKIP_INPUT_TYPES.has(inp.type || 'text')) continue;
+            if (inp.offsetParent === null) continue;
+            inp.focus();
+            nativeValueSetter.call(inp, value);
+            inp.dispatchEvent(new Event('input', {bubbles: true}));
+            inp.dispatchEvent(new Event('change', {bubbles: true}));
+            return true;
+        }
+        return false;
+    };
+
+    // XPath 快照中可见且位置最靠下的节点
+    const lowestVisible = (xpath) => {
+        const snap = document.evaluate(xpath, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        let best = null, bestTop = -Infinity;
+        for (let i = 0; i < snap.snapshotLength; i++) {
+            const n = snap.snapshotItem(i);
+            if (n.offsetParent === null) continue;
+            const top = n.getBoundingClientRect().top;
+            if (top > bestTop) { best = n; bestTop = top; }
+        }
+        return best;
+    };
+    const PUBLISH_EXACT_XPATH = "//button[normalize-space(.)='发布' and not(@disabled)]";
+    const PUBLISH_FUZZY_XPATH =
+        "//button[contains(., '发布') and not(contains(., '定时')) and not(@disabled)]";
+
+    // 定位页面最底部的「发布」按钮：原生 XPath 先精确匹配，再宽松匹配（排除「定时」）
+    fm.findPublishBtn = () => {
+        const best = lowestVisible(PUBLISH_EXACT_XPATH) || lowestVisible(PUBLISH_FUZZY_XPATH);
+        if (!best) return {found: false};
+        const r = best.getBoundingClientRect();
+        return {found: true, x: r.x + r.width / 2, y: r.y + r.height / 2,
+                text: best.textContent.trim().slice(0, 20)};
+    };
+
+    // 滚动到底部后逐帧复查发布按钮，找到即返回（取代固定等待）
+    fm.scrollAndFindPublishBtn = async (timeoutMs = 1500) => {
+        window.scrollTo(0, document.body.scrollHeight);
+        const deadline = Date.now() + timeoutMs;
+        for (;;) {
+            await nextFrame();
+            const res = fm.findPublishBtn();
+            if (res.found || Date.now() >= deadline) return res;
+        }
+    };
+
+    // 页面文字中第一个出现的关键词；用 textContent 而非 innerText，不触发布局计算
+    fm.findKeyword = (kws) => {
+        const text = document.body ? document.body.textContent : '';
+        for (const k of kws) if (text.includes(k)) return k;
+        return null;
+    };
+
+    // 可见按钮文字列表（诊断用）
+    fm.visibleButtons = () => fm.getButtons()
+        .filter(b => b.offsetParent !== null)
+        .map(b => ({text: b.textContent.trim().slice(0, 30)}));
+
+    // 页面概况（失败诊断用）：textContent 长度不触发布局，前 10 个按钮中的可见数
+    fm.pageStats = () => ({
+        textLength: document.body ? document.body.textContent.length : 0,
+        visibleButtons: [...document.querySelectorAll('button')].slice(0, 10)
+            .filter(b => b.offsetParent !== null).length,
+    });
+
+    // 注入一个隐藏的 file input（上传兜底策略）
+    fm.injectFileInput = () => {
+        const input = document.createElement('input');
+        input.type = 'file';
+        input.style.display = 'none';
+        document.body.appendChild(input);
+        return {status: 'ok'};
+    };
+
+    // 发布页元素诊断报告
+    fm.diagnose = () => {
+        const r = {inputs: [], ces: [], buttons: [], files: [],
+                   htmlLength: document.documentElement.outerHTML.length};
+        document.querySelectorAll('input').forEach((el, i) => {
+            const b = el.getBoundingClientRect();
+            r.inputs.push({i, type: el.type, ph: el.placeholder,
+                cls: (el.className || '').slice(0, 60), vis: b.width > 0 && b.height > 0});
+        });
+        document.querySelectorAll('[contenteditable]').forEach((el, i) => {
+            const b = el.getBoundingClientRect();
+            r.ces.push({i, tag: el.tagName, cls: (el.className || '').slice(0, 60),
+                ph: el.getAttribute('placeholder') || '', vis: b.width > 0 && b.height > 0});
+        });
+        document.querySelectorAll('button').forEach((el, i) => {
+            const t = el.textContent.trim().slice(0, 30);
+            if (t) r.buttons.push({i, text: t, disabled: el.disabled});
+        });
+        document.querySelectorAll("input[type='file']").forEach((el, i) => {
+            r.files.push({i, accept: el.accept});
+        });
+        return r;
+    };
+
+    window.__fm = fm;
+})();
+"""
@@ -4,18 +4,21 @@
 核心策略：networkidle + skeleton消失检测 + 轮询选择器 + JS兜底
 """
 
+import re
 import tempfile
 import time
 from pathlib import Path
 from typing import List, Optional
 
 import requests as req
+from playwright.sync_api import Locator, TimeoutError as PlaywrightTimeoutError
 
 from shared.config import get_settings
 from shared.utils.exceptions import DouyinPublishError, DouyinLoginTimeoutError
 from shared.utils.logger import get_logger
 from shared.llm.douyin import DouyinContent
-from shared.publisher_base import BasePublisher, NAV_TIMEOUT, ELEMENT_TIMEOUT
+from shared.publisher_base import BasePublisher, NAV_TIMEOUT, ELEMENT_TIMEOUT, LOGS_DIR
+from douyin.dom_helper import FM_HELPER_JS, FM_HIT_ATTR, FM_MISSING
 
 settings = get_settings()
 
@@ -34,6 +37,84 @@ IMAGE_PUBLISH_URL = ARTICLE_PUBLISH_URL  # 兼容旧引用
 
 COOKIES_FILE = Path(__file__).resolve().parent / "data" / "douyin_cookies.json"
 
+# 视频发布页标题 / 正文编辑区选择器（按优先级）
+_TITLE_SELECTORS = (
+    "input[placeholder*='标题']",
+    "input[placeholder*='作品标题']",
+    "input[placeholder*='填写']",
+    ".el-input__inner",
+    "[class*='title'] input",
+    "[class*='Title'] input",
+    "input[type='text']",
+)
+_BODY_SELECTORS = (
+    ".ProseMirror",
+    ".ql-editor",
+    "[contenteditable='true'][class*='editor']",
+    "[contenteditable='true'][class*='content']",
+    "[contenteditable='true'][class*='desc']",
+    ".el-textarea__inner",
+    "textarea[placeholder*='描述']",
+    "textarea[placeholder*='添加']",
+    "textarea",
+)
+
+# 封面保存按钮文字（与 dom_helper 中的 COVER_SAVE_TEXTS 保持一致）
+_COVER_SAVE_TEXTS = ("保存", "确认", "完成", "确定")
+
+# 发布后页面出现这些文字视为成功
+_PUBLISH_SUCCESS_KEYWORDS = ("发布成功", "已发布", "作品发布成功", "内容管理", "作品管理")
+
+# 下载图片时推断后缀：URL 扩展名 / Content-Type
+_URL_SUFFIX_RE = re.compile(r"\.(png|webp|gif|jpe?g)(?:[?#]|$)", re.I)
+_CONTENT_TYPE_SUFFIX = {
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "image/jpeg": ".jpg",
+}
+
+# 诊断报告的分区（__fm.diagnose 返回的键 → 标签）
+_DIAG_SECTIONS = (
+    ("inputs", "Input"),
+    ("ces", "ContentEditable"),
+    ("buttons", "Button"),
+    ("files", "FileInput"),
+)
+
+# 封面模态（Semi + 抖音自有模态系统）是否可见
+_COVER_MODAL_OPEN_JS = """() => {
+    const modals = document.querySelectorAll(
+        '[role="modal"], .semi-modal-wrap, [class*="semi-modal"], ' +
+        '.dy-creator-content-modal-wrap, [class*="dy-creator-content-modal"]'
+    );
+    for (const el of modals) {
+        const r = el.getBoundingClientRect();
+        if (r.width > 0 && r.height > 0) return true;
+    }
+    return false;
+}"""
+
+# 视频处理完成后出现的编辑表单控件
+_VIDEO_EDITOR_READY_JS = """() => {
+    const els = document.querySelectorAll(
+        "input[placeholder*='标题'], .el-input__inner, input[type='text'], [contenteditable='true']"
+    );
+    for (const el of els) {
+        if (el.offsetParent !== null) return true;
+    }
+    return false;
+}"""
+
+# 发布结果判定：页面跳离 upload/publish，或出现任一成功关键词（瞬时 toast 也能捕获）；
+# 命中时返回信号，供 Python 侧记录日志
+_PUBLISH_DONE_JS = """(kws) => {
+    const url = location.href.toLowerCase();
+    if (!url.includes('upload') && !url.includes('publish')) return {url: location.href};
+    const kw = window.__fm ? window.__fm.findKeyword(kws) : null;
+    return kw ? {keyword: kw} : null;
+}"""
+
 
 
 class DouyinPublisher(BasePublisher):
@@ -41,8 +122,123 @@ class DouyinPublisher(BasePublisher):
 
     USER_DATA_DIR = Path(__file__).resolve().parent / "data" / "browser_profile"
 
-    def __init__(self, headless: bool = False):
-        super().__init__(headless)
+    def __init__(self, headless: bool = False, pool=None):
+        super().__init__(headless, pool=pool)
+        self._pending_shots: List[str] = []
+        # 编辑表单就绪后解析出的标题/正文选择器，页面导航时清空
+        self._form_handles: dict = {}
+
+    def start(self) -> None:
+        """启动浏览器，并注册常驻 DOM 辅助脚本（每次导航自动注入 window.__fm）"""
+        super().start()
+        self._context.add_init_script(FM_HELPER_JS)
+
+    def _fm(self, method: str, *args):
+        """
+        调用常驻辅助脚本 window.__fm 的方法，一次 CDP 往返返回结构化结果。
+        当前文档早于 init script 注册而缺少 window.__fm 时，补注入后重试。
+        """
+        page = self._page
+        expr = (f"(args) => window.__fm ? window.__fm.{method}(...args) "
+                f": '{FM_MISSING}'")
+        result = page.evaluate(expr, list(args))
+        if result == FM_MISSING:
+            page.evaluate(FM_HELPER_JS)
+            result = page.evaluate(expr, list(args))
+        return result
+
+    # ────────── 截图 ──────────
+
+    def _screenshot(self, name: str, defer: bool = False) -> None:
+        """
+        保存诊断截图到 logs 目录（JPEG）。
+        失败 / 未找到元素等现场立即截取；defer=True 的成功路径截图只登记名称，
+        流程结束时丢弃，省去每张数百毫秒的编码与传输。
+        """
+        if defer:
+            self._pending_shots.append(name)
+            return
+        LOGS_DIR.mkdir(exist_ok=True)
+        path = LOGS_DIR / Path(name).with_suffix(".jpg").name
+        try:
+            self._page.screenshot(path=str(path), type="jpeg", quality=60,
+                                  full_page=False, timeout=8000)
+        except Exception:
+            pass
+
+    def _discard_screenshots(self) -> None:
+        """丢弃登记的成功路径截图（事后补截只能拍到当前页面，无法还原当时状态）"""
+        if self._pending_shots:
+            logger.debug("跳过过程截图: %s", ", ".join(self._pending_shots))
+        self._pending_shots.clear()
+
+    def _wait_for_first(self, selectors: List[str],
+                        timeout: int = ELEMENT_TIMEOUT) -> Optional[Locator]:
+        """
+        等待多个选择器中第一个可见元素。
+        整个等待在页面内完成（window.__fm.waitForAnySelector，按 DOM 变更唤醒），
+        每次只需一次 CDP 调用，而非每轮逐个选择器 count()/is_visible()。
+        """
+        start = time.time()
+        try:
+            hit = self._fm("waitForAnySelector", list(selectors), timeout)
+        except Exception as e:
+            # 等待期间页面跳转等导致执行上下文销毁时，用剩余时间回退到逐个轮询
+            logger.debug("页面内等待选择器失败: %s", e)
+            remaining = timeout - int((time.time() - start) * 1000)
+            if remaining <= 0:
+                return None
+            return super()._wait_for_first(selectors, timeout=remaining)
+        if hit:
+            # 按页面内打上的标记定位：选择器的第一个匹配可能是隐藏元素
+            return self._page.locator(f'[{FM_HIT_ATTR}="{hit["tag"]}"]')
+        return None
+
+    def _form_handle(self, key: str) -> Optional[Locator]:
+        """
+        按 resolveFormHandles 打上的标记定位表单元素。
+        标记的是当时可见的那一个元素；其后被重新渲染而不在页面上时返回 None，由调用方重新查找。
+        """
+        tag = self._form_handles.get(key)
+        if not tag:
+            return None
+        loc = self._page.locator(f'[{FM_HIT_ATTR}="{tag}"]')
+        try:
+            return loc if loc.count() > 0 else None
+        except Exception:
+            return None
+
+    def _wait_for(self, predicate_js: str, timeout: float,
+                  initial: float = 0.1, max_interval: float = 2.0) -> bool:
+        """
+        自适应轮询等待 JS 谓词成立（timeout 单位：秒）。
+        轮询间隔从 initial 开始逐次翻倍至 max_interval；
+        一旦 DOM 有变更（window.__fm 版本号变化）即重置为 initial，尽快复查。
+        """
+        page = self._page
+        expr = (f"() => ({{ok: !!({predicate_js})(), "
+                f"v: window.__fm ? window.__fm.domVersion() : -1}})")
+        deadline = time.time() + timeout
+        interval = initial
+        last_version = None
+        while True:
+            version = None
+            try:
+                res = page.evaluate(expr)
+                if res.get("ok"):
+                    return True
+                version = res.get("v")
+            except Exception:
+                pass
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            if version != last_version:
+                interval = initial
+            else:
+                interval = min(interval * 2, max_interval)
+            last_version = version
+            time.sleep(min(interval, remaining))
 
     # ────────── 登录 ──────────
 
@@ -133,7 +329,7 @@ class DouyinPublisher(BasePublisher):
             return
 
         logger.info("检测到封面设置弹窗...")
-        self._screenshot("douyin_cover_dialog.png")
+        self._screenshot("douyin_cover_dialog.png", defer=True)
 
         # 策略 1：选择"横封面"选项（16:9 视频适合横封面）
         for kw in ["横封面", "横版", "16:9"]:
@@ -155,7 +351,7 @@ class DouyinPublisher(BasePublisher):
                     btn.first.click()
                     logger.info("已点击封面弹窗'%s'按钮", btn_text)
                     time.sleep(2)
-                    self._screenshot("douyin_cover_done.png")
+                    self._screenshot("douyin_cover_done.png", defer=True)
                     return
             except Exception:
                 continue
@@ -253,7 +449,7 @@ class DouyinPublisher(BasePublisher):
         # 尝试切换到图文发布模式
         self._switch_to_image_mode()
 
-        self._screenshot("douyin_page_ready.png")
+        self._screenshot("douyin_page_ready.png", defer=True)
 
     def _switch_to_image_mode(self):
         """切换到图文发布模式"""
@@ -316,7 +512,7 @@ class DouyinPublisher(BasePublisher):
             # 1.5. 关闭引导弹窗
             self._dismiss_guide_popups()
 
-            self._screenshot("douyin_page_ready.png")
+            self._screenshot("douyin_page_ready.png", defer=True)
 
             # 2. 填写标题
             title = content.title[:30] if len(content.title) > 30 else content.title
@@ -330,27 +526,30 @@ class DouyinPublisher(BasePublisher):
             if content.image_urls:
                 self._upload_article_cover(content.image_urls[0])
 
-            self._screenshot("douyin_before_publish.png")
+            self._screenshot("douyin_before_publish.png", defer=True)
             time.sleep(2)
 
             # 5. 点击发布
             self._click_publish()
-            time.sleep(5)
 
             # 6. 检查结果
             success = self._check_publish_success()
             if success:
                 logger.info("文章发布成功！")
+                self._discard_screenshots()
             else:
                 logger.warning("发布结果不确定，请手动检查")
                 self._screenshot("douyin_result.png")
+                self._discard_screenshots()
             return success
 
         except DouyinPublishError:
             self._screenshot("douyin_error.png")
+            self._discard_screenshots()
             raise
         except Exception as e:
             self._screenshot("douyin_error.png")
+            self._discard_screenshots()
             raise DouyinPublishError(f"文章发布异常: {e}") from e
 
     # ────────── 文章页等待 ──────────
@@ -642,6 +841,13 @@ class DouyinPublisher(BasePublisher):
 
         time.sleep(2)
 
+        # 一次调用同时标记标题框与正文编辑区，供 _fill_title / _fill_body 直接定位
+        try:
+            self._form_handles = self._fm("resolveFormHandles",
+                                          list(_TITLE_SELECTORS), list(_BODY_SELECTORS)) or {}
+        except Exception:
+            self._form_handles = {}
+
     def _wait_for_upload_done(self):
         """等待图片处理完成"""
         page = self._page
@@ -748,22 +954,18 @@ class DouyinPublisher(BasePublisher):
 
         # 查找并点击「选择封面」按钮
         try:
-            cover_btns = page.get_by_text("选择封面")
-            for i in range(cover_btns.count()):
-                btn = cover_btns.nth(i)
-                if btn.is_visible():
-                    btn.click()
-                    logger.info("已点击「选择封面」按钮")
-                    time.sleep(3)
-
-                    # 等待模态框出现
-                    for _ in range(10):
-                        if self._is_cover_modal_open():
-                            return True
-                        time.sleep(1)
+            # 一次调用取回第一个可见「选择封面」的坐标，替代逐个 nth(i).is_visible()
+            hit = self._fm("pickVisible", ["text=选择封面"])
+            if hit:
+                page.mouse.click(hit["cx"], hit["cy"])
+                logger.info("已点击「选择封面」按钮")
+
+                # 等待模态框出现
+                if self._wait_for(_COVER_MODAL_OPEN_JS, timeout=13):
+                    return True
 
-                    logger.warning("点击「选择封面」后模态框未出现")
-                    return False
+                logger.warning("点击「选择封面」后模态框未出现")
+                return False
         except Exception as e:
             logger.warning("点击「选择封面」失败: %s", e)
 
@@ -771,19 +973,11 @@ class DouyinPublisher(BasePublisher):
 
     def _is_cover_modal_open(self) -> bool:
         """检测封面设置模态框是否打开（同时检测 Semi 和抖音自有模态系统）"""
-        page = self._page
         try:
-            # Semi 设计系统的模态
-            semi_modal = page.locator('[role="modal"], .semi-modal-wrap, [class*="semi-modal"]')
-            if semi_modal.count() > 0 and semi_modal.first.is_visible():
-                return True
-            # 抖音自有模态系统
-            dy_modal = page.locator('.dy-creator-content-modal-wrap, [class*="dy-creator-content-modal"]')
-            if dy_modal.count() > 0 and dy_modal.first.is_visible():
-                return True
+            # 单次 evaluate 完成 Semi + 抖音模态的存在性与可见性检测
+            return bool(self._page.evaluate(_COVER_MODAL_OPEN_JS))
         except Exception:
-            pass
-        return False
+            return False
 
     def _upload_cover_in_modal(self, local_file: str) -> bool:
         """在「设置竖封面」模态框内点击「+上传封面」上传图片"""
@@ -841,6 +1035,10 @@ class DouyinPublisher(BasePublisher):
         """关闭任何打开的模态框（Semi 和抖音自有模态系统）"""
         page = self._page
 
+        # 无模态时直接返回，省去后续多次无效的定位/按键往返
+        if not self._is_cover_modal_open():
+            return
+
         # 先尝试点击「取消」或关闭按钮
         for btn_text in ["取消"]:
             try:
@@ -877,24 +1075,7 @@ class DouyinPublisher(BasePublisher):
 
         # JS 兜底：隐藏所有模态覆盖
         try:
-            page.evaluate("""() => {
-                // 隐藏 Semi portal 模态
-                document.querySelectorAll('.semi-portal').forEach(el => {
-                    const modal = el.querySelector('[role="modal"], .semi-modal-wrap');
-                    if (modal) el.style.display = 'none';
-                });
-                // 隐藏抖音自有模态
-                document.querySelectorAll('.dy-creator-content-portal').forEach(el => {
-                    const modal = el.querySelector('.dy-creator-content-modal-wrap, [class*="modal"]');
-                    if (modal) el.style.display = 'none';
-                });
-                // 隐藏预览覆盖层
-                document.querySelectorAll('[class*="preview-"]').forEach(el => {
-                    if (el.closest('.dy-creator-content-portal')) {
-                        el.style.display = 'none';
-                    }
-                });
-            }""")
+            self._fm("hideModals")
             logger.info("JS 兜底关闭模态")
         except Exception:
             pass
@@ -902,19 +1083,33 @@ class DouyinPublisher(BasePublisher):
     # ────────── 处理封面设置对话框 ──────────
 
     def _dismiss_cover_crop_modal(self):
-        """确保所有封面设置模态框已关闭"""
-        page = self._page
+        """确保所有封面设置模态框已关闭（探测与关闭在页面内一次完成）"""
         logger.info("确保封面模态框已关闭...")
-        time.sleep(1)
+        try:
+            result = self._fm("closeAnyCoverModalRetry", 3, 300)
+        except Exception as e:
+            logger.warning("关闭封面模态框失败: %s", e)
+            return
+
+        if result.get("closed") and result.get("attempts") == 0:
+            logger.info("无封面模态框")
+            return
+        if result.get("closed"):
+            logger.info("封面模态框已关闭 (%d 次尝试)", result.get("attempts"))
+            return
 
-        # 多次尝试关闭
-        for _ in range(3):
+        # 按钮关不掉：补发真实 Escape 按键，仍不行再隐藏模态 portal
+        try:
+            self._page.keyboard.press("Escape")
+            if self._wait_for(f"() => !({_COVER_MODAL_OPEN_JS})()", timeout=1.5):
+                logger.info("封面模态框已关闭 (Escape)")
+                return
+            self._fm("hideModals")
             if not self._is_cover_modal_open():
-                logger.info("无封面模态框")
+                logger.info("JS 兜底隐藏封面模态框")
                 return
-            self._close_any_modal()
-            time.sleep(2)
-
+        except Exception as e:
+            logger.debug("Escape 关闭封面模态框失败: %s", e)
         logger.warning("封面模态框可能仍然存在")
 
     def _click_cover_save_button(self) -> bool:
@@ -922,70 +1117,24 @@ class DouyinPublisher(BasePublisher):
         page = self._page
         logger.info("点击封面保存按钮...")
 
-        # 方法 1: 通过 JS 查找 Semi 和抖音模态框中的红色/主要按钮
+        # 方法 1: 通过常驻脚本查找 Semi 和抖音模态框中的红色/主要按钮
         try:
-            result = page.evaluate("""() => {
-                // 搜索范围：Semi 模态 + 抖音自有模态
-                const modalSelectors = [
-                    '.semi-modal-wrap', '[role="modal"]',
-                    '.dy-creator-content-modal-wrap', '.dy-creator-content-portal'
-                ];
-                for (const sel of modalSelectors) {
-                    const modals = document.querySelectorAll(sel);
-                    for (const modal of modals) {
-                        if (modal.style.display === 'none') continue;
-                        const rect = modal.getBoundingClientRect();
-                        if (rect.width === 0 && rect.height === 0) continue;
-
-                        const buttons = modal.querySelectorAll('button');
-                        let primaryBtn = null;
-
-                        for (const btn of buttons) {
-                            const text = btn.textContent.trim();
-                            const style = window.getComputedStyle(btn);
-                            const bgColor = style.backgroundColor;
-
-                            if (text === '取消' || text === '封面检测') continue;
-                            if (btn.offsetParent === null) continue;
-
-                            // 红色/主色调按钮
-                            if (bgColor.includes('254') || bgColor.includes('255') ||
-                                bgColor.includes('fe2') || bgColor.includes('ff0') ||
-                                btn.classList.toString().match(/primary|danger|confirm/i)) {
-                                primaryBtn = btn;
-                                break;
-                            }
-
-                            if (['保存', '确认', '完成', '确定'].includes(text)) {
-                                primaryBtn = btn;
-                            }
-                        }
-
-                        if (primaryBtn) {
-                            primaryBtn.click();
-                            return {clicked: true, text: primaryBtn.textContent.trim(),
-                                    bg: window.getComputedStyle(primaryBtn).backgroundColor};
-                        }
-                    }
-                }
-                return {clicked: false};
-            }""")
-            if result.get("clicked"):
+            result = self._fm("closeCoverSave")
+            if result.get("status") == "clicked":
                 logger.info("已点击封面保存按钮: %s", result.get("text"))
                 return True
         except Exception as e:
             logger.warning("JS 点击保存按钮失败: %s", e)
 
-        # 方法 2: 通过文本查找按钮
-        for btn_text in ["保存", "确认", "完成", "确定"]:
-            try:
-                btn = page.get_by_role("button", name=btn_text)
-                if btn.count() > 0 and btn.first.is_visible():
-                    btn.first.click(force=True)
-                    logger.info("已点击'%s'按钮", btn_text)
-                    return True
-            except Exception:
-                continue
+        # 方法 2: 通过文本查找按钮（一次调用取回坐标后直接点击）
+        try:
+            hit = self._fm("pickButton", list(_COVER_SAVE_TEXTS))
+            if hit:
+                page.mouse.click(hit["cx"], hit["cy"])
+                logger.info("已点击'%s'按钮", hit["text"])
+                return True
+        except Exception:
+            pass
 
         logger.warning("未找到封面保存按钮")
         return False
@@ -994,41 +1143,22 @@ class DouyinPublisher(BasePublisher):
 
     def _verify_covers(self):
         """验证封面图片是否已成功上传（检查「选择封面」空槽位是否还在）"""
-        page = self._page
         time.sleep(2)
 
         try:
-            # 检查是否仍有空的「选择封面」按钮
-            empty_slots = page.get_by_text("选择封面")
-            empty_count = 0
-            for i in range(empty_slots.count()):
-                try:
-                    if empty_slots.nth(i).is_visible():
-                        empty_count += 1
-                except Exception:
-                    pass
-
+            # 一次调用同时取回空槽位、封面图、缩略图数量
+            cover_info = self._fm("verifyCovers")
+            empty_count = cover_info.get("emptyVisible", 0)
             if empty_count == 0:
                 logger.info("封面验证通过：所有封面槽位已填充")
                 return
 
-            # 仍有空槽位，检查是否有已上传的图片（通过 img 标签或缩略图）
-            cover_info = page.evaluate("""() => {
-                const body = document.body.innerText;
-                const imgs = document.querySelectorAll('img[src*="cover"], img[src*="image"], img[class*="cover"]');
-                const thumbs = document.querySelectorAll('[class*="cover"] img, [class*="thumb"] img');
-                return {
-                    emptySlotTexts: body.match(/选择封面/g)?.length || 0,
-                    coverImgs: imgs.length,
-                    thumbImgs: thumbs.length,
-                };
-            }""")
             logger.info("封面状态: 空槽位=%d, 封面图=%d, 缩略图=%d",
-                         cover_info.get("emptySlotTexts", 0),
+                         empty_count,
                          cover_info.get("coverImgs", 0),
                          cover_info.get("thumbImgs", 0))
 
-            if empty_count > 0 and cover_info.get("coverImgs", 0) == 0 and cover_info.get("thumbImgs", 0) == 0:
+            if cover_info.get("coverImgs", 0) == 0 and cover_info.get("thumbImgs", 0) == 0:
                 logger.warning("封面可能未成功上传！仍有 %d 个空槽位", empty_count)
         except Exception as e:
             logger.warning("封面验证异常: %s", e)
@@ -1037,50 +1167,10 @@ class DouyinPublisher(BasePublisher):
 
     def _remove_overlay_blockers(self):
         """移除可能阻挡交互的覆盖层（模态框残余、预览面板等）"""
-        page = self._page
         try:
-            page.evaluate("""() => {
-                // 移除/隐藏 抖音 portal 中的覆盖层
-                document.querySelectorAll('.dy-creator-content-portal').forEach(el => {
-                    const modal = el.querySelector(
-                        '.dy-creator-content-modal-wrap, [class*="modal-wrap"], [class*="preview-"]'
-                    );
-                    if (modal) {
-                        el.style.display = 'none';
-                        el.style.pointerEvents = 'none';
-                    }
-                });
-
-                // 移除 Semi portal 中的残留模态
-                document.querySelectorAll('.semi-portal').forEach(el => {
-                    const modal = el.querySelector('[role="modal"], .semi-modal-wrap');
-                    if (modal) {
-                        el.style.display = 'none';
-                        el.style.pointerEvents = 'none';
-                    }
-                });
-
-                // 移除 ReactCrop 覆盖
-                document.querySelectorAll('.ReactCrop').forEach(el => {
-                    const portal = el.closest('.semi-portal, .dy-creator-content-portal');
-                    if (portal) {
-                        portal.style.display = 'none';
-                        portal.style.pointerEvents = 'none';
-                    }
-                });
-
-                // 通用：移除带 pointer-events 拦截的大覆盖层
-                document.querySelectorAll('[class*="preview-"], [class*="modal-mask"], [class*="overlay"]').forEach(el => {
-                    const rect = el.getBoundingClientRect();
-                    if (rect.width > 500 && rect.height > 300) {
-                        const portal = el.closest('.dy-creator-content-portal, .semi-portal');
-                        if (portal) {
-                            portal.style.display = 'none';
-                        }
-                    }
-                });
-            }""")
-            logger.info("已清理覆盖层")
+            result = self._fm("removeOverlays")
+            if result.get("hidden"):
+                logger.info("已清理覆盖层 (%d 处)", result["hidden"])
         except Exception as e:
             logger.warning("清理覆盖层失败: %s", e)
 
@@ -1094,16 +1184,25 @@ class DouyinPublisher(BasePublisher):
         # 先确保没有覆盖层阻挡
         self._remove_overlay_blockers()
 
-        title_selectors = [
-            "input[placeholder*='标题']",
-            "input[placeholder*='作品标题']",
-            "input[placeholder*='填写']",
-            ".el-input__inner",
-            "[class*='title'] input",
-            "[class*='Title'] input",
-            "input[type='text']",
-        ]
-        loc = self._wait_for_first(title_selectors, timeout=ELEMENT_TIMEOUT)
+        title_selectors = list(_TITLE_SELECTORS)
+
+        # 编辑表单就绪时已标记出标题框则直接使用，跳过轮询
+        loc = self._form_handle("titleTag")
+
+        if loc is None:
+            # 快速路径：一次调用取回第一个可见标题框的坐标，点击后整体替换文本
+            try:
+                hit = self._fm("pickVisible", title_selectors)
+                if hit:
+                    page.mouse.click(hit["cx"], hit["cy"])
+                    page.keyboard.press("Control+A")
+                    page.keyboard.insert_text(title)
+                    logger.info("标题已填写")
+                    return
+            except Exception as e:
+                logger.debug("标题快速填写失败: %s", e)
+
+            loc = self._wait_for_first(title_selectors, timeout=ELEMENT_TIMEOUT)
         if loc:
             try:
                 loc.first.click()
@@ -1112,6 +1211,7 @@ class DouyinPublisher(BasePublisher):
                 return
             except Exception as e:
                 logger.warning("标题点击被阻挡: %s，尝试强制点击", e)
+                # 覆盖层探测按 DOM 版本缓存，页面无变化时这里只是一次廉价的空操作
                 self._remove_overlay_blockers()
                 try:
                     loc.first.click(force=True)
@@ -1135,20 +1235,7 @@ class DouyinPublisher(BasePublisher):
 
         # JS 兜底
         try:
-            handle = page.evaluate_handle(
-                "() => {"
-                "  for (const inp of document.querySelectorAll('input')) {"
-                "    const t = inp.type || 'text';"
-                "    if (['file','hidden','search','checkbox','radio'].includes(t)) continue;"
-                "    if (inp.offsetParent !== null) return inp;"
-                "  }"
-                "  return null;"
-                "}"
-            )
-            el = handle.as_element()
-            if el:
-                el.click()
-                el.fill(title)
+            if self._fm("fillFirstTextInput", title):
                 logger.info("标题已填写 (JS)")
                 return
         except Exception as e:
@@ -1164,18 +1251,10 @@ class DouyinPublisher(BasePublisher):
         page = self._page
         logger.info("填写正文 (%d 字)", len(text))
 
-        body_selectors = [
-            ".ProseMirror",
-            ".ql-editor",
-            "[contenteditable='true'][class*='editor']",
-            "[contenteditable='true'][class*='content']",
-            "[contenteditable='true'][class*='desc']",
-            ".el-textarea__inner",
-            "textarea[placeholder*='描述']",
-            "textarea[placeholder*='添加']",
-            "textarea",
-        ]
-        loc = self._wait_for_first(body_selectors, timeout=ELEMENT_TIMEOUT)
+        # 编辑表单就绪时已标记出正文编辑区则直接使用，跳过轮询
+        loc = self._form_handle("bodyTag")
+        if loc is None:
+            loc = self._wait_for_first(list(_BODY_SELECTORS), timeout=ELEMENT_TIMEOUT)
         if loc:
             loc.first.click()
             loc.first.fill(text)
@@ -1207,52 +1286,15 @@ class DouyinPublisher(BasePublisher):
 
         try:
             page.keyboard.press("Escape")
-            time.sleep(0.5)
         except Exception:
             pass
 
-        self._screenshot("douyin_before_click_publish.png")
+        # 成功路径截图只登记（见 _screenshot），不占用发布前的等待时间
+        self._screenshot("douyin_before_click_publish.png", defer=True)
 
-        # 滚动到底部确保发布按钮可见
+        # 策略 1：滚动到底部并在页面内等待"发布"按钮就绪（页面最底部的那个），一次调用完成
         try:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(1)
-        except Exception:
-            pass
-
-        # 策略 1：JS 精确匹配"发布"按钮（页面最底部的那个）
-        try:
-            result = page.evaluate("""() => {
-                const btns = [...document.querySelectorAll('button')];
-                // 精确匹配：文字恰好是"发布"
-                const exact = btns.filter(b => {
-                    const txt = b.textContent.trim();
-                    return txt === '发布' && b.offsetParent !== null && !b.disabled;
-                });
-                // 取 y 坐标最大的（页面最底部的发布按钮）
-                if (exact.length > 0) {
-                    const best = exact.reduce((a, b) =>
-                        a.getBoundingClientRect().top > b.getBoundingClientRect().top ? a : b
-                    );
-                    const r = best.getBoundingClientRect();
-                    return {found: true, x: r.x + r.width/2, y: r.y + r.height/2, text: '发布'};
-                }
-                // 宽松匹配：文字包含"发布"但不含"定时"
-                const fuzzy = btns.filter(b => {
-                    const txt = b.textContent.trim();
-                    return txt.includes('发布') && !txt.includes('定时')
-                        && b.offsetParent !== null && !b.disabled;
-                });
-                if (fuzzy.length > 0) {
-                    const best = fuzzy.reduce((a, b) =>
-                        a.getBoundingClientRect().top > b.getBoundingClientRect().top ? a : b
-                    );
-                    const r = best.getBoundingClientRect();
-                    return {found: true, x: r.x + r.width/2, y: r.y + r.height/2,
-                            text: best.textContent.trim().slice(0, 20)};
-                }
-                return {found: false};
-            }""")
+            result = self._fm("scrollAndFindPublishBtn", 1500)
             if result.get("found"):
                 page.mouse.click(result["x"], result["y"])
                 logger.info("已点击 '%s' 按钮", result.get("text", "发布"))
@@ -1262,31 +1304,23 @@ class DouyinPublisher(BasePublisher):
         except Exception as e:
             logger.debug("JS 精确定位发布按钮失败: %s", e)
 
-        # 策略 2：Playwright role 定位
-        for btn_text in ["发布", "发布作品"]:
-            try:
-                loc = page.get_by_role("button", name=btn_text, exact=True)
-                if loc.count() > 0:
-                    target = loc.last
-                    if target.is_visible():
-                        target.scroll_into_view_if_needed()
-                        time.sleep(0.5)
-                        target.click(force=True)
-                        logger.info("已点击 '%s' 按钮 (Playwright role)", btn_text)
-                        time.sleep(3)
-                        self._handle_publish_dialog()
-                        return
-            except Exception:
-                continue
+        # 策略 2：按钮文字精确匹配（取最后一个），一次调用取回坐标
+        try:
+            hit = self._fm("pickButton", ["发布", "发布作品"], True, True)
+            if hit:
+                time.sleep(0.5)
+                page.mouse.click(hit["cx"], hit["cy"])
+                logger.info("已点击 '%s' 按钮 (文字匹配)", hit["text"])
+                time.sleep(3)
+                self._handle_publish_dialog()
+                return
+        except Exception as e:
+            logger.debug("文字匹配发布按钮失败: %s", e)
 
         # 诊断并报错
         self._screenshot("douyin_btn_not_found.png")
         try:
-            diag = page.evaluate("""() => {
-                return [...document.querySelectorAll('button')].filter(b =>
-                    b.offsetParent !== null && b.textContent.trim()
-                ).map(b => ({text: b.textContent.trim().slice(0, 30)}));
-            }""")
+            diag = self._fm("visibleButtons")
             logger.warning("页面按钮列表: %s", diag)
         except Exception:
             pass
@@ -1304,44 +1338,43 @@ class DouyinPublisher(BasePublisher):
             "text=确定",
             "text=立即发布",
         ]
-        for sel in dialog_btns:
-            try:
-                loc = page.locator(sel)
-                if loc.count() > 0 and loc.first.is_visible():
-                    loc.first.click()
-                    logger.info("已确认对话框: %s", sel)
-                    time.sleep(2)
-                    return
-            except Exception:
-                continue
+        try:
+            hit = self._fm("pickVisible", dialog_btns)
+            if hit:
+                page.mouse.click(hit["cx"], hit["cy"])
+                logger.info("已确认对话框: %s", dialog_btns[hit["index"]])
+                time.sleep(2)
+        except Exception:
+            pass
 
     # ────────── 检查结果 ──────────
 
-    def _check_publish_success(self) -> bool:
-        """多策略检测发布是否成功"""
+    def _check_publish_success(self, timeout: int = 15000) -> bool:
+        """多策略检测发布是否成功：页面跳转与成功关键词任一出现即结束等待"""
         page = self._page
 
-        for wait_sec in (2, 3, 5):
-            time.sleep(wait_sec)
+        # 单一谓词同时覆盖 URL 跳转与关键词：“发布成功” toast 只短暂显示，
+        # 必须在等待期间持续检测，不能等跳转超时后才查一次
+        try:
+            handle = page.wait_for_function(
+                _PUBLISH_DONE_JS, arg=list(_PUBLISH_SUCCESS_KEYWORDS),
+                polling=500, timeout=timeout)
+            signal = handle.json_value() or {}
+            if signal.get("keyword"):
+                logger.info("发布成功（检测到: %s）", signal["keyword"])
+            else:
+                logger.info("发布成功（页面已跳转: %s）", signal.get("url") or page.url)
+            return True
+        except PlaywrightTimeoutError:
+            pass
+        except Exception as e:
+            # 跳转瞬间执行上下文可能被销毁，此时以当前 URL 为准
+            logger.debug("等待发布结果异常: %s", e)
             url = page.url.lower()
-
             if "upload" not in url and "publish" not in url:
                 logger.info("发布成功（页面已跳转: %s）", page.url)
                 return True
 
-            try:
-                body_text = page.evaluate("document.body.innerText")
-                success_keywords = [
-                    "发布成功", "已发布", "作品发布成功",
-                    "内容管理", "作品管理",
-                ]
-                for keyword in success_keywords:
-                    if keyword in body_text:
-                        logger.info("发布成功（检测到: %s）", keyword)
-                        return True
-            except Exception:
-                pass
-
         self._screenshot("douyin_publish_uncertain.png")
         return False
 
@@ -1362,6 +1395,7 @@ class DouyinPublisher(BasePublisher):
             # 1. 打开上传页（默认是视频上传）
             logger.info("打开上传页面...")
             page.goto(PUBLISH_URL, wait_until="commit")
+            self._form_handles = {}
             self._wait_for_video_page()
 
             # 1.5. 关闭引导弹窗
@@ -1395,27 +1429,30 @@ class DouyinPublisher(BasePublisher):
             # 6. 声明原创
             self._declare_original()
 
-            self._screenshot("douyin_video_before_publish.png")
+            self._screenshot("douyin_video_before_publish.png", defer=True)
             time.sleep(2)
 
             # 7. 点击发布
             self._click_publish()
-            time.sleep(5)
 
             # 7. 检查结果
             success = self._check_publish_success()
             if success:
                 logger.info("视频发布成功！")
+                self._discard_screenshots()
             else:
                 logger.warning("视频发布结果不确定，请手动检查")
                 self._screenshot("douyin_video_result.png")
+                self._discard_screenshots()
             return success
 
         except DouyinPublishError:
             self._screenshot("douyin_video_error.png")
+            self._discard_screenshots()
             raise
         except Exception as e:
             self._screenshot("douyin_video_error.png")
+            self._discard_screenshots()
             raise DouyinPublishError(f"视频发布异常: {e}") from e
 
     def _declare_original(self):
@@ -1423,66 +1460,25 @@ class DouyinPublisher(BasePublisher):
         page = self._page
         logger.info("尝试勾选原创声明...")
 
-        # Step 0: 展开"更多设置"（抖音视频页的原创通常在折叠区域内）
-        self._expand_more_options()
-
-        # Step 1: 充分滚动让所有选项可见
-        for scroll_y in [300, 600, 900, 1200, 1600]:
-            try:
-                page.evaluate(f"window.scrollTo(0, {scroll_y})")
-                time.sleep(0.3)
-            except Exception:
-                pass
-
-        # Step 2: JS 全页面深度搜索"原创"并点击对应控件
+        # 一次调用完成 清理覆盖层 → 展开"更多设置" → 滚动到底 → 深度搜索"原创"并点击控件
         try:
-            result = page.evaluate("""() => {
-                const walker = document.createTreeWalker(
-                    document.body, NodeFilter.SHOW_TEXT, null, false
-                );
-                while (walker.nextNode()) {
-                    const text = walker.currentNode.textContent.trim();
-                    if (!text.includes('原创')) continue;
-                    if (text.length > 50) continue;
-                    const el = walker.currentNode.parentElement;
-                    if (!el || el.offsetParent === null) continue;
-
-                    let cur = el;
-                    for (let depth = 0; depth < 6 && cur && cur !== document.body; depth++) {
-                        const controls = cur.querySelectorAll(
-                            'input[type="checkbox"], input[type="radio"], [role="switch"], [role="checkbox"], ' +
-                            '[class*="switch"], [class*="Switch"], [class*="toggle"], [class*="Toggle"], ' +
-                            '[class*="check"], [class*="Check"], [class*="semi-switch"], [class*="Semi"]'
-                        );
-                        for (const ctrl of controls) {
-                            const rect = ctrl.getBoundingClientRect();
-                            if (rect.width === 0 || rect.height === 0) continue;
-                            const checked = ctrl.getAttribute('aria-checked') || String(ctrl.checked);
-                            if (checked === 'true') return {status: 'already_checked'};
-                            ctrl.click();
-                            return {status: 'clicked_control', tag: ctrl.tagName,
-                                    cls: (ctrl.className||'').toString().slice(0,60)};
-                        }
-                        cur = cur.parentElement;
-                    }
-                    el.click();
-                    return {status: 'clicked_text', text: text.slice(0, 30)};
-                }
-                return {status: 'not_found'};
-            }""")
-            status = result.get('status', 'not_found')
+            result = self._fm("finalizePrepare")
+            expand = result.get("expand", {})
+            if expand.get("status") == "expanded":
+                logger.info("已展开: %s", expand.get("text"))
+            status = result.get("status", "not_found")
             if status == 'already_checked':
                 logger.info("原创已勾选")
                 return
             elif status in ('clicked_control', 'clicked_text'):
                 logger.info("已勾选原创声明 (JS: %s)", status)
                 time.sleep(1)
-                self._screenshot("dy_original_clicked.png")
+                self._screenshot("dy_original_clicked.png", defer=True)
                 return
         except Exception as e:
             logger.warning("JS 原创搜索失败: %s", e)
 
-        # Step 3: CSS 兜底
+        # CSS 兜底
         for sel in ['[class*="original"]', '[class*="yuanchuang"]',
                     'label:has-text("原创")', '[class*="Original"]']:
             try:
@@ -1500,41 +1496,11 @@ class DouyinPublisher(BasePublisher):
 
     def _expand_more_options(self):
         """展开'更多设置'/'更多选项'等折叠区域（抖音视频页关键步骤）"""
-        page = self._page
-        # 抖音的"更多设置"按钮
-        for txt in ["更多设置", "更多选项", "高级设置", "展开更多", "更多配置"]:
-            try:
-                loc = page.get_by_text(txt, exact=False)
-                if loc.count() > 0 and loc.first.is_visible():
-                    loc.first.click()
-                    logger.info("已展开: %s", txt)
-                    time.sleep(2)
-                    return
-            except Exception:
-                continue
-        # JS 兜底：查找可折叠区域
         try:
-            page.evaluate("""() => {
-                const all = document.querySelectorAll('*');
-                for (const el of all) {
-                    const txt = el.textContent.trim();
-                    if (el.children.length > 3) continue;
-                    if (['更多设置','更多选项','高级设置','展开更多'].includes(txt)) {
-                        if (el.offsetParent !== null) { el.click(); return true; }
-                    }
-                }
-                // 查找带有展开/折叠图标的区域
-                const arrows = document.querySelectorAll('[class*="arrow"], [class*="Arrow"], [class*="expand"], [class*="Expand"], [class*="collapse"]');
-                for (const a of arrows) {
-                    const parent = a.parentElement;
-                    if (parent && parent.textContent.includes('设置') && a.offsetParent !== null) {
-                        parent.click();
-                        return true;
-                    }
-                }
-                return false;
-            }""")
-            time.sleep(2)
+            result = self._fm("expandMoreOptions")
+            if result.get("status") == "expanded":
+                logger.info("已展开: %s", result.get("text"))
+                time.sleep(2)
         except Exception:
             pass
 
@@ -1543,11 +1509,15 @@ class DouyinPublisher(BasePublisher):
         page = self._page
         logger.info("等待视频上传页加载...")
 
+        # 直接等待真正的前置条件（文件输入框），不等 networkidle：
+        # 创作者中心持续轮询统计接口，networkidle 往往要拖十几秒
         try:
-            page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+            page.wait_for_selector("input[type='file']", state="attached", timeout=NAV_TIMEOUT)
+            logger.info("上传区域已就绪")
         except Exception:
-            pass
+            logger.warning("上传控件未找到")
 
+        # 文件输入框已挂载，骨架屏检查只做短等待；仍未消失时再补 2 秒
         try:
             page.wait_for_function(
                 "() => {"
@@ -1556,17 +1526,10 @@ class DouyinPublisher(BasePublisher):
                 "  );"
                 "  return s.length === 0 || [...s].every(e => e.offsetParent === null);"
                 "}",
-                timeout=30000,
+                timeout=5000,
             )
         except Exception:
-            pass
-
-        time.sleep(2)
-        try:
-            page.wait_for_selector("input[type='file']", state="attached", timeout=30000)
-            logger.info("上传区域已就绪")
-        except Exception:
-            logger.warning("上传控件未找到")
+            time.sleep(2)
 
     def _upload_video(self, video_path: str):
         """上传视频文件"""
@@ -1623,12 +1586,7 @@ class DouyinPublisher(BasePublisher):
         # 策略 3: 找到拖拽区域通过 JS 注入 file input
         try:
             logger.info("尝试策略3: 注入文件输入框...")
-            page.evaluate("""(videoPath) => {
-                const input = document.createElement('input');
-                input.type = 'file';
-                input.style.display = 'none';
-                document.body.appendChild(input);
-            }""", video_path)
+            self._fm("injectFileInput")
             # 找到新注入的 input
             all_inputs = page.locator("input[type='file']")
             if all_inputs.count() > 0:
@@ -1642,11 +1600,9 @@ class DouyinPublisher(BasePublisher):
         self._screenshot("douyin_upload_failed.png")
         # 记录页面状态
         try:
-            logger.debug("页面文本长度: %d 字符", len(page.inner_text("body")))
-            all_btns = page.locator("button")
-            visible_count = sum(1 for i in range(min(all_btns.count(), 10)) 
-                               if all_btns.nth(i).is_visible())
-            logger.debug("页面上可见按钮数量: %d", visible_count)
+            stats = self._fm("pageStats")
+            logger.debug("页面文本长度: %d 字符", stats.get("textLength", 0))
+            logger.debug("页面上可见按钮数量: %d", stats.get("visibleButtons", 0))
         except Exception:
             pass
 
@@ -1654,29 +1610,18 @@ class DouyinPublisher(BasePublisher):
 
     def _wait_for_video_processed(self):
         """等待视频上传和处理完成"""
-        page = self._page
         logger.info("等待视频处理（最长 3 分钟）...")
 
         start = time.time()
         max_wait = 180
 
         while time.time() - start < max_wait:
-            elapsed = int(time.time() - start)
-
-            for sel in ["input[placeholder*='标题']", ".el-input__inner",
-                        "input[type='text']", "[contenteditable='true']"]:
-                try:
-                    loc = page.locator(sel)
-                    if loc.count() > 0 and loc.first.is_visible():
-                        logger.info("视频处理完成 (%ds)", elapsed)
-                        return
-                except Exception:
-                    pass
-
-            if elapsed % 15 == 0 and elapsed > 0:
-                logger.info("视频处理中... (%ds/%ds)", elapsed, max_wait)
-
-            time.sleep(3)
+            # 每 15 秒一段自适应等待，段间输出进度
+            if self._wait_for(_VIDEO_EDITOR_READY_JS,
+                              timeout=min(15, max_wait - (time.time() - start))):
+                logger.info("视频处理完成 (%ds)", int(time.time() - start))
+                return
+            logger.info("视频处理中... (%ds/%ds)", int(time.time() - start), max_wait)
 
         logger.warning("视频处理等待超时 (%ds)", max_wait)
 
@@ -1688,66 +1633,38 @@ class DouyinPublisher(BasePublisher):
         page.goto(IMAGE_PUBLISH_URL, wait_until="commit")
         self._wait_for_publish_page()
 
-        print("\n" + "=" * 60)
-        print("  抖音创作者发布页诊断报告")
-        print("=" * 60)
-        print(f"  URL: {page.url}")
-        print(f"  HTML: {len(page.content()):,} 字符")
-
-        report = page.evaluate(
-            "() => {"
-            "  const r = {inputs:[], ces:[], buttons:[], files:[]};"
-            "  document.querySelectorAll('input').forEach((el,i) => {"
-            "    const b = el.getBoundingClientRect();"
-            "    r.inputs.push({i, type:el.type, ph:el.placeholder,"
-            "      cls:(el.className||'').slice(0,60), vis:b.width>0&&b.height>0});"
-            "  });"
-            "  document.querySelectorAll('[contenteditable]').forEach((el,i) => {"
-            "    const b = el.getBoundingClientRect();"
-            "    r.ces.push({i, tag:el.tagName, cls:(el.className||'').slice(0,60),"
-            "      ph:el.getAttribute('placeholder')||'', vis:b.width>0&&b.height>0});"
-            "  });"
-            "  document.querySelectorAll('button').forEach((el,i) => {"
-            "    const t = el.textContent.trim().slice(0,30);"
-            "    if(t) r.buttons.push({i, text:t, disabled:el.disabled});"
-            "  });"
-            "  document.querySelectorAll(\"input[type='file']\").forEach((el,i) => {"
-            "    r.files.push({i, accept:el.accept});"
-            "  });"
-            "  return r;"
-            "}"
-        )
-
-        for key, label in [("inputs", "Input"), ("ces", "ContentEditable"),
-                           ("buttons", "Button"), ("files", "FileInput")]:
+        # 一次页面内调用拿到全部诊断数据（含 HTML 长度，无需回传整页 page.content()）
+        report = self._fm("diagnose")
+
+        lines = ["", "=" * 60, "  抖音创作者发布页诊断报告", "=" * 60,
+                 f"  URL: {page.url}",
+                 f"  HTML: {report.get('htmlLength', 0):,} 字符"]
+        for key, label in _DIAG_SECTIONS:
             items = report.get(key, [])
-            print(f"\n  [{label}] ({len(items)} 个)")
-            for item in items:
-                print(f"    {item}")
+            lines.append(f"\n  [{label}] ({len(items)} 个)")
+            lines.extend(f"    {item}" for item in items)
+        print("\n".join(lines))
 
         self._screenshot("douyin_diagnose.png")
-        print(f"\n  截图已保存: logs/douyin_diagnose.png")
+        print(f"\n  截图已保存: logs/douyin_diagnose.jpg")
         print("=" * 60)
 
     # ────────── 工具 ──────────
 
     @staticmethod
     def _guess_suffix(url: str, content_type: str) -> str:
-        low = url.lower()
-        if "png" in low or "png" in content_type:
-            return ".png"
-        if "webp" in low or "webp" in content_type:
-            return ".webp"
-        if "gif" in low:
-            return ".gif"
-        return ".jpg"
+        """先看 URL 扩展名（单次正则），再按 Content-Type 查表，默认 .jpg"""
+        m = _URL_SUFFIX_RE.search(url)
+        if m:
+            return "." + m.group(1).lower().replace("jpeg", "jpg")
+        return _CONTENT_TYPE_SUFFIX.get(content_type.split(";", 1)[0].strip().lower(), ".jpg")
 
 
 # ────────── 便捷函数 ──────────
 
-def publish_douyin_note(content: DouyinContent, headless: bool = False) -> bool:
-    """一键发布抖音图文笔记"""
-    with DouyinPublisher(headless=headless) as pub:
+def publish_douyin_note(content: DouyinContent, headless: bool = False, pool=None) -> bool:
+    """一键发布抖音图文笔记（pool: 可选的共享浏览器池）"""
+    with DouyinPublisher(headless=headless, pool=pool) as pub:
         pub.login()
         time.sleep(settings.douyin_publish_delay)
         return pub.publish(content)
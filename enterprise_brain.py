@@ -16,36 +16,68 @@
   python enterprise_brain.py --dry-run              # 仅生成本地预览
   python enterprise_brain.py --all --video          # 带视频嵌入
   python enterprise_brain.py --all --headless       # 无头模式发布
+  python enterprise_brain.py --all --parallel       # 各平台同时发布（每个平台一个浏览器进程）
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import atexit
+import importlib
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from shared.config import get_settings
+from shared.llm.cache import CachingLLMClient
 from shared.llm.client import LLMClient
-from shared.llm.xhs import XHSContentGenerator
-from shared.llm.douyin import DouyinContentGenerator
-from shared.llm.toutiao import ToutiaoContentGenerator
-from shared.llm.zhihu import ZhihuContentGenerator
-from shared.llm.channels import ChannelsContentGenerator
-from shared.llm.weibo import WeiboContentGenerator
-from shared.media.image import ImageGenerator
-from shared.media.video import VideoGenerator
-from shared.utils.helpers import save_json, split_csv
+from shared.utils.helpers import image_seed, load_json, save_json, split_csv, to_vertical_prompt
 from shared.utils.logger import get_logger
-from shared.wp.client import WordPressClient
-from wordpress.pipeline import WPPublisher
 
 logger = get_logger("enterprise-brain")
 
+# 重量级模块按需加载（PEP 562）：--help 以及发布子进程的启动不再导入
+# 火山引擎 SDK / 视频 / WordPress 流水线 / 各平台生成器
+_LAZY_IMPORTS = {
+    "XHSContentGenerator": ("shared.llm.xhs", "XHSContentGenerator"),
+    "DouyinContentGenerator": ("shared.llm.douyin", "DouyinContentGenerator"),
+    "ToutiaoContentGenerator": ("shared.llm.toutiao", "ToutiaoContentGenerator"),
+    "ZhihuContentGenerator": ("shared.llm.zhihu", "ZhihuContentGenerator"),
+    "ChannelsContentGenerator": ("shared.llm.channels", "ChannelsContentGenerator"),
+    "WeiboContentGenerator": ("shared.llm.weibo", "WeiboContentGenerator"),
+    "ArticleGenerator": ("shared.llm.article", "ArticleGenerator"),
+    "ImageGenerator": ("shared.media.image", "ImageGenerator"),
+    "VideoGenerator": ("shared.media.video", "VideoGenerator"),
+    "WordPressClient": ("shared.wp.client", "WordPressClient"),
+    "WPPublisher": ("wordpress.pipeline", "WPPublisher"),
+}
+
+
+def _lazy(name: str):
+    """解析延迟导入的名称，首次解析后写回模块全局"""
+    module, attr = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# 收集配图时识别的图片扩展名
+_IMG_EXTS = frozenset({"png", "jpg", "jpeg", "webp"})
+
 # Windows 控制台编码兼容
 if hasattr(sys.stdout, "reconfigure"):
     sys.stdout.reconfigure(errors="replace")
@@ -106,37 +138,78 @@ CATEGORIES = "AI,企业数字化"
 TAGS = "企业大脑,私有化部署,大模型,DeepSeek,RAG,数据安全,企业AI"
 
 
+# ══════════════════════════════════════════════════════════════
+#  控制台输出
+# ══════════════════════════════════════════════════════════════
+
+_SEP = "=" * 60
+
+
+def _banner(title: str) -> list:
+    return [f"\n{_SEP}", f"  {title}", _SEP]
+
+
+def _print_lines(lines) -> None:
+    """整块拼接后一次写出（Windows 控制台逐行 print 很慢）"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 # ══════════════════════════════════════════════════════════════
 #  工厂函数
 # ══════════════════════════════════════════════════════════════
 
-def _make_llm(settings) -> LLMClient:
-    return LLMClient(
+# 各客户端在整个进程内只构造一次：Step 1 / Step 2 共用同一个 HTTP 连接池，
+# 避免重复的 TLS 握手；get_settings() 为单例，无需作为缓存键
+
+@lru_cache(maxsize=1)
+def _make_llm() -> LLMClient:
+    settings = get_settings()
+    kwargs = dict(
         api_key=settings.deepseek_api_key,
         base_url=settings.deepseek_base_url,
         model=settings.deepseek_model,
         timeout=settings.request_timeout,
     )
+    if settings.llm_cache_enabled:
+        # 同一主题反复运行时，相同提示词直接复用本地缓存的回复
+        llm = CachingLLMClient(
+            **kwargs,
+            cache_path=Path(settings.output_dir) / "llm_cache.sqlite",
+            ttl=settings.llm_cache_ttl,
+        )
+    else:
+        llm = LLMClient(**kwargs)
+    atexit.register(llm.close)
+    return llm
 
 
-def _make_wp(settings) -> WordPressClient:
-    return WordPressClient(
+@lru_cache(maxsize=1)
+def _make_wp() -> WordPressClient:
+    settings = get_settings()
+    wp = _lazy("WordPressClient")(
         wp_base=settings.wp_base,
         wp_user=settings.wp_user,
         wp_app_password=settings.wp_app_password,
         timeout=settings.request_timeout,
     )
+    atexit.register(wp.close)
+    return wp
 
 
-def _make_image_gen(settings) -> ImageGenerator:
-    return ImageGenerator(volc_ak=settings.volc_ak, volc_sk=settings.volc_sk)
+@lru_cache(maxsize=1)
+def _make_image_gen() -> ImageGenerator:
+    settings = get_settings()
+    return _lazy("ImageGenerator")(volc_ak=settings.volc_ak, volc_sk=settings.volc_sk)
 
 
-def _make_video_gen(settings, llm: LLMClient) -> VideoGenerator:
-    return VideoGenerator(
+@lru_cache(maxsize=1)
+def _make_video_gen() -> VideoGenerator:
+    settings = get_settings()
+    return _lazy("VideoGenerator")(
         volc_ak=settings.volc_ak,
         volc_sk=settings.volc_sk,
-        llm=llm,
+        llm=_make_llm(),
         volc_host=settings.volc_host,
         volc_service=settings.volc_service,
         volc_region=settings.volc_region,
@@ -149,18 +222,15 @@ def _make_video_gen(settings, llm: LLMClient) -> VideoGenerator:
 
 def publish_to_wordpress(args, settings) -> dict:
     """生成文章并发布到 WordPress"""
-    sep = "=" * 60
-    print(f"\n{sep}")
-    print("  Step 1: 生成文章 & 发布到 WordPress")
-    print(sep)
+    _print_lines(_banner("Step 1: 生成文章 & 发布到 WordPress"))
 
     t_start = time.monotonic()
-    llm = _make_llm(settings)
-    wp = _make_wp(settings)
-    image_gen = _make_image_gen(settings)
-    video_gen = _make_video_gen(settings, llm) if args.video else None
+    llm = _make_llm()
+    wp = _make_wp()
+    image_gen = _make_image_gen()
+    video_gen = _make_video_gen() if args.video else None
 
-    publisher = WPPublisher(
+    publisher = _lazy("WPPublisher")(
         wp_client=wp,
         llm=llm,
         image_gen=image_gen,
@@ -188,15 +258,13 @@ def publish_to_wordpress(args, settings) -> dict:
         )
 
     result["elapsed"] = time.monotonic() - t_start
-    llm.close()
 
     _print_wp_report(result)
     return result
 
 
 def _print_wp_report(result: dict):
-    sep = "=" * 60
-    lines = [f"\n{sep}", "  WordPress 发布结果", sep]
+    lines = _banner("WordPress 发布结果")
     if result.get("dry_run"):
         lines.append(f"  模式:       dry-run")
         lines.append(f"  本地预览:   {result.get('preview_file', '-')}")
@@ -213,7 +281,7 @@ def _print_wp_report(result: dict):
     quality = result.get("quality", {})
     if quality:
         lines.append(f"  质量评分:   {quality.get('score')}")
-    lines.append(sep)
+    lines.append(_SEP)
     logger.info("\n".join(lines))
 
 
@@ -230,35 +298,42 @@ def publish_to_all_platforms(wp_result: dict, args, settings):
         return
 
     article_file = asset_dir / "article.json"
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json(article_file)
 
     # 收集图片
     image_dir = asset_dir / "images"
     image_paths = []
     if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+        # 单次 scandir + 扩展名集合判断，替代按扩展名多次 glob
+        with os.scandir(image_dir) as it:
+            image_paths = sorted(
+                entry.path for entry in it
+                if entry.is_file() and entry.name.rsplit(".", 1)[-1].lower() in _IMG_EXTS
+            )[:9]
 
     # 为竖版平台（小红书/抖音/视频号）生成 3:4 图片
     vertical_image_paths = []
     try:
-        from shared.llm.article import ArticleGenerator as _AG
         v_image_dir = asset_dir / "images_vertical"
         v_image_dir.mkdir(parents=True, exist_ok=True)
         if settings.volc_ak and settings.volc_sk:
-            img_gen = ImageGenerator(settings.volc_ak, settings.volc_sk)
-            _art_gen = _AG(llm=None, max_content_images=settings.max_content_images)
+            img_gen = _make_image_gen()
+            _art_gen = _lazy("ArticleGenerator")(llm=None, max_content_images=settings.max_content_images)
             v_specs = _art_gen.image_prompts(article)
-            base_seed = sum(ord(c) for c in slug) % 2147483647
+            base_seed = image_seed(slug)
             logger.info("生成竖版配图（3:4, 1080x1440, seed=%d）...", base_seed)
-            for i, spec in enumerate(v_specs):
+
+            def _gen_vertical(item):
+                i, spec = item
                 vp = v_image_dir / f"{spec['role']}_{i:02d}.png"
-                v_prompt = spec["prompt"].replace("16:9", "3:4 vertical portrait").replace("Wide ", "Vertical portrait ")
-                gen_path = img_gen.generate(v_prompt, vp, width=1080, height=1440, seed=base_seed + i)
-                if gen_path:
-                    vertical_image_paths.append(str(gen_path))
+                return img_gen.generate(to_vertical_prompt(spec["prompt"]), vp, width=1080, height=1440, seed=base_seed + i)
+
+            # 每张图都是独立的远程生成请求，并发发出；map 保持原有顺序
+            if v_specs:
+                with ThreadPoolExecutor(max_workers=min(len(v_specs), 4)) as pool:
+                    for gen_path in pool.map(_gen_vertical, enumerate(v_specs)):
+                        if gen_path:
+                            vertical_image_paths.append(str(gen_path))
             logger.info("竖版配图生成完成: %d 张", len(vertical_image_paths))
     except Exception as e:
         logger.warning("竖版配图生成失败，使用横版图片: %s", e)
@@ -266,37 +341,45 @@ def publish_to_all_platforms(wp_result: dict, args, settings):
     v_images = vertical_image_paths if vertical_image_paths else image_paths
 
     # 生成各平台文案
-    sep = "=" * 60
-    print(f"\n{sep}")
-    print("  Step 2: 生成各平台文案")
-    print(sep)
+    _print_lines(_banner("Step 2: 生成各平台文案"))
 
-    llm = _make_llm(settings)
+    llm = _make_llm()
     platform_contents = {}
 
     generators = [
-        ("小红书", "xhs", XHSContentGenerator, v_images, "xhs_content.json"),
-        ("抖音", "douyin", DouyinContentGenerator, v_images, "dy_content.json"),
-        ("头条", "toutiao", ToutiaoContentGenerator, image_paths, "toutiao_content.json"),
-        ("知乎", "zhihu", ZhihuContentGenerator, image_paths, "zh_content.json"),
-        ("视频号", "channels", ChannelsContentGenerator, v_images, "channels_content.json"),
-        ("微博", "weibo", WeiboContentGenerator, image_paths, "wb_content.json"),
+        ("小红书", "xhs", "XHSContentGenerator", v_images, "xhs_content.json"),
+        ("抖音", "douyin", "DouyinContentGenerator", v_images, "dy_content.json"),
+        ("头条", "toutiao", "ToutiaoContentGenerator", image_paths, "toutiao_content.json"),
+        ("知乎", "zhihu", "ZhihuContentGenerator", image_paths, "zh_content.json"),
+        ("视频号", "channels", "ChannelsContentGenerator", v_images, "channels_content.json"),
+        ("微博", "weibo", "WeiboContentGenerator", image_paths, "wb_content.json"),
     ]
 
-    for name, key, gen_class, imgs, filename in generators:
-        try:
-            gen = gen_class(llm)
-            content = gen.generate_from_article(article, imgs)
-            platform_contents[key] = content
-            filepath = asset_dir / filename
-            save_json(filepath, content.to_dict())
-            logger.info("[%s] 文案生成成功，已保存: %s", name, filepath)
-            print(f"  [ok] {name}: {content.title[:40] if hasattr(content, 'title') and content.title else '(已生成)'}")
-        except Exception as e:
-            logger.error("[%s] 文案生成失败: %s", name, e)
-            print(f"  [fail] {name}: {e}")
-
-    llm.close()
+    def _generate(name, key, gen_class, imgs, filename):
+        gen = _lazy(gen_class)(llm)
+        content = gen.generate_from_article(article, imgs)
+        filepath = asset_dir / filename
+        save_json(filepath, content.to_dict())
+        return content, filepath
+
+    # 各平台文案互不依赖，瓶颈在 LLM 网络往返，并发提交共享同一个 llm 客户端
+    log_lines = []
+    with ThreadPoolExecutor(max_workers=min(6, len(generators))) as pool:
+        futures = {pool.submit(_generate, *spec): spec for spec in generators}
+        for fut in as_completed(futures):
+            name, key = futures[fut][:2]
+            try:
+                content, filepath = fut.result()
+                platform_contents[key] = content
+                log_lines.append(f"  [{name}] 文案生成成功，已保存: {filepath}")
+                print(f"  [ok] {name}: {content.title[:40] if hasattr(content, 'title') and content.title else '(已生成)'}")
+            except Exception as e:
+                logger.error("[%s] 文案生成失败: %s", name, e)
+                print(f"  [fail] {name}: {e}")
+
+    # 成功记录汇总为一条日志，避免并发生成时逐条争用日志锁、输出交错
+    if log_lines:
+        logger.info("平台文案生成汇总:\n%s", "\n".join(log_lines))
 
     # 发布到各平台
     if not args.yes:
@@ -305,119 +388,212 @@ def publish_to_all_platforms(wp_result: dict, args, settings):
             print("已取消发布。文案已保存，可用各平台 republish 命令单独发布。")
             return
 
-    print(f"\n{sep}")
-    print("  Step 3: 发布到各平台")
-    print(sep)
+    _print_lines(_banner("Step 3: 发布到各平台"))
 
     results = {}
     headless = args.headless
 
-    # 小红书
-    xhs_content = platform_contents.get("xhs")
-    if xhs_content:
-        try:
-            from xiaohongshu.publisher import publish_note
-            logger.info("[小红书] 开始发布...")
-            ok = publish_note(xhs_content, headless=headless)
-            results["小红书"] = ok
-            print(f"  [{'ok' if ok else '??'}] 小红书")
-        except Exception as e:
-            results["小红书"] = False
-            logger.error("[小红书] 发布失败: %s", e, exc_info=True)
-            print(f"  [fail] 小红书: {e}")
-
-    # 抖音
-    dy_content = platform_contents.get("douyin")
-    if dy_content:
-        try:
-            from douyin.publisher import publish_douyin_note
-            logger.info("[抖音] 开始发布...")
-            ok = publish_douyin_note(dy_content, headless=headless)
-            results["抖音"] = ok
-            print(f"  [{'ok' if ok else '??'}] 抖音")
-        except Exception as e:
-            results["抖音"] = False
-            logger.error("[抖音] 发布失败: %s", e, exc_info=True)
-            print(f"  [fail] 抖音: {e}")
-
-    # 头条
-    tt_content = platform_contents.get("toutiao")
-    if tt_content:
-        try:
-            from toutiao.publisher import publish_toutiao_article
-            logger.info("[头条] 开始发布...")
-            ok = publish_toutiao_article(tt_content, headless=headless)
-            results["头条"] = ok
-            print(f"  [{'ok' if ok else '??'}] 头条")
-        except Exception as e:
-            results["头条"] = False
-            logger.error("[头条] 发布失败: %s", e, exc_info=True)
-            print(f"  [fail] 头条: {e}")
-
-    # 知乎
-    zh_content = platform_contents.get("zhihu")
-    if zh_content:
-        try:
-            from zhihu.publisher import publish_zhihu_article
-            logger.info("[知乎] 开始发布...")
-            ok = publish_zhihu_article(zh_content, headless=headless)
-            results["知乎"] = ok
-            print(f"  [{'ok' if ok else '??'}] 知乎")
-        except Exception as e:
-            results["知乎"] = False
-            logger.error("[知乎] 发布失败: %s", e, exc_info=True)
-            print(f"  [fail] 知乎: {e}")
-
-    # 视频号
-    ch_content = platform_contents.get("channels")
-    if ch_content:
-        try:
-            from channels.publisher import publish_channels_text
-            logger.info("[视频号] 开始发布...")
-            ok = publish_channels_text(
-                body=ch_content.full_text(),
-                image_sources=ch_content.image_urls,
-                title=ch_content.title if hasattr(ch_content, "title") else "",
-                headless=headless,
-            )
-            results["视频号"] = ok
-            print(f"  [{'ok' if ok else '??'}] 视频号")
-        except Exception as e:
-            results["视频号"] = False
-            logger.error("[视频号] 发布失败: %s", e, exc_info=True)
-            print(f"  [fail] 视频号: {e}")
-
-    # 微博
-    wb_content = platform_contents.get("weibo")
-    if wb_content:
-        try:
-            from weibo.publisher import publish_weibo_article
-            logger.info("[微博] 开始发布...")
-            ok = publish_weibo_article(wb_content, headless=headless)
-            results["微博"] = ok
-            print(f"  [{'ok' if ok else '??'}] 微博")
-        except Exception as e:
-            results["微博"] = False
-            logger.error("[微博] 发布失败: %s", e, exc_info=True)
-            print(f"  [fail] 微博: {e}")
+    # 文案未生成的平台直接记为失败，不再启动浏览器
+    tasks = []
+    for name, key, fn in _PUB_TABLE:
+        content = platform_contents.get(key)
+        if content:
+            tasks.append((name, fn, content))
+        else:
+            results[name] = False
+            print(f"  [fail] {name}: 文案未生成，跳过发布")
+
+    if tasks and args.parallel:
+        # 单平台超时：按发布间隔放大，但至少留出扫码登录的时间
+        task_timeout = max(settings.douyin_publish_delay * 20, PUBLISH_TASK_TIMEOUT_MIN)
+        results.update(_publish_parallel(tasks, headless, task_timeout))
+    elif tasks:
+        from shared.browser_pool import BrowserPool
+
+        # 所有平台共用一个浏览器进程，各自独立上下文，只冷启动一次 Edge
+        with BrowserPool(headless=headless) as pool:
+            for name, fn, content in tasks:
+                try:
+                    ok = fn(content, headless, pool)
+                    results[name] = ok
+                    print(f"  [{'ok' if ok else '??'}] {name}")
+                except Exception as e:
+                    results[name] = False
+                    logger.error("[%s] 发布失败: %s", name, e, exc_info=True)
+                    print(f"  [fail] {name}: {e}")
 
     # 结果汇总
     _print_all_report(results)
     return results
 
 
+# ══════════════════════════════════════════════════════════════
+#  各平台发布任务（子进程入口，须为模块级函数才能被 pickle）
+# ══════════════════════════════════════════════════════════════
+
+# 单个平台发布的最短超时（秒），需覆盖首次扫码登录
+PUBLISH_TASK_TIMEOUT_MIN = 600
+
+
+def _publish_task(fn, content, headless: bool, conn) -> None:
+    """
+    发布子进程入口：自成进程组（超时后连同浏览器一起结束），结果经管道发回 (成功与否, 错误信息)。
+    每个子进程持有自己的浏览器池，在任务内关闭（子进程退出时不会执行 atexit）。
+    """
+    from shared.browser_pool import BrowserPool
+
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    try:
+        with BrowserPool(headless=headless) as pool:
+            ok = fn(content, headless, pool)
+        conn.send((bool(ok), ""))
+    except Exception as e:
+        logger.error("发布失败: %s", e, exc_info=True)
+        conn.send((False, str(e)))
+    finally:
+        conn.close()
+
+
+def _kill_task(proc: multiprocessing.Process) -> None:
+    """结束卡住的发布子进程及其浏览器（POSIX 按进程组结束，Windows 只能结束子进程本身）"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+    proc.join(5)
+
+
+def _publish_parallel(tasks: list, headless: bool, task_timeout: float) -> dict:
+    """
+    每个平台一个独立子进程并发发布（最多 _publish_workers() 个同时运行）。
+    单个平台超过 task_timeout 秒仍未结束即强制结束该进程，不会拖住整个流程或解释器退出。
+    """
+    workers = min(_publish_workers(), len(tasks))
+    logger.info("并发发布 %d 个平台（%d 个进程）...", len(tasks), workers)
+    pending = list(tasks)
+    running = {}  # 管道读端 → (平台名, 进程, 截止时间)
+    results = {}
+
+    def _finish(conn, ok, message):
+        name, proc, _ = running.pop(conn)
+        conn.close()
+        proc.join(5)
+        results[name] = ok
+        if ok:
+            print(f"  [ok] {name}")
+        else:
+            print(f"  [{'fail' if message else '??'}] {name}{': ' + message if message else ''}")
+
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                name, fn, content = pending.pop(0)
+                reader, writer = multiprocessing.Pipe(duplex=False)
+                proc = multiprocessing.Process(
+                    target=_publish_task, args=(fn, content, headless, writer), daemon=True)
+                proc.start()
+                writer.close()
+                running[reader] = (name, proc, time.monotonic() + task_timeout)
+
+            next_deadline = min(deadline for _, _, deadline in running.values())
+            ready = multiprocessing.connection.wait(
+                list(running), timeout=max(0.0, next_deadline - time.monotonic()))
+            for conn in ready:
+                try:
+                    ok, message = conn.recv()
+                except EOFError:
+                    # 子进程没有发回结果就退出了（崩溃 / 被系统结束）
+                    ok, message = False, "发布进程异常退出"
+                _finish(conn, ok, message)
+
+            now = time.monotonic()
+            for conn, (name, proc, deadline) in list(running.items()):
+                if deadline <= now:
+                    logger.error("[%s] 发布超时（%ds），结束发布进程", name, task_timeout)
+                    _kill_task(proc)
+                    _finish(conn, False, "超时")
+    finally:
+        # 中断（Ctrl+C 等）时不留下仍在运行的浏览器
+        for conn, (_, proc, _) in running.items():
+            _kill_task(proc)
+            conn.close()
+    return results
+
+
+def _publish_workers() -> int:
+    """按物理内存决定并发浏览器数：每个 Chromium 约 500MB，16GB 以下最多 3 个"""
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return 3
+    return 6 if total >= 16 * 1024 ** 3 else 3
+
+
+def _run_xhs(content, headless: bool, pool=None) -> bool:
+    from xiaohongshu.publisher import publish_note
+    logger.info("[小红书] 开始发布...")
+    return publish_note(content, headless=headless, pool=pool)
+
+
+def _run_douyin(content, headless: bool, pool=None) -> bool:
+    from douyin.publisher import publish_douyin_note
+    logger.info("[抖音] 开始发布...")
+    return publish_douyin_note(content, headless=headless, pool=pool)
+
+
+def _run_toutiao(content, headless: bool, pool=None) -> bool:
+    from toutiao.publisher import publish_toutiao_article
+    logger.info("[头条] 开始发布...")
+    return publish_toutiao_article(content, headless=headless, pool=pool)
+
+
+def _run_zhihu(content, headless: bool, pool=None) -> bool:
+    from zhihu.publisher import publish_zhihu_article
+    logger.info("[知乎] 开始发布...")
+    return publish_zhihu_article(content, headless=headless, pool=pool)
+
+
+def _run_channels(content, headless: bool, pool=None) -> bool:
+    from channels.publisher import publish_channels_text
+    logger.info("[视频号] 开始发布...")
+    return publish_channels_text(
+        body=content.full_text(),
+        image_sources=content.image_urls,
+        title=content.title if hasattr(content, "title") else "",
+        headless=headless,
+        pool=pool,
+    )
+
+
+def _run_weibo(content, headless: bool, pool=None) -> bool:
+    from weibo.publisher import publish_weibo_article
+    logger.info("[微博] 开始发布...")
+    return publish_weibo_article(content, headless=headless, pool=pool)
+
+
+# 平台名 → platform_contents 键 → 发布任务
+_PUB_TABLE = (
+    ("小红书", "xhs", _run_xhs),
+    ("抖音", "douyin", _run_douyin),
+    ("头条", "toutiao", _run_toutiao),
+    ("知乎", "zhihu", _run_zhihu),
+    ("视频号", "channels", _run_channels),
+    ("微博", "weibo", _run_weibo),
+)
+
+
 def _print_all_report(results: dict):
-    sep = "=" * 60
-    print(f"\n{sep}")
-    print("  全平台发布结果")
-    print(sep)
-    for platform, success in results.items():
-        status = "ok" if success else "fail"
-        print(f"  [{status}] {platform}")
     success_count = sum(1 for v in results.values() if v)
-    total = len(results)
-    print(f"\n  总计: {success_count}/{total} 个平台发布成功")
-    print(sep)
+    _print_lines([
+        *_banner("全平台发布结果"),
+        *(f"  [{'ok' if success else 'fail'}] {platform}" for platform, success in results.items()),
+        f"\n  总计: {success_count}/{len(results)} 个平台发布成功",
+        _SEP,
+    ])
 
 
 # ══════════════════════════════════════════════════════════════
@@ -444,6 +620,8 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--headless", action="store_true",
                         help="无头浏览器模式")
     parser.add_argument("--no-headless", dest="headless", action="store_false")
+    parser.add_argument("--parallel", action="store_true",
+                        help="各平台在独立进程中同时发布（默认逐个发布）")
     return parser
 
 
@@ -454,17 +632,16 @@ def main():
     settings = get_settings()
     settings.check_or_exit()
 
-    sep = "=" * 60
-    print(f"\n{sep}")
-    print("  企业大脑私有化 —— 专题文章自动发布")
-    print(sep)
-    print(f"  主题:     {TOPIC}")
-    print(f"  分类:     {CATEGORIES}")
-    print(f"  标签:     {TAGS}")
-    print(f"  模式:     {'dry-run' if args.dry_run else 'publish'}")
-    print(f"  全平台:   {'是' if args.all else '否（仅 WordPress）'}")
-    print(f"  视频:     {'是' if args.video else '否'}")
-    print(sep)
+    _print_lines([
+        *_banner("企业大脑私有化 —— 专题文章自动发布"),
+        f"  主题:     {TOPIC}",
+        f"  分类:     {CATEGORIES}",
+        f"  标签:     {TAGS}",
+        f"  模式:     {'dry-run' if args.dry_run else 'publish'}",
+        f"  全平台:   {'是' if args.all else '否（仅 WordPress）'}",
+        f"  视频:     {'是' if args.video else '否'}",
+        _SEP,
+    ])
 
     if not args.yes and not args.dry_run:
         confirm = input("\n确认开始？(y/N): ").strip().lower()
@@ -482,11 +659,11 @@ def main():
         publish_to_all_platforms(wp_result, args, settings)
 
     elapsed = time.monotonic() - t0
-    print(f"\n  总耗时: {elapsed:.1f}s")
-    print(f"  素材目录: {wp_result.get('asset_dir', '-')}")
+    lines = [f"\n  总耗时: {elapsed:.1f}s", f"  素材目录: {wp_result.get('asset_dir', '-')}"]
     if wp_result.get("link"):
-        print(f"  WordPress: {wp_result['link']}")
-    print()
+        lines.append(f"  WordPress: {wp_result['link']}")
+    lines.append("")
+    _print_lines(lines)
 
 
 if __name__ == "__main__":
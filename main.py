@@ -10,7 +10,8 @@ Aineoo 内容自动发布工具 —— 统一 CLI 入口
 
     # ── 小红书 ──
     python main.py xhs list                          # 列出 WordPress 文章
-    python main.py xhs generate <post_id>            # 生成文案
+    python main.py xhs generate <post_id>            # 生成文案（已有则复用）
+    python main.py xhs generate <post_id> --force-regen  # 重新生成文案
     python main.py xhs publish  <post_id>            # 生成并发布
     python main.py xhs local-list                    # 列出共享素材
     python main.py xhs local <slug>                  # 从素材生成文案
@@ -22,6 +23,8 @@ Aineoo 内容自动发布工具 —— 统一 CLI 入口
     python main.py xhs audio <source> --avatar --avatar-image face.jpg  # 配音+数字人
     python main.py xhs republish <json_file>         # 从 JSON 直接发布
     python main.py xhs batch <id1> <id2> ...         # 批量处理
+    python main.py xhs batch <ids...> --publish --workers 3  # 批量处理 + 3 个浏览器并发发布
+    python main.py --no-cache xhs generate <post_id> # 已设置 LLM_CACHE=true 时，本次跳过 LLM 本地缓存
 
     # ── 评论引流 ──
     python main.py xhs comment "AI工具" --my-note xhs_post_802.json   # 自动评论引流
@@ -30,37 +33,79 @@ Aineoo 内容自动发布工具 —— 统一 CLI 入口
 
     # ── 全流程 ──
     python main.py all --topic "AI销售自动化"        # WordPress → 小红书一键发布
+    python main.py all --topic "AI销售自动化" --single-call  # 各平台文案合并为一次 LLM 请求
+    python main.py all --local <slug>                # 用已有素材生成并发布各平台（跳过 WordPress）
+    python main.py all --topic "AI销售自动化" --parallel     # 各平台同时发布（每个平台一个浏览器）
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
+import importlib.util
 import io as _io
-import json
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from shared.config import get_settings
-from shared.llm.client import LLMClient
+from shared.llm.client import ARTICLE_MESSAGE_FIELDS, LLMClient
 from shared.llm.xhs import XHSContent, XHSContentGenerator
 from shared.llm.douyin import DouyinContent, DouyinContentGenerator
 from shared.llm.toutiao import ToutiaoContent, ToutiaoContentGenerator
 from shared.llm.zhihu import ZhihuContent, ZhihuContentGenerator
 from shared.llm.channels import ChannelsContent, ChannelsContentGenerator
 from shared.llm.weibo import WeiboContent, WeiboContentGenerator
-from shared.media.avatar import AvatarGenerator
-from shared.media.story_video import run_story_video, StoryVideoResult
-from shared.media.image import ImageGenerator
-from shared.media.tts import TTSGenerator
-from shared.media.video import VideoGenerator
+from shared.llm.multi import MultiPlatformGenerator
 from shared.utils.exceptions import AppBaseError, ConfigError, QualityError
-from shared.utils.helpers import resolve_prompt, save_json, split_csv
+from shared.utils.helpers import (
+    confirm, format_hashtags, head_lines, image_seed, load_json, load_json_fields,
+    peek_json_field, resolve_prompt, save_json, split_csv, to_vertical_prompt,
+)
 from shared.utils.logger import get_logger
-from shared.wp.client import WordPressClient
-from wordpress.pipeline import WPPublisher
+from shared.wp.client import WordPressClient, WPPost
 from wordpress.html_builder import verify_published_page
 
+# 媒体模块（moviepy / ffmpeg / 火山引擎 SDK）、wordpress.pipeline、LLM 本地缓存（sqlite3）与进程池导入较慢，
+# 只在真正用到的命令里按需导入，list / local-list 等轻量命令无需承担这部分启动开销
+if TYPE_CHECKING:
+    from shared.media.avatar import AvatarGenerator
+    from shared.media.image import ImageGenerator
+    from shared.media.story_video import StoryVideoResult
+    from shared.media.tts import TTSGenerator
+    from shared.media.video import VideoGenerator
+
+
+def _lazy_module(name: str):
+    """
+    以 importlib.util.LazyLoader 导入模块：此刻只登记到 sys.modules，
+    首次访问模块属性时才真正执行模块代码（Playwright 等重依赖随之按需加载）
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"找不到模块: {name}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# 各平台发布器：启动时不加载，第一次发布 / 诊断时才执行模块代码，之后直接复用
+_xhs_publisher = _lazy_module("xiaohongshu.publisher")
+_dy_publisher = _lazy_module("douyin.publisher")
+_toutiao_publisher = _lazy_module("toutiao.publisher")
+_zh_publisher = _lazy_module("zhihu.publisher")
+_channels_publisher = _lazy_module("channels.publisher")
+_wb_publisher = _lazy_module("weibo.publisher")
+
 logger = get_logger("main")
 
 # Windows 控制台编码兼容
@@ -74,12 +119,21 @@ if hasattr(sys.stdout, "reconfigure"):
 # ══════════════════════════════════════════════════════════════
 
 def _make_llm(settings) -> LLMClient:
-    return LLMClient(
+    kwargs = dict(
         api_key=settings.deepseek_api_key,
         base_url=settings.deepseek_base_url,
         model=settings.deepseek_model,
         timeout=settings.request_timeout,
     )
+    if not settings.llm_cache_enabled:
+        return LLMClient(**kwargs)
+    # LLM_CACHE=true 时（默认关闭），相同提示词直接复用本地缓存的回复（--no-cache 可临时跳过）
+    from shared.llm.cache import CachingLLMClient
+    return CachingLLMClient(
+        **kwargs,
+        cache_path=Path(settings.output_dir) / "llm_cache.sqlite",
+        ttl=settings.llm_cache_ttl,
+    )
 
 
 def _make_wp(settings) -> WordPressClient:
@@ -91,11 +145,17 @@ def _make_wp(settings) -> WordPressClient:
     )
 
 
+# 竖版配图并发请求数：火山引擎文生图的并发额度有限，再多只会触发限流重试
+_VERTICAL_IMAGE_WORKERS = 4
+
+
 def _make_image_gen(settings) -> ImageGenerator:
+    from shared.media.image import ImageGenerator
     return ImageGenerator(volc_ak=settings.volc_ak, volc_sk=settings.volc_sk)
 
 
 def _make_video_gen(settings, llm: LLMClient) -> VideoGenerator:
+    from shared.media.video import VideoGenerator
     return VideoGenerator(
         volc_ak=settings.volc_ak,
         volc_sk=settings.volc_sk,
@@ -107,6 +167,7 @@ def _make_video_gen(settings, llm: LLMClient) -> VideoGenerator:
 
 
 def _make_avatar_gen(settings, avatar_image_url: str = "") -> AvatarGenerator:
+    from shared.media.avatar import AvatarGenerator
     return AvatarGenerator(
         fal_key=settings.fal_key,
         avatar_image_url=avatar_image_url,
@@ -114,9 +175,53 @@ def _make_avatar_gen(settings, avatar_image_url: str = "") -> AvatarGenerator:
 
 
 def _make_tts(llm: LLMClient, voice: str = "zh-CN-XiaoyiNeural", rate: str = "+0%") -> TTSGenerator:
+    from shared.media.tts import TTSGenerator
     return TTSGenerator(llm=llm, voice=voice, rate=rate)
 
 
+# 进程内共享的客户端：同一次 CLI 运行中的所有请求复用同一个 Session 连接池，
+# 避免每次请求都重新建立 TCP / TLS 连接；进程退出时统一关闭
+
+@lru_cache(maxsize=1)
+def _get_llm() -> LLMClient:
+    llm = _make_llm(get_settings())
+    atexit.register(llm.close)
+    return llm
+
+
+@lru_cache(maxsize=1)
+def _get_wp() -> WordPressClient:
+    wp = _make_wp(get_settings())
+    atexit.register(wp.close)
+    return wp
+
+
+@lru_cache(maxsize=1)
+def _output_dir() -> Path:
+    """共享素材 / 输出目录（各平台共用）"""
+    return Path(get_settings().output_dir)
+
+
+@lru_cache(maxsize=128)
+def _get_post(post_id: int) -> WPPost:
+    """获取 WordPress 文章：同一次运行中同一篇文章只请求一次，返回共享对象，调用方不要修改"""
+    return _get_wp().get_post(post_id)
+
+
+def _fetch_and_generate(post_id: int, generator_cls):
+    """
+    获取 WordPress 文章并用指定平台的生成器生成文案，返回 (post, content)。
+    文章请求与 LLM 客户端初始化互不依赖，放到两个线程里同时进行。
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        post_future = pool.submit(_get_post, post_id)
+        llm_future = pool.submit(_get_llm)
+        post = post_future.result()
+        llm = llm_future.result()
+    logger.info("已获取文章: [%d] %s", post.id, post.title)
+    return post, generator_cls(llm).generate_from_post(post)
+
+
 # ══════════════════════════════════════════════════════════════
 #  WordPress 子命令
 # ══════════════════════════════════════════════════════════════
@@ -132,8 +237,10 @@ def cmd_wp(args):
         prompt_template=settings.prompt_template,
     )
 
+    from wordpress.pipeline import WPPublisher
+
     t_start = time.monotonic()
-    llm = _make_llm(settings)
+    llm = _get_llm()
     wp = _make_wp(settings)
     image_gen = _make_image_gen(settings)
     video_gen = _make_video_gen(settings, llm) if getattr(args, "video", False) else None
@@ -171,7 +278,6 @@ def cmd_wp(args):
         )
 
     result["elapsed"] = time.monotonic() - t_start
-    llm.close()
     _print_wp_report(result)
     return result
 
@@ -182,23 +288,29 @@ def _print_wp_report(result: dict) -> None:
     lines = [f"\n{sep}", "  WordPress 发布结果", sep]
 
     if result.get("dry_run"):
-        lines.append(f"  模式:       dry-run")
-        lines.append(f"  本地预览:   {result.get('preview_file', '-')}")
+        lines += [
+            "  模式:       dry-run",
+            f"  本地预览:   {result.get('preview_file', '-')}",
+        ]
     else:
-        lines.append(f"  模式:       publish")
-        lines.append(f"  文章ID:     {result.get('post_id', '-')}")
-        lines.append(f"  文章链接:   {result.get('link', '-')}")
-
-    lines.append(f"  slug:       {result.get('slug', '-')}")
-    lines.append(f"  素材目录:   {result.get('asset_dir', '-')}")
-    lines.append(f"  上传图片:   {result.get('media_count', 0)} 张")
-    lines.append(f"  分类IDs:    {result.get('category_ids', [])}")
-    lines.append(f"  标签IDs:    {result.get('tag_ids', [])}")
-    lines.append(f"  相关文章:   {result.get('related_count', 0)} 篇")
-    lines.append(f"  内容来源:   {result.get('content_source', 'rules')}")
-    lines.append(f"  文章视频:   {'有' if result.get('has_video') else '无'}")
-    lines.append(f"  数字人:     {'有' if result.get('has_avatar') else '无'}")
-    lines.append(f"  耗时:       {result.get('elapsed', 0):.1f}s")
+        lines += [
+            "  模式:       publish",
+            f"  文章ID:     {result.get('post_id', '-')}",
+            f"  文章链接:   {result.get('link', '-')}",
+        ]
+
+    lines += [
+        f"  slug:       {result.get('slug', '-')}",
+        f"  素材目录:   {result.get('asset_dir', '-')}",
+        f"  上传图片:   {result.get('media_count', 0)} 张",
+        f"  分类IDs:    {result.get('category_ids', [])}",
+        f"  标签IDs:    {result.get('tag_ids', [])}",
+        f"  相关文章:   {result.get('related_count', 0)} 篇",
+        f"  内容来源:   {result.get('content_source', 'rules')}",
+        f"  文章视频:   {'有' if result.get('has_video') else '无'}",
+        f"  数字人:     {'有' if result.get('has_avatar') else '无'}",
+        f"  耗时:       {result.get('elapsed', 0):.1f}s",
+    ]
 
     quality = result.get("quality", {})
     if quality:
@@ -222,28 +334,125 @@ def _print_wp_report(result: dict) -> None:
 #  小红书子命令
 # ══════════════════════════════════════════════════════════════
 
-def _xhs_output_dir() -> Path:
-    """小红书本地输出目录"""
-    return Path(get_settings().output_dir)
+# 素材目录下缓存标题等列表信息的小文件，避免列表时反复解析完整的 article.json
+_ASSET_META_FILE = ".meta.json"
+
+
+def _scan_assets(output_dir: Path) -> list:
+    """
+    单次 os.scandir 列出共享素材目录（含 article.json 的子目录），按 slug 排序。
+    返回 [(DirEntry, article.json 的 stat)]；DirEntry.is_dir() 复用 readdir 结果，无额外 stat。
+    """
+    with os.scandir(output_dir) as it:
+        dirs = [e for e in it if e.is_dir()]
+    assets = []
+    for d in sorted(dirs, key=lambda e: e.name):
+        try:
+            st = os.stat(os.path.join(d.path, "article.json"))
+        except OSError:
+            continue
+        assets.append((d, st))
+    return assets
+
+
+def _available_slugs(output_dir: Path) -> list:
+    """可用素材的 slug 列表（已排序；目录不存在返回空列表），用于「素材不存在」时提示"""
+    try:
+        return [d.name for d, _ in _scan_assets(output_dir)]
+    except OSError:
+        return []
+
+
+def _scan_slugs(output_dir: Path, marker: str = "article.json") -> dict:
+    """
+    一次遍历列出共享素材及其目录内容：返回 {slug: 子目录中的文件名集合}（按 slug 排序，仅含有 marker 文件的目录）。
+    各平台的 local-list 用集合查询判断 *_content.json 是否已生成，不再逐个 stat。
+    """
+    with os.scandir(output_dir) as it:
+        dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    assets = {}
+    for d in dirs:
+        try:
+            with os.scandir(d.path) as it:
+                names = frozenset(e.name for e in it)
+        except OSError:
+            continue
+        if marker in names:
+            assets[d.name] = names
+    return assets
+
+
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
+
+def _scan_images(image_dir, limit: int = 9) -> list:
+    """单次 os.scandir 收集目录下的图片路径（按文件名排序，最多 limit 张；目录不存在返回空列表）"""
+    try:
+        with os.scandir(image_dir) as it:
+            paths = sorted(
+                e.path for e in it
+                if e.is_file() and os.path.splitext(e.name)[1].lower() in _IMAGE_EXTS
+            )
+    except OSError:
+        return []
+    return paths[:limit]
+
+
+def _count_files(dir_path: str) -> int:
+    """统计目录下的非隐藏条目数（目录不存在返回 0）"""
+    try:
+        with os.scandir(dir_path) as it:
+            return sum(1 for e in it if not e.name.startswith("."))
+    except OSError:
+        return 0
+
+
+def _asset_title(asset_path: str, article_stat: os.stat_result) -> str:
+    """读取素材标题：article.json 未修改时直接用 .meta.json 中缓存的标题"""
+    meta_path = os.path.join(asset_path, _ASSET_META_FILE)
+    try:
+        meta = load_json(meta_path)
+        if meta.get("article_mtime_ns") == article_stat.st_mtime_ns:
+            return meta.get("title", "-")
+    except (OSError, ValueError):
+        pass
+    title = peek_json_field(os.path.join(asset_path, "article.json"), "title", "-")
+    try:
+        save_json(meta_path, {"article_mtime_ns": article_stat.st_mtime_ns, "title": title})
+    except OSError:
+        pass
+    return title
+
+
+def _preview_body_lines(body: str, max_lines: int = 8) -> list:
+    """预览中的正文部分：字数 + 前 max_lines 行（有剩余时追加省略号）"""
+    head, has_more = head_lines(body, max_lines)
+    lines = [f"  正文 ({len(body)} 字):"] + [f"    {line}" for line in head]
+    if has_more:
+        lines.append("    ...")
+    return lines
 
 
 def _print_xhs_preview(content: XHSContent) -> None:
-    print("\n" + "=" * 50)
-    print("  小红书文案预览")
-    print("=" * 50)
-    print(f"\n  标题: {content.title}")
-    print(f"\n  正文:\n{content.body}")
-    tags = " ".join(f"#{t}" for t in content.hashtags)
-    print(f"\n  话题: {tags}")
+    sep = "=" * 50
+    lines = [
+        f"\n{sep}",
+        "  小红书文案预览",
+        sep,
+        f"\n  标题: {content.title}",
+        f"\n  正文:\n{content.body}",
+        f"\n  话题: {format_hashtags(content.hashtags)}",
+    ]
     if content.image_urls:
-        print(f"\n  配图 ({len(content.image_urls)} 张):")
-        for i, url in enumerate(content.image_urls, 1):
-            print(f"     {i}. {url}")
-    print("\n" + "=" * 50)
+        lines.append(f"\n  配图 ({len(content.image_urls)} 张):")
+        lines += [f"     {i}. {url}" for i, url in enumerate(content.image_urls, 1)]
+    lines.append(f"\n{sep}")
+    print("\n".join(lines))
 
 
-def _save_xhs_content(content: XHSContent, post_id: int) -> None:
-    output_dir = _xhs_output_dir()
+def _save_xhs_content(content: XHSContent, post_id: int) -> dict:
+    """保存为 xhs_post_{id}.json，返回写入的 dict（调用方可直接复用，无需再 to_dict 一次）"""
+    output_dir = _output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
     data = content.to_dict()
     data["post_id"] = post_id
@@ -251,22 +460,133 @@ def _save_xhs_content(content: XHSContent, post_id: int) -> None:
     save_json(filepath, data)
     logger.info("文案已保存: %s", filepath)
     print(f"\n  文案已保存至: {filepath}")
+    return data
+
+
+def _resolve_source(source: str, output_dir: Path) -> Tuple[Optional[Path], Optional[dict]]:
+    """
+    将命令行里的 JSON 来源解析为 (路径, 数据)：依次直接读取 source、output_dir/source，
+    打不开就试下一个（不预先 exists() 探测）；都不可读时返回 (None, None)。
+    """
+    for path in (Path(source), output_dir / source):
+        try:
+            return path, load_json(path)
+        except OSError:
+            continue
+    return None, None
+
+
+def _first_file(candidates) -> Optional[Path]:
+    """返回候选路径中第一个存在的文件（跳过空值）"""
+    return next((Path(c) for c in candidates if c and Path(c).is_file()), None)
+
+
+def _resolve_content_file(arg: str, output_dir: Path, default_name: str) -> Optional[Path]:
+    """
+    解析命令行给出的文案文件：依次尝试 arg、output_dir/arg，以及二者作为素材目录时其中的 default_name，
+    返回第一个存在的文件；都不存在时返回 None
+    """
+    base = Path(arg)
+    return _first_file((base, output_dir / arg, base / default_name, output_dir / arg / default_name))
+
+
+def _republish(args, default_name: str, from_dict, preview_fn, publish_fn, label: str,
+               check=None) -> None:
+    """
+    各平台 republish 的公共流程：解析文案文件 → 预览 → 确认 → 发布。
+    json_file 可以是文件路径、相对共享素材目录的路径，或素材 slug（自动查找其中的 default_name）；
+    check(content, data) 用于平台特有的校验，不通过时自行提示并退出。
+    """
+    output_dir = _output_dir()
+    filepath = _resolve_content_file(args.json_file, output_dir, default_name)
+    if filepath is None:
+        print(f"  文件不存在: {args.json_file}")
+        print(f"  （尝试路径: {output_dir / args.json_file}）")
+        sys.exit(1)
+    data = load_json(filepath)
+    content = from_dict(data)
+    logger.info("加载%s文案: %s", label, filepath)
+    if check:
+        check(content, data)
+
+    preview_fn(content)
+    if not args.yes:
+        if not confirm(f"\n确认发布到{label}？(y/N): "):
+            print("已取消发布。")
+            return
+    publish_fn(content, args.headless)
+
+
+def _find_in_dir(dir_path: Path, names) -> Optional[Path]:
+    """
+    在同一目录下按顺序查找候选文件名，返回第一个存在的路径（目录不存在返回 None）。
+    一次 os.scandir 取得目录内容后用集合判断，不对每个候选单独 stat。
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            present = {e.name for e in it if e.is_file()}
+    except OSError:
+        return None
+    return next((dir_path / name for name in names if name in present), None)
+
+
+def _build_xhs(post_id: int, force_regen: bool = False) -> dict:
+    """
+    拉取 WordPress 文章并生成小红书文案，保存为 xhs_post_{id}.json，返回保存的数据。
+    force_regen 时不读 LLM 本地缓存，保证得到一份新文案。
+    """
+    post = _get_post(post_id)
+    logger.info("已获取文章: [%d] %s", post.id, post.title)
+    llm = _get_llm()
+    with llm.bypass_cache(force_regen):
+        content = XHSContentGenerator(llm).generate_from_post(post)
+    return _save_xhs_content(content, post.id)
+
+
+# post_id → 小红书文案 dict（进程内缓存，--force-regen 时按 post_id 替换）
+_xhs_data_cache: dict = {}
+
+
+def _load_or_build_xhs(post_id: int) -> dict:
+    """
+    取文章对应的小红书文案：已有 xhs_post_{id}.json 直接读取，否则走 WordPress + LLM 生成。
+    进程内按 post_id 缓存；返回的 dict 是共享对象，调用方不要原地修改。
+    """
+    data = _xhs_data_cache.get(post_id)
+    if data is not None:
+        return data
+    json_path = _output_dir() / f"xhs_post_{post_id}.json"
+    try:
+        data = load_json(json_path)
+        logger.info("使用已有文案: %s（--force-regen 可重新生成）", json_path)
+    except FileNotFoundError:
+        data = _build_xhs(post_id)
+    _xhs_data_cache[post_id] = data
+    return data
 
 
-def _save_xhs_content_local(content: XHSContent, slug: str, asset_dir: Path) -> None:
+def _xhs_data(post_id: int, force_regen: bool = False) -> dict:
+    """force_regen 时跳过已有文案与 LLM 缓存直接重新生成，否则复用磁盘 / 进程内缓存"""
+    if force_regen:
+        _xhs_data_cache[post_id] = data = _build_xhs(post_id, force_regen=True)
+        return data
+    return _load_or_build_xhs(post_id)
+
+
+def _save_xhs_content_local(content: XHSContent, slug: str, asset_dir: Path,
+                            fsync: bool = True) -> None:
     data = content.to_dict()
     data["slug"] = slug
     data["source"] = "local"
     filepath = asset_dir / "xhs_content.json"
-    save_json(filepath, data)
+    save_json(filepath, data, fsync=fsync)
     logger.info("小红书文案已保存: %s", filepath)
     print(f"\n  文案已保存至: {filepath}")
 
 
 def _do_xhs_publish(content: XHSContent, headless: bool = False) -> bool:
-    from xiaohongshu.publisher import publish_note
     logger.info("开始自动发布到小红书...")
-    success = publish_note(content, headless=headless)
+    success = _xhs_publisher.publish_note(content, headless=headless)
     if success:
         print("\n  笔记发布成功！")
     else:
@@ -275,9 +595,8 @@ def _do_xhs_publish(content: XHSContent, headless: bool = False) -> bool:
 
 
 def _do_xhs_publish_video(video_path: str, title: str, body: str, headless: bool = False) -> bool:
-    from xiaohongshu.publisher import publish_video_note
     logger.info("开始自动发布视频到小红书...")
-    success = publish_video_note(video_path, title, body, headless=headless)
+    success = _xhs_publisher.publish_video_note(video_path, title, body, headless=headless)
     if success:
         print("\n  视频发布成功！")
     else:
@@ -285,12 +604,46 @@ def _do_xhs_publish_video(video_path: str, title: str, body: str, headless: bool
     return success
 
 
+def _xhs_publish_worker(content: XHSContent, headless: bool, delay: int) -> bool:
+    """
+    批量发布的进程池任务：在独立进程中启动浏览器发布一篇笔记，结束即关闭浏览器。
+    delay > 0 时发布后继续占用该进程槽位 delay 秒，保持同一槽位相邻两次发布的间隔。
+    """
+    from shared.browser_pool import BrowserPool
+    with BrowserPool(headless=headless) as pool:
+        success = _xhs_publisher.publish_note(content, headless=headless, pool=pool)
+    if delay:
+        time.sleep(delay)
+    return success
+
+
+def _publish_xhs_parallel(jobs: list, workers: int, headless: bool, delay: int, results: dict) -> None:
+    """用进程池并发发布 [(post_id, content)]，每个进程各自持有浏览器"""
+    # 进程池会连带导入 multiprocessing，只有并发发布时才需要
+    from concurrent.futures import ProcessPoolExecutor
+    print(f"\n  并发发布 {len(jobs)} 篇笔记（{workers} 个浏览器进程）")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for i, (post_id, content) in enumerate(jobs):
+            # 该槽位之后仍有任务排队时才需要保持发布间隔
+            wait = delay if i < len(jobs) - workers else 0
+            futures[pool.submit(_xhs_publish_worker, content, headless, wait)] = post_id
+        for fut in as_completed(futures):
+            post_id = futures[fut]
+            try:
+                success = fut.result()
+            except Exception as e:
+                logger.error("文章 %d 发布失败: %s", post_id, e)
+                success = False
+            results["success" if success else "failed"].append(post_id)
+            print(f"  文章 {post_id} 发布{'成功' if success else '可能失败'}")
+
+
 def cmd_xhs_list(args):
     settings = get_settings()
     settings.check_or_exit(require_llm=False)
-    wp = _make_wp(settings)
+    wp = _get_wp()
     posts = wp.list_posts(per_page=args.count, search=args.search)
-    wp.close()
     if not posts:
         print("没有找到已发布的文章。")
         return
@@ -304,83 +657,74 @@ def cmd_xhs_list(args):
 def cmd_xhs_generate(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-    logger.info("已获取文章: [%d] %s", post.id, post.title)
-
-    llm = _make_llm(settings)
-    gen = XHSContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
-
-    _print_xhs_preview(content)
-    _save_xhs_content(content, post.id)
+    data = _xhs_data(args.post_id, args.force_regen)
+    _print_xhs_preview(XHSContent.from_dict(data))
 
 
 def cmd_xhs_publish(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-    logger.info("已获取文章: [%d] %s", post.id, post.title)
-
-    llm = _make_llm(settings)
-    gen = XHSContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
-
+    content = XHSContent.from_dict(_xhs_data(args.post_id, args.force_regen))
     _print_xhs_preview(content)
-    _save_xhs_content(content, post.id)
 
     if not args.yes:
-        confirm = input("\n确认发布到小红书？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到小红书？(y/N): "):
             print("已取消发布。")
             return
     _do_xhs_publish(content, args.headless)
 
 
 def cmd_xhs_republish(args):
-    filepath = Path(args.json_file)
-    output_dir = _xhs_output_dir()
-    if not filepath.exists():
-        filepath = output_dir / args.json_file
-    if not filepath.exists():
-        print(f"  文件不存在: {args.json_file}")
-        sys.exit(1)
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    content = XHSContent.from_dict(data)
-    _print_xhs_preview(content)
-    if not args.yes:
-        confirm = input("\n确认发布到小红书？(y/N): ").strip().lower()
-        if confirm != "y":
-            print("已取消发布。")
-            return
-    _do_xhs_publish(content, args.headless)
+    _republish(args, "xhs_content.json", XHSContent.from_dict,
+               _print_xhs_preview, _do_xhs_publish, "小红书")
 
 
 def cmd_xhs_batch(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    llm = _make_llm(settings)
+    wp = _get_wp()
+    llm = _get_llm()
     gen = XHSContentGenerator(llm)
     total = len(args.post_ids)
     results = {"success": [], "failed": []}
 
+    # 一次请求预取全部文章；未取到的（如草稿）再逐篇获取
+    prefetched = wp.get_posts_bulk(args.post_ids)
+
+    def _process_one(post_id):
+        """拉取文章并生成文案（网络 I/O 为主，可并发）"""
+        try:
+            post = prefetched.get(post_id) or wp.get_post(post_id)
+            return post_id, post, gen.generate_from_post(post), None
+        except Exception as e:
+            return post_id, None, None, e
+
     print(f"\n  批量任务：共 {total} 篇文章待处理")
     print("=" * 50)
-    for idx, post_id in enumerate(args.post_ids, 1):
+
+    # 阶段 1：并发拉取 + 生成（共享 wp / llm 的 Session 连接池），map 保持输入顺序
+    with ThreadPoolExecutor(max_workers=min(8, total) or 1) as pool:
+        generated = list(pool.map(_process_one, args.post_ids))
+
+    # 阶段 2：按顺序保存 / 发布（默认串行并沿用发布间隔；--workers > 1 时交给进程池并发发布）
+    workers = max(1, args.workers)
+    if args.publish and workers > 1:
+        from shared.publisher_base import STORAGE_STATE_FILE
+        # 多个进程不能共用同一个持久化浏览器目录，只能各自从登录态快照恢复
+        if not (_xhs_publisher.XHSPublisher.USER_DATA_DIR / STORAGE_STATE_FILE).exists():
+            logger.warning("尚无小红书登录态快照，改为串行发布（先单篇发布一次即可生成快照）")
+            workers = 1
+    publish_jobs = []
+    for idx, (post_id, post, content, err) in enumerate(generated, 1):
         print(f"\n[{idx}/{total}] 处理文章 ID: {post_id}")
         print("-" * 40)
         try:
-            post = wp.get_post(post_id)
-            content = gen.generate_from_post(post)
+            if err is not None:
+                raise err
             _save_xhs_content(content, post.id)
-            if args.publish:
+            if args.publish and workers > 1:
+                publish_jobs.append((post_id, content))
+            elif args.publish:
                 success = _do_xhs_publish(content, headless=args.headless)
                 if success:
                     results["success"].append(post_id)
@@ -398,8 +742,9 @@ def cmd_xhs_batch(args):
             logger.error("文章 %d 处理失败: %s", post_id, e)
             print(f"  处理失败: {e}")
 
-    wp.close()
-    llm.close()
+    if publish_jobs:
+        _publish_xhs_parallel(publish_jobs, workers, args.headless, settings.xhs_publish_delay, results)
+
     print("\n" + "=" * 50)
     print(f"  批量任务完成：成功 {len(results['success'])} 篇，失败 {len(results['failed'])} 篇")
     if results["failed"]:
@@ -409,39 +754,33 @@ def cmd_xhs_batch(args):
 def cmd_xhs_local(args):
     settings = get_settings()
     settings.check_or_exit()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     slug = args.slug
     asset_dir = output_dir / slug
     article_file = asset_dir / "article.json"
     image_dir = asset_dir / "images"
 
     if not article_file.exists():
-        available = [d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()] if output_dir.exists() else []
+        available = _available_slugs(output_dir)
         print(f"\n  素材不存在: {article_file}")
         if available:
             print(f"\n  可用的 slug:")
-            for s in sorted(available):
+            for s in available:
                 print(f"    - {s}")
         else:
             print(f"  共享素材目录为空或不存在: {output_dir}")
             print("  请先使用 wp 命令生成文章")
         sys.exit(1)
 
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json(article_file)
     logger.info("已加载本地素材: %s", slug)
 
-    image_paths = []
-    if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+    image_paths = _scan_images(image_dir)
     logger.info("本地图片 %d 张", len(image_paths))
 
-    llm = _make_llm(settings)
+    llm = _get_llm()
     gen = XHSContentGenerator(llm)
     content = gen.generate_from_article(article, image_paths)
-    llm.close()
 
     _print_xhs_preview(content)
     _save_xhs_content_local(content, slug, asset_dir)
@@ -449,28 +788,24 @@ def cmd_xhs_local(args):
     if not args.publish:
         return
     if not args.yes:
-        confirm = input("\n确认发布到小红书？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到小红书？(y/N): "):
             print("已取消发布。")
             return
     _do_xhs_publish(content, args.headless)
 
 
 def cmd_xhs_local_list(args):
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     if not output_dir.exists():
         print(f"\n  共享素材目录不存在: {output_dir}")
         print("  请先使用 wp 命令生成文章")
         return
     slugs = []
-    for d in sorted(output_dir.iterdir()):
-        if d.is_dir() and (d / "article.json").exists():
-            with open(d / "article.json", "r", encoding="utf-8") as f:
-                article = json.load(f)
-            title = article.get("title", "-")
-            img_count = len(list((d / "images").glob("*"))) if (d / "images").exists() else 0
-            has_result = (d / "result.json").exists()
-            slugs.append((d.name, title, img_count, has_result))
+    for d, article_stat in _scan_assets(output_dir):
+        title = _asset_title(d.path, article_stat)
+        img_count = _count_files(os.path.join(d.path, "images"))
+        has_result = os.path.isfile(os.path.join(d.path, "result.json"))
+        slugs.append((d.name, title, img_count, has_result))
     if not slugs:
         print("\n  共享素材目录为空，请先使用 wp 命令生成文章")
         return
@@ -485,15 +820,11 @@ def cmd_xhs_local_list(args):
 def cmd_xhs_video(args):
     settings = get_settings()
     settings.check_or_exit()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     source = args.source
-    filepath = Path(source)
 
-    if filepath.exists() or (output_dir / source).exists():
-        if not filepath.exists():
-            filepath = output_dir / source
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    _, data = _resolve_source(source, output_dir)
+    if data is not None:
         post_id = data.get("post_id", 0)
     else:
         try:
@@ -501,21 +832,7 @@ def cmd_xhs_video(args):
         except ValueError:
             print(f"无效参数: {source}（应为文章 ID 或 JSON 文件路径）")
             sys.exit(1)
-        json_path = output_dir / f"xhs_post_{post_id}.json"
-        if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        else:
-            wp = _make_wp(settings)
-            post = wp.get_post(post_id)
-            wp.close()
-            llm = _make_llm(settings)
-            gen = XHSContentGenerator(llm)
-            content = gen.generate_from_post(post)
-            llm.close()
-            _save_xhs_content(content, post.id)
-            data = content.to_dict()
-            data["post_id"] = post_id
+        data = _xhs_data(post_id, args.force_regen)
 
     title = data.get("title", "")
     body = data.get("body", "")
@@ -527,40 +844,49 @@ def cmd_xhs_video(args):
     print(f"比例: {ratio}")
     print("=" * 50)
 
-    llm = _make_llm(settings)
+    llm = _get_llm()
     vg = _make_video_gen(settings, llm)
     save_dir = output_dir / f"video_{post_id}"
-    video_path = vg.generate_from_article(
-        title=title, body=body, save_dir=save_dir,
-        filename=f"xhs_video_{post_id}.mp4",
-        aspect_ratio=ratio, custom_prompt=custom_prompt,
-    )
-
-    if not video_path:
-        llm.close()
-        print("\n视频生成失败")
-        sys.exit(1)
-    print(f"\n无声视频已生成: {video_path}")
 
     # 配音（默认开启，--no-audio 关闭）
     no_audio = getattr(args, "no_audio", False)
+    custom_script = getattr(args, "script", None)
+    tts = None
     if not no_audio:
         voice = getattr(args, "voice", "zh-CN-XiaoyiNeural")
         rate = getattr(args, "rate", "+0%")
-        custom_script = getattr(args, "script", None)
+        tts = _make_tts(llm, voice=voice, rate=rate)
+
+    # 口播稿（DeepSeek）与视频渲染（火山引擎）互不依赖：渲染期间在后台线程提前生成口播稿
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        script_future = None
+        if tts and not custom_script:
+            script_future = pool.submit(tts.generate_script, title, body)
+        video_path = vg.generate_from_article(
+            title=title, body=body, save_dir=save_dir,
+            filename=f"xhs_video_{post_id}.mp4",
+            aspect_ratio=ratio, custom_prompt=custom_prompt,
+        )
+
+    if not video_path:
+        print("\n视频生成失败")
+        sys.exit(1)
+    print(f"\n无声视频已生成: {video_path}")
+
+    if tts:
+        script = script_future.result() if script_future else custom_script
         no_subtitle = getattr(args, "no_subtitle", False)
         use_avatar = getattr(args, "avatar", False)
         avatar_image = getattr(args, "avatar_image", None)
         avatar_pos = getattr(args, "avatar_position", "bottom_right")
         avatar_scale = getattr(args, "avatar_scale", 0.3)
 
-        tts = _make_tts(llm, voice=voice, rate=rate)
         final_path = tts.add_voiceover(
             video_path=video_path,
             title=title, body=body,
             save_dir=save_dir,
             filename_prefix=f"xhs_video_{post_id}",
-            custom_script=custom_script,
+            custom_script=script,
             with_subtitle=not no_subtitle,
             with_avatar=use_avatar,
             avatar_image=Path(avatar_image) if avatar_image else None,
@@ -577,71 +903,56 @@ def cmd_xhs_video(args):
         # 更新 JSON
         json_path = output_dir / f"xhs_post_{post_id}.json"
         if json_path.exists():
-            import json as _json
-            with open(json_path, "r", encoding="utf-8") as f:
-                jdata = _json.load(f)
+            jdata = load_json(json_path)
             jdata["final_video_path"] = str(video_path)
-            with open(json_path, "w", encoding="utf-8") as f:
-                _json.dump(jdata, f, ensure_ascii=False, indent=2)
-    llm.close()
+            save_json(json_path, jdata)
 
     if args.publish:
         hashtags = data.get("hashtags", [])
         full_body = body
         if hashtags:
-            tags_text = " ".join(f"#{t}" for t in hashtags)
-            full_body = f"{body}\n\n{tags_text}"
+            full_body = f"{body}\n\n{format_hashtags(hashtags)}"
         safe_title = title[:20]
         _do_xhs_publish_video(str(video_path), safe_title, full_body, args.headless)
 
 
 def cmd_xhs_video_publish(args):
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     source = args.source
-    filepath = Path(source)
 
-    if filepath.exists() or (output_dir / source).exists():
-        if not filepath.exists():
-            filepath = output_dir / source
-    else:
+    filepath, data = _resolve_source(source, output_dir)
+    if data is None:
         try:
             post_id = int(source)
-            filepath = output_dir / f"xhs_post_{post_id}.json"
         except ValueError:
             print(f"无效参数: {source}")
             sys.exit(1)
+        filepath = output_dir / f"xhs_post_{post_id}.json"
+        try:
+            data = load_json(filepath)
+        except FileNotFoundError:
+            print(f"文件不存在: {filepath}")
+            sys.exit(1)
 
-    if not filepath.exists():
-        print(f"文件不存在: {filepath}")
-        sys.exit(1)
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    # 优先使用有声视频，回退到无声视频
+    # 优先使用记录的视频（有声优先），再按优先级查找视频目录
     post_id = data.get("post_id", 0)
-    video_path = data.get("final_video_path") or data.get("video_path")
-    if not video_path or not Path(video_path).exists():
-        # 按优先级查找
-        candidates = [
-            output_dir / f"video_{post_id}" / f"xhs_video_{post_id}_final.mp4",
-            output_dir / f"video_{post_id}" / f"xhs_video_{post_id}.mp4",
-        ]
-        video_path = None
-        for c in candidates:
-            if c.exists():
-                video_path = str(c)
-                break
-        if not video_path:
-            print("未找到视频文件。请先用 xhs video 命令生成视频。")
-            sys.exit(1)
+    video_dir = output_dir / f"video_{post_id}"
+    found = _first_file((
+        data.get("final_video_path") or data.get("video_path"),
+        video_dir / f"xhs_video_{post_id}_final.mp4",
+        video_dir / f"xhs_video_{post_id}.mp4",
+    ))
+    if not found:
+        print("未找到视频文件。请先用 xhs video 命令生成视频。")
+        sys.exit(1)
+    video_path = str(found)
 
     title = data.get("title", "")[:20]
     body = data.get("body", "")
     hashtags = data.get("hashtags", [])
     full_body = body
     if hashtags:
-        full_body = f"{body}\n\n{' '.join(f'#{t}' for t in hashtags)}"
+        full_body = f"{body}\n\n{format_hashtags(hashtags)}"
 
     print(f"\n发布视频到小红书")
     print(f"视频: {video_path}")
@@ -649,8 +960,7 @@ def cmd_xhs_video_publish(args):
     print("=" * 50)
 
     if not args.yes:
-        confirm = input("\n确认发布到小红书？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到小红书？(y/N): "):
             print("已取消发布。")
             return
     _do_xhs_publish_video(video_path, title, full_body, args.headless)
@@ -659,38 +969,33 @@ def cmd_xhs_video_publish(args):
 def cmd_xhs_audio(args):
     """为已有无声视频添加配音"""
     settings = get_settings()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     source = args.source
-    filepath = Path(source)
 
-    if filepath.exists() or (output_dir / source).exists():
-        if not filepath.exists():
-            filepath = output_dir / source
-    else:
+    filepath, data = _resolve_source(source, output_dir)
+    if data is None:
         try:
             post_id = int(source)
-            filepath = output_dir / f"xhs_post_{post_id}.json"
         except ValueError:
             print(f"无效参数: {source}（应为 JSON 文件路径或文章 ID）")
             sys.exit(1)
+        filepath = output_dir / f"xhs_post_{post_id}.json"
+        try:
+            data = load_json(filepath)
+        except FileNotFoundError:
+            print(f"文件不存在: {filepath}")
+            sys.exit(1)
 
-    if not filepath.exists():
-        print(f"文件不存在: {filepath}")
-        sys.exit(1)
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    # 获取视频路径
-    video_path = data.get("video_path")
+    # 获取视频路径（记录的路径失效时回退到默认输出位置）
     post_id = data.get("post_id", 0)
-    if not video_path or not Path(video_path).exists():
-        fallback = output_dir / f"video_{post_id}" / f"xhs_video_{post_id}.mp4"
-        if fallback.exists():
-            video_path = str(fallback)
-        else:
-            print("未找到视频文件。请先用 xhs video 命令生成视频。")
-            sys.exit(1)
+    found = _first_file((
+        data.get("video_path"),
+        output_dir / f"video_{post_id}" / f"xhs_video_{post_id}.mp4",
+    ))
+    if not found:
+        print("未找到视频文件。请先用 xhs video 命令生成视频。")
+        sys.exit(1)
+    video_path = str(found)
 
     title = data.get("title", "")
     body = data.get("body", "")
@@ -709,7 +1014,7 @@ def cmd_xhs_audio(args):
     avatar_pos = getattr(args, "avatar_position", "bottom_right")
     avatar_scale = getattr(args, "avatar_scale", 0.3)
 
-    llm = _make_llm(settings)
+    llm = _get_llm()
     tts = _make_tts(llm, voice=voice, rate=rate)
     save_dir = Path(video_path).parent
     final_path = tts.add_voiceover(
@@ -725,13 +1030,11 @@ def cmd_xhs_audio(args):
         avatar_scale=avatar_scale,
         fal_key=settings.fal_key,
     )
-    llm.close()
 
     if final_path:
         # 更新 JSON
         data["final_video_path"] = str(final_path)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        save_json(filepath, data)
         print(f"\n有声视频已生成: {final_path}")
     else:
         print("\n配音失败")
@@ -755,7 +1058,7 @@ def cmd_xhs_comment(args):
     # 如果指定了 JSON 文件，从中读取笔记信息
     if args.my_note:
         note_path = Path(args.my_note)
-        output_dir = Path(settings.output_dir)
+        output_dir = _output_dir()
         if not note_path.exists():
             note_path = output_dir / args.my_note
         if not note_path.exists():
@@ -765,8 +1068,7 @@ def cmd_xhs_comment(args):
             # 尝试 {slug}/xhs_content.json
             note_path = output_dir / args.my_note / "xhs_content.json"
         if note_path.exists():
-            with open(note_path, "r", encoding="utf-8") as f:
-                note_data = json.load(f)
+            note_data = load_json(note_path)
             if not my_title:
                 my_title = note_data.get("title", "")
             if not my_summary:
@@ -794,8 +1096,7 @@ def cmd_xhs_comment(args):
     print("=" * 60)
 
     if not args.yes:
-        confirm = input("\n确认开始评论引流？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认开始评论引流？(y/N): "):
             print("已取消。")
             return
 
@@ -813,7 +1114,7 @@ def cmd_xhs_comment(args):
     )
 
     # 保存结果
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
     result_file = output_dir / f"comment_results_{keyword}_{int(time.time())}.json"
     save_json(result_file, results)
@@ -828,76 +1129,66 @@ def _print_comment_report(results: list, keyword: str, result_file: Path):
     fail_count = len(results) - success_count
 
     sep = "=" * 60
-    print(f"\n{sep}")
-    print("  评论引流结果")
-    print(sep)
-    print(f"  关键词:   {keyword}")
-    print(f"  总评论:   {len(results)} 条")
-    print(f"  成功:     {success_count} 条")
-    print(f"  失败:     {fail_count} 条")
+    lines = [
+        f"\n{sep}",
+        "  评论引流结果",
+        sep,
+        f"  关键词:   {keyword}",
+        f"  总评论:   {len(results)} 条",
+        f"  成功:     {success_count} 条",
+        f"  失败:     {fail_count} 条",
+    ]
 
     if results:
-        print(f"\n  详情:")
+        lines.append("\n  详情:")
         for i, r in enumerate(results, 1):
             status = "✓" if r.get("success") else "✗"
             title = r.get("note_title", "")[:25] or r.get("note_url", "")[-24:]
             comment = r.get("comment", "")[:40]
-            print(f"    {status} [{i}] {title}")
+            lines.append(f"    {status} [{i}] {title}")
             if comment:
-                print(f"        评论: {comment}...")
+                lines.append(f"        评论: {comment}...")
 
-    print(f"\n  结果已保存: {result_file}")
-    print(sep)
+    lines += [f"\n  结果已保存: {result_file}", sep]
+    print("\n".join(lines))
 
 
 def cmd_xhs_debug(args):
-    from xiaohongshu.publisher import diagnose_page
-    diagnose_page()
+    _xhs_publisher.diagnose_page()
 
 
 # ══════════════════════════════════════════════════════════════
 #  抖音 (dy) 子命令
 # ══════════════════════════════════════════════════════════════
 
-def _dy_output_dir() -> Path:
-    return Path(get_settings().output_dir)
-
-
 def _print_dy_preview(content: DouyinContent):
     sep = "=" * 60
-    print(f"\n{sep}")
-    print("  抖音图文笔记 预览")
-    print(sep)
-    print(f"  标题: {content.title}")
-    print(f"  正文 ({len(content.body)} 字):")
-    for line in content.body.split("\n")[:8]:
-        print(f"    {line}")
-    if content.body.count("\n") > 8:
-        print("    ...")
+    lines = [f"\n{sep}", "  抖音图文笔记 预览", sep, f"  标题: {content.title}"]
+    lines += _preview_body_lines(content.body)
     if content.hashtags:
-        print(f"  话题: {' '.join('#' + t for t in content.hashtags)}")
-    print(f"  图片: {len(content.image_urls)} 张")
-    print(sep)
+        lines.append(f"  话题: {format_hashtags(content.hashtags)}")
+    lines += [f"  图片: {len(content.image_urls)} 张", sep]
+    print("\n".join(lines))
 
 
 def _save_dy_content(content: DouyinContent, post_id: int):
-    output_dir = _dy_output_dir()
+    output_dir = _output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
     filepath = output_dir / f"dy_post_{post_id}.json"
     save_json(filepath, content.to_dict())
     logger.info("抖音文案已保存: %s", filepath)
 
 
-def _save_dy_content_local(content: DouyinContent, slug: str, asset_dir: Path):
+def _save_dy_content_local(content: DouyinContent, slug: str, asset_dir: Path,
+                           fsync: bool = True):
     filepath = asset_dir / "dy_content.json"
-    save_json(filepath, content.to_dict())
+    save_json(filepath, content.to_dict(), fsync=fsync)
     logger.info("抖音文案已保存: %s", filepath)
 
 
 def _do_dy_publish(content: DouyinContent, headless: bool = False) -> bool:
-    from douyin.publisher import publish_douyin_note
     logger.info("开始自动发布到抖音...")
-    success = publish_douyin_note(content, headless=headless)
+    success = _dy_publisher.publish_douyin_note(content, headless=headless)
     if success:
         print("\n  ✓ 抖音发布成功！")
     else:
@@ -908,15 +1199,7 @@ def _do_dy_publish(content: DouyinContent, headless: bool = False) -> bool:
 def cmd_dy_generate(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-    logger.info("已获取文章: [%d] %s", post.id, post.title)
-
-    llm = _make_llm(settings)
-    gen = DouyinContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, DouyinContentGenerator)
 
     _print_dy_preview(content)
     _save_dy_content(content, post.id)
@@ -925,45 +1208,20 @@ def cmd_dy_generate(args):
 def cmd_dy_publish(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-    logger.info("已获取文章: [%d] %s", post.id, post.title)
-
-    llm = _make_llm(settings)
-    gen = DouyinContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, DouyinContentGenerator)
 
     _print_dy_preview(content)
     _save_dy_content(content, post.id)
 
     if not args.yes:
-        confirm = input("\n确认发布到抖音？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到抖音？(y/N): "):
             print("已取消发布。")
             return
     _do_dy_publish(content, args.headless)
 
 
-def cmd_dy_republish(args):
-    filepath = Path(args.json_file)
-    output_dir = _dy_output_dir()
-    if not filepath.exists():
-        filepath = output_dir / args.json_file
-    # 如果传入的是目录（slug），自动查找 dy_content.json
-    if filepath.is_dir():
-        filepath = filepath / "dy_content.json"
-    if not filepath.exists():
-        print(f"  文件不存在: {args.json_file}")
-        print(f"  （尝试路径: {filepath}）")
-        sys.exit(1)
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    content = DouyinContent.from_dict(data)
-    logger.info("加载抖音文案: %s, 图片 %d 张", content.title, len(content.image_urls))
-
-    # 防护：如果图片为空但 JSON 中有 cover_urls，说明传入了其他平台的文件
+def _check_dy_images(content: DouyinContent, data: dict) -> None:
+    """抖音图文至少需要 1 张图片；误传了其他平台的文案文件（只有 cover_urls）时提示并退出"""
     if not content.image_urls and data.get("cover_urls"):
         print(f"\n  ⚠ 警告: 该 JSON 文件包含 cover_urls 但无 image_urls，可能不是抖音文案文件！")
         print(f"  抖音文案文件应为 dy_content.json 或 dy_post_*.json")
@@ -975,48 +1233,37 @@ def cmd_dy_republish(args):
         print(f"  请使用 'python main.py dy local <slug>' 重新生成文案（会自动包含图片）")
         sys.exit(1)
 
-    _print_dy_preview(content)
-    if not args.yes:
-        confirm = input("\n确认发布到抖音？(y/N): ").strip().lower()
-        if confirm != "y":
-            print("已取消发布。")
-            return
-    _do_dy_publish(content, args.headless)
+
+def cmd_dy_republish(args):
+    _republish(args, "dy_content.json", DouyinContent.from_dict,
+               _print_dy_preview, _do_dy_publish, "抖音", check=_check_dy_images)
 
 
 def cmd_dy_local(args):
     settings = get_settings()
     settings.check_or_exit()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     slug = args.slug
     asset_dir = output_dir / slug
     article_file = asset_dir / "article.json"
     image_dir = asset_dir / "images"
 
     if not article_file.exists():
-        available = [d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()] if output_dir.exists() else []
+        available = _available_slugs(output_dir)
         print(f"\n  素材不存在: {article_file}")
         if available:
             print(f"\n  可用的 slug:")
-            for s in sorted(available):
+            for s in available:
                 print(f"    - {s}")
         sys.exit(1)
 
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json_fields(article_file, ARTICLE_MESSAGE_FIELDS)
     logger.info("已加载本地素材: %s", slug)
 
-    image_paths = []
-    if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+    image_paths = _scan_images(image_dir)
     logger.info("本地图片 %d 张", len(image_paths))
 
-    llm = _make_llm(settings)
-    gen = DouyinContentGenerator(llm)
-    content = gen.generate_from_article(article, image_paths)
-    llm.close()
+    content = DouyinContentGenerator(_get_llm()).generate_from_article(article, image_paths)
 
     _print_dy_preview(content)
     _save_dy_content_local(content, slug, asset_dir)
@@ -1024,78 +1271,64 @@ def cmd_dy_local(args):
     if not args.publish:
         return
     if not args.yes:
-        confirm = input("\n确认发布到抖音？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到抖音？(y/N): "):
             print("已取消发布。")
             return
     _do_dy_publish(content, args.headless)
 
 
 def cmd_dy_local_list(args):
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     if not output_dir.exists():
         print(f"  共享素材目录不存在: {output_dir}")
         return
-    slugs = sorted([d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()])
-    if not slugs:
+    assets = _scan_slugs(output_dir)
+    if not assets:
         print("  暂无共享素材")
         return
-    print(f"\n  共 {len(slugs)} 个素材:")
-    for s in slugs:
-        dy_json = output_dir / s / "dy_content.json"
-        status = "✓" if dy_json.exists() else " "
+    print(f"\n  共 {len(assets)} 个素材:")
+    for s, names in assets.items():
+        status = "✓" if "dy_content.json" in names else " "
         print(f"  [{status}] {s}")
     print(f"\n  [✓] = 已生成抖音文案")
 
 
 def cmd_dy_debug(args):
-    from douyin.publisher import diagnose_douyin_page
-    diagnose_douyin_page()
+    _dy_publisher.diagnose_douyin_page()
 
 
 # ══════════════════════════════════════════════════════════════
 #  头条 (toutiao) 子命令
 # ══════════════════════════════════════════════════════════════
 
-def _toutiao_output_dir() -> Path:
-    return Path(get_settings().output_dir)
-
-
 def _print_toutiao_preview(content: ToutiaoContent):
     sep = "=" * 60
-    print(f"\n{sep}")
-    print("  今日头条文章 预览")
-    print(sep)
-    print(f"  标题: {content.title}")
-    print(f"  正文 ({len(content.body)} 字):")
-    for line in content.body.split("\n")[:8]:
-        print(f"    {line}")
-    if content.body.count("\n") > 8:
-        print("    ...")
+    lines = [f"\n{sep}", "  今日头条文章 预览", sep, f"  标题: {content.title}"]
+    lines += _preview_body_lines(content.body)
     if content.tags:
-        print(f"  标签: {', '.join(content.tags)}")
-    print(f"  封面: {len(content.cover_urls)} 张")
-    print(sep)
+        lines.append(f"  标签: {', '.join(content.tags)}")
+    lines += [f"  封面: {len(content.cover_urls)} 张", sep]
+    print("\n".join(lines))
 
 
 def _save_toutiao_content(content: ToutiaoContent, post_id: int):
-    output_dir = _toutiao_output_dir()
+    output_dir = _output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
     filepath = output_dir / f"toutiao_post_{post_id}.json"
     save_json(filepath, content.to_dict())
     logger.info("头条文案已保存: %s", filepath)
 
 
-def _save_toutiao_content_local(content: ToutiaoContent, slug: str, asset_dir: Path):
+def _save_toutiao_content_local(content: ToutiaoContent, slug: str, asset_dir: Path,
+                                fsync: bool = True):
     filepath = asset_dir / "toutiao_content.json"
-    save_json(filepath, content.to_dict())
+    save_json(filepath, content.to_dict(), fsync=fsync)
     logger.info("头条文案已保存: %s", filepath)
 
 
 def _do_toutiao_publish(content: ToutiaoContent, headless: bool = False) -> bool:
-    from toutiao.publisher import publish_toutiao_article
     logger.info("开始自动发布到头条...")
-    success = publish_toutiao_article(content, headless=headless)
+    success = _toutiao_publisher.publish_toutiao_article(content, headless=headless)
     if success:
         print("\n  ✓ 头条发布成功！")
     else:
@@ -1106,15 +1339,7 @@ def _do_toutiao_publish(content: ToutiaoContent, headless: bool = False) -> bool
 def cmd_toutiao_generate(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-    logger.info("已获取文章: [%d] %s", post.id, post.title)
-
-    llm = _make_llm(settings)
-    gen = ToutiaoContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, ToutiaoContentGenerator)
 
     _print_toutiao_preview(content)
     _save_toutiao_content(content, post.id)
@@ -1123,83 +1348,48 @@ def cmd_toutiao_generate(args):
 def cmd_toutiao_publish(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-
-    llm = _make_llm(settings)
-    gen = ToutiaoContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, ToutiaoContentGenerator)
 
     _print_toutiao_preview(content)
     _save_toutiao_content(content, post.id)
 
     if not args.yes:
-        confirm = input("\n确认发布到头条？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到头条？(y/N): "):
             print("已取消发布。")
             return
     _do_toutiao_publish(content, args.headless)
 
 
 def cmd_toutiao_republish(args):
-    filepath = Path(args.json_file)
-    output_dir = _toutiao_output_dir()
-    if not filepath.exists():
-        filepath = output_dir / args.json_file
-    if filepath.is_dir():
-        filepath = filepath / "toutiao_content.json"
-    if not filepath.exists():
-        print(f"  文件不存在: {args.json_file}")
-        print(f"  （尝试路径: {filepath}）")
-        sys.exit(1)
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    content = ToutiaoContent.from_dict(data)
-    logger.info("加载头条文案: %s, 封面 %d 张", content.title, len(content.cover_urls))
-    _print_toutiao_preview(content)
-    if not args.yes:
-        confirm = input("\n确认发布到头条？(y/N): ").strip().lower()
-        if confirm != "y":
-            print("已取消发布。")
-            return
-    _do_toutiao_publish(content, args.headless)
+    _republish(args, "toutiao_content.json", ToutiaoContent.from_dict,
+               _print_toutiao_preview, _do_toutiao_publish, "头条")
 
 
 def cmd_toutiao_local(args):
     settings = get_settings()
     settings.check_or_exit()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     slug = args.slug
     asset_dir = output_dir / slug
     article_file = asset_dir / "article.json"
     image_dir = asset_dir / "images"
 
     if not article_file.exists():
-        available = [d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()] if output_dir.exists() else []
+        available = _available_slugs(output_dir)
         print(f"\n  素材不存在: {article_file}")
         if available:
             print(f"\n  可用的 slug:")
-            for s in sorted(available):
+            for s in available:
                 print(f"    - {s}")
         sys.exit(1)
 
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json_fields(article_file, ARTICLE_MESSAGE_FIELDS)
     logger.info("已加载本地素材: %s", slug)
 
-    image_paths = []
-    if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+    image_paths = _scan_images(image_dir)
     logger.info("本地图片 %d 张", len(image_paths))
 
-    llm = _make_llm(settings)
-    gen = ToutiaoContentGenerator(llm)
-    content = gen.generate_from_article(article, image_paths)
-    llm.close()
+    content = ToutiaoContentGenerator(_get_llm()).generate_from_article(article, image_paths)
 
     _print_toutiao_preview(content)
     _save_toutiao_content_local(content, slug, asset_dir)
@@ -1207,80 +1397,66 @@ def cmd_toutiao_local(args):
     if not args.publish:
         return
     if not args.yes:
-        confirm = input("\n确认发布到头条？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到头条？(y/N): "):
             print("已取消发布。")
             return
     _do_toutiao_publish(content, args.headless)
 
 
 def cmd_toutiao_local_list(args):
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     if not output_dir.exists():
         print(f"  共享素材目录不存在: {output_dir}")
         return
-    slugs = sorted([d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()])
-    if not slugs:
+    assets = _scan_slugs(output_dir)
+    if not assets:
         print("  暂无共享素材")
         return
-    print(f"\n  共 {len(slugs)} 个素材:")
-    for s in slugs:
-        tt_json = output_dir / s / "toutiao_content.json"
-        status = "✓" if tt_json.exists() else " "
+    print(f"\n  共 {len(assets)} 个素材:")
+    for s, names in assets.items():
+        status = "✓" if "toutiao_content.json" in names else " "
         print(f"  [{status}] {s}")
     print(f"\n  [✓] = 已生成头条文案")
 
 
 def cmd_toutiao_debug(args):
-    from toutiao.publisher import diagnose_toutiao_page
-    diagnose_toutiao_page()
+    _toutiao_publisher.diagnose_toutiao_page()
 
 
 # ══════════════════════════════════════════════════════════════
 #  知乎 (zh) 子命令
 # ══════════════════════════════════════════════════════════════
 
-def _zh_output_dir() -> Path:
-    return Path(get_settings().output_dir)
-
-
 def _print_zh_preview(content: ZhihuContent):
     sep = "=" * 60
-    print(f"\n{sep}")
-    print("  知乎文章 预览")
-    print(sep)
-    print(f"  标题: {content.title}")
+    lines = [f"\n{sep}", "  知乎文章 预览", sep, f"  标题: {content.title}"]
     if content.summary:
-        print(f"  摘要: {content.summary[:80]}...")
-    print(f"  正文 ({len(content.body)} 字):")
-    for line in content.body.split("\n")[:8]:
-        print(f"    {line}")
-    if content.body.count("\n") > 8:
-        print("    ...")
+        lines.append(f"  摘要: {content.summary[:80]}...")
+    lines += _preview_body_lines(content.body)
     if content.tags:
-        print(f"  标签: {', '.join(content.tags)}")
-    print(f"  封面: {len(content.cover_urls)} 张")
-    print(sep)
+        lines.append(f"  标签: {', '.join(content.tags)}")
+    lines += [f"  封面: {len(content.cover_urls)} 张", sep]
+    print("\n".join(lines))
 
 
 def _save_zh_content(content: ZhihuContent, post_id: int):
-    output_dir = _zh_output_dir()
+    output_dir = _output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
     filepath = output_dir / f"zh_post_{post_id}.json"
     save_json(filepath, content.to_dict())
     logger.info("知乎文案已保存: %s", filepath)
 
 
-def _save_zh_content_local(content: ZhihuContent, slug: str, asset_dir: Path):
+def _save_zh_content_local(content: ZhihuContent, slug: str, asset_dir: Path,
+                           fsync: bool = True):
     filepath = asset_dir / "zh_content.json"
-    save_json(filepath, content.to_dict())
+    save_json(filepath, content.to_dict(), fsync=fsync)
     logger.info("知乎文案已保存: %s", filepath)
 
 
 def _do_zh_publish(content: ZhihuContent, headless: bool = False) -> bool:
-    from zhihu.publisher import publish_zhihu_article
     logger.info("开始自动发布到知乎...")
-    success = publish_zhihu_article(content, headless=headless)
+    success = _zh_publisher.publish_zhihu_article(content, headless=headless)
     if success:
         print("\n  ✓ 知乎发布成功！")
     else:
@@ -1291,15 +1467,7 @@ def _do_zh_publish(content: ZhihuContent, headless: bool = False) -> bool:
 def cmd_zh_generate(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-    logger.info("已获取文章: [%d] %s", post.id, post.title)
-
-    llm = _make_llm(settings)
-    gen = ZhihuContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, ZhihuContentGenerator)
 
     _print_zh_preview(content)
     _save_zh_content(content, post.id)
@@ -1308,83 +1476,48 @@ def cmd_zh_generate(args):
 def cmd_zh_publish(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-
-    llm = _make_llm(settings)
-    gen = ZhihuContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, ZhihuContentGenerator)
 
     _print_zh_preview(content)
     _save_zh_content(content, post.id)
 
     if not args.yes:
-        confirm = input("\n确认发布到知乎？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到知乎？(y/N): "):
             print("已取消发布。")
             return
     _do_zh_publish(content, args.headless)
 
 
 def cmd_zh_republish(args):
-    filepath = Path(args.json_file)
-    output_dir = _zh_output_dir()
-    if not filepath.exists():
-        filepath = output_dir / args.json_file
-    if filepath.is_dir():
-        filepath = filepath / "zh_content.json"
-    if not filepath.exists():
-        print(f"  文件不存在: {args.json_file}")
-        print(f"  （尝试路径: {filepath}）")
-        sys.exit(1)
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    content = ZhihuContent.from_dict(data)
-    logger.info("加载知乎文案: %s, 封面 %d 张", content.title, len(content.cover_urls))
-    _print_zh_preview(content)
-    if not args.yes:
-        confirm = input("\n确认发布到知乎？(y/N): ").strip().lower()
-        if confirm != "y":
-            print("已取消发布。")
-            return
-    _do_zh_publish(content, args.headless)
+    _republish(args, "zh_content.json", ZhihuContent.from_dict,
+               _print_zh_preview, _do_zh_publish, "知乎")
 
 
 def cmd_zh_local(args):
     settings = get_settings()
     settings.check_or_exit()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     slug = args.slug
     asset_dir = output_dir / slug
     article_file = asset_dir / "article.json"
     image_dir = asset_dir / "images"
 
     if not article_file.exists():
-        available = [d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()] if output_dir.exists() else []
+        available = _available_slugs(output_dir)
         print(f"\n  素材不存在: {article_file}")
         if available:
             print(f"\n  可用的 slug:")
-            for s in sorted(available):
+            for s in available:
                 print(f"    - {s}")
         sys.exit(1)
 
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json_fields(article_file, ARTICLE_MESSAGE_FIELDS)
     logger.info("已加载本地素材: %s", slug)
 
-    image_paths = []
-    if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+    image_paths = _scan_images(image_dir)
     logger.info("本地图片 %d 张", len(image_paths))
 
-    llm = _make_llm(settings)
-    gen = ZhihuContentGenerator(llm)
-    content = gen.generate_from_article(article, image_paths)
-    llm.close()
+    content = ZhihuContentGenerator(_get_llm()).generate_from_article(article, image_paths)
 
     _print_zh_preview(content)
     _save_zh_content_local(content, slug, asset_dir)
@@ -1392,71 +1525,58 @@ def cmd_zh_local(args):
     if not args.publish:
         return
     if not args.yes:
-        confirm = input("\n确认发布到知乎？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到知乎？(y/N): "):
             print("已取消发布。")
             return
     _do_zh_publish(content, args.headless)
 
 
 def cmd_zh_local_list(args):
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     if not output_dir.exists():
         print(f"  共享素材目录不存在: {output_dir}")
         return
-    slugs = sorted([d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()])
-    if not slugs:
+    assets = _scan_slugs(output_dir)
+    if not assets:
         print("  暂无共享素材")
         return
-    print(f"\n  共 {len(slugs)} 个素材:")
-    for s in slugs:
-        zh_json = output_dir / s / "zh_content.json"
-        status = "✓" if zh_json.exists() else " "
+    print(f"\n  共 {len(assets)} 个素材:")
+    for s, names in assets.items():
+        status = "✓" if "zh_content.json" in names else " "
         print(f"  [{status}] {s}")
     print(f"\n  [✓] = 已生成知乎文案")
 
 
 def cmd_zh_debug(args):
-    from zhihu.publisher import diagnose_zhihu_page
-    diagnose_zhihu_page()
+    _zh_publisher.diagnose_zhihu_page()
 
 
 # ══════════════════════════════════════════════════════════════
 #  视频号 (channels) 子命令
 # ══════════════════════════════════════════════════════════════
 
-def _channels_output_dir() -> Path:
-    return Path(get_settings().output_dir)
-
-
 def _print_channels_preview(content: ChannelsContent):
     sep = "=" * 60
-    print(f"\n{sep}")
-    print("  微信视频号动态 预览")
-    print(sep)
+    lines = [f"\n{sep}", "  微信视频号动态 预览", sep]
     if content.title:
-        print(f"  标题: {content.title}")
-    print(f"  正文 ({len(content.body)} 字):")
-    for line in content.body.split("\n")[:8]:
-        print(f"    {line}")
-    if content.body.count("\n") > 8:
-        print("    ...")
+        lines.append(f"  标题: {content.title}")
+    lines += _preview_body_lines(content.body)
     if content.hashtags:
-        print(f"  话题: {' '.join('#' + t for t in content.hashtags)}")
-    print(f"  图片: {len(content.image_urls)} 张")
-    print(sep)
+        lines.append(f"  话题: {format_hashtags(content.hashtags)}")
+    lines += [f"  图片: {len(content.image_urls)} 张", sep]
+    print("\n".join(lines))
 
 
-def _save_channels_content_local(content: ChannelsContent, slug: str, asset_dir: Path):
+def _save_channels_content_local(content: ChannelsContent, slug: str, asset_dir: Path,
+                                 fsync: bool = True):
     filepath = asset_dir / "channels_content.json"
-    save_json(filepath, content.to_dict())
+    save_json(filepath, content.to_dict(), fsync=fsync)
     logger.info("视频号文案已保存: %s", filepath)
 
 
 def _do_channels_publish(content: ChannelsContent, headless: bool = False) -> bool:
-    from channels.publisher import publish_channels_text
     logger.info("开始自动发布到视频号...")
-    success = publish_channels_text(
+    success = _channels_publisher.publish_channels_text(
         body=content.full_text(),
         image_sources=content.image_urls,
         title=content.title,
@@ -1470,62 +1590,35 @@ def _do_channels_publish(content: ChannelsContent, headless: bool = False) -> bo
 
 
 def cmd_channels_republish(args):
-    filepath = Path(args.json_file)
-    output_dir = _channels_output_dir()
-    if not filepath.exists():
-        filepath = output_dir / args.json_file
-    if filepath.is_dir():
-        filepath = filepath / "channels_content.json"
-    if not filepath.exists():
-        print(f"  文件不存在: {args.json_file}")
-        print(f"  （尝试路径: {filepath}）")
-        sys.exit(1)
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    content = ChannelsContent.from_dict(data)
-    logger.info("加载视频号文案: %s", content.summary())
-    _print_channels_preview(content)
-    if not args.yes:
-        confirm = input("\n确认发布到视频号？(y/N): ").strip().lower()
-        if confirm != "y":
-            print("已取消发布。")
-            return
-    _do_channels_publish(content, args.headless)
+    _republish(args, "channels_content.json", ChannelsContent.from_dict,
+               _print_channels_preview, _do_channels_publish, "视频号")
 
 
 def cmd_channels_local(args):
     settings = get_settings()
     settings.check_or_exit()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     slug = args.slug
     asset_dir = output_dir / slug
     article_file = asset_dir / "article.json"
     image_dir = asset_dir / "images"
 
     if not article_file.exists():
-        available = [d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()] if output_dir.exists() else []
+        available = _available_slugs(output_dir)
         print(f"\n  素材不存在: {article_file}")
         if available:
             print(f"\n  可用的 slug:")
-            for s in sorted(available):
+            for s in available:
                 print(f"    - {s}")
         sys.exit(1)
 
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json_fields(article_file, ARTICLE_MESSAGE_FIELDS)
     logger.info("已加载本地素材: %s", slug)
 
-    image_paths = []
-    if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+    image_paths = _scan_images(image_dir)
     logger.info("本地图片 %d 张", len(image_paths))
 
-    llm = _make_llm(settings)
-    gen = ChannelsContentGenerator(llm)
-    content = gen.generate_from_article(article, image_paths)
-    llm.close()
+    content = ChannelsContentGenerator(_get_llm()).generate_from_article(article, image_paths)
 
     _print_channels_preview(content)
     _save_channels_content_local(content, slug, asset_dir)
@@ -1533,80 +1626,66 @@ def cmd_channels_local(args):
     if not args.publish:
         return
     if not args.yes:
-        confirm = input("\n确认发布到视频号？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到视频号？(y/N): "):
             print("已取消发布。")
             return
     _do_channels_publish(content, args.headless)
 
 
 def cmd_channels_local_list(args):
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     if not output_dir.exists():
         print(f"  共享素材目录不存在: {output_dir}")
         return
-    slugs = sorted([d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()])
-    if not slugs:
+    assets = _scan_slugs(output_dir)
+    if not assets:
         print("  暂无共享素材")
         return
-    print(f"\n  共 {len(slugs)} 个素材:")
-    for s in slugs:
-        ch_json = output_dir / s / "channels_content.json"
-        status = "✓" if ch_json.exists() else " "
+    print(f"\n  共 {len(assets)} 个素材:")
+    for s, names in assets.items():
+        status = "✓" if "channels_content.json" in names else " "
         print(f"  [{status}] {s}")
     print(f"\n  [✓] = 已生成视频号文案")
 
 
 def cmd_channels_debug(args):
-    from channels.publisher import diagnose_channels_page
-    diagnose_channels_page()
+    _channels_publisher.diagnose_channels_page()
 
 
 # ══════════════════════════════════════════════════════════════
 #  微博 (wb) 子命令
 # ══════════════════════════════════════════════════════════════
 
-def _wb_output_dir() -> Path:
-    return Path(get_settings().output_dir)
-
-
 def _print_wb_preview(content: WeiboContent):
     sep = "=" * 60
-    print(f"\n{sep}")
-    print("  微博文章 预览")
-    print(sep)
-    print(f"  标题: {content.title}")
+    lines = [f"\n{sep}", "  微博文章 预览", sep, f"  标题: {content.title}"]
     if content.summary:
-        print(f"  摘要: {content.summary[:80]}...")
-    print(f"  正文 ({len(content.body)} 字):")
-    for line in content.body.split("\n")[:8]:
-        print(f"    {line}")
-    if content.body.count("\n") > 8:
-        print("    ...")
+        lines.append(f"  摘要: {content.summary[:80]}...")
+    lines += _preview_body_lines(content.body)
     if content.tags:
-        print(f"  话题: {' '.join('#' + t + '#' for t in content.tags)}")
-    print(f"  封面: {len(content.cover_urls)} 张")
-    print(sep)
+        lines.append(f"  话题: {' '.join('#' + t + '#' for t in content.tags)}")
+    lines += [f"  封面: {len(content.cover_urls)} 张", sep]
+    print("\n".join(lines))
 
 
 def _save_wb_content(content: WeiboContent, post_id: int):
-    output_dir = _wb_output_dir()
+    output_dir = _output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
     filepath = output_dir / f"wb_post_{post_id}.json"
     save_json(filepath, content.to_dict())
     logger.info("微博文案已保存: %s", filepath)
 
 
-def _save_wb_content_local(content: WeiboContent, slug: str, asset_dir: Path):
+def _save_wb_content_local(content: WeiboContent, slug: str, asset_dir: Path,
+                           fsync: bool = True):
     filepath = asset_dir / "wb_content.json"
-    save_json(filepath, content.to_dict())
+    save_json(filepath, content.to_dict(), fsync=fsync)
     logger.info("微博文案已保存: %s", filepath)
 
 
 def _do_wb_publish(content: WeiboContent, headless: bool = False) -> bool:
-    from weibo.publisher import publish_weibo_article
     logger.info("开始自动发布到微博...")
-    success = publish_weibo_article(content, headless=headless)
+    success = _wb_publisher.publish_weibo_article(content, headless=headless)
     if success:
         print("\n  ✓ 微博文章发布成功！")
     else:
@@ -1615,9 +1694,8 @@ def _do_wb_publish(content: WeiboContent, headless: bool = False) -> bool:
 
 
 def _do_wb_publish_video(video_path: str, title: str, body: str, headless: bool = False) -> bool:
-    from weibo.publisher import publish_weibo_video
     logger.info("开始自动发布视频到微博...")
-    success = publish_weibo_video(video_path, title, body, headless=headless)
+    success = _wb_publisher.publish_weibo_video(video_path, title, body, headless=headless)
     if success:
         print("\n  ✓ 微博视频发布成功！")
     else:
@@ -1628,15 +1706,7 @@ def _do_wb_publish_video(video_path: str, title: str, body: str, headless: bool
 def cmd_wb_generate(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-    logger.info("已获取文章: [%d] %s", post.id, post.title)
-
-    llm = _make_llm(settings)
-    gen = WeiboContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, WeiboContentGenerator)
 
     _print_wb_preview(content)
     _save_wb_content(content, post.id)
@@ -1645,83 +1715,48 @@ def cmd_wb_generate(args):
 def cmd_wb_publish(args):
     settings = get_settings()
     settings.check_or_exit()
-    wp = _make_wp(settings)
-    post = wp.get_post(args.post_id)
-    wp.close()
-
-    llm = _make_llm(settings)
-    gen = WeiboContentGenerator(llm)
-    content = gen.generate_from_post(post)
-    llm.close()
+    post, content = _fetch_and_generate(args.post_id, WeiboContentGenerator)
 
     _print_wb_preview(content)
     _save_wb_content(content, post.id)
 
     if not args.yes:
-        confirm = input("\n确认发布到微博？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到微博？(y/N): "):
             print("已取消发布。")
             return
     _do_wb_publish(content, args.headless)
 
 
 def cmd_wb_republish(args):
-    filepath = Path(args.json_file)
-    output_dir = _wb_output_dir()
-    if not filepath.exists():
-        filepath = output_dir / args.json_file
-    if filepath.is_dir():
-        filepath = filepath / "wb_content.json"
-    if not filepath.exists():
-        print(f"  文件不存在: {args.json_file}")
-        print(f"  （尝试路径: {filepath}）")
-        sys.exit(1)
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    content = WeiboContent.from_dict(data)
-    logger.info("加载微博文案: %s, 封面 %d 张", content.title, len(content.cover_urls))
-    _print_wb_preview(content)
-    if not args.yes:
-        confirm = input("\n确认发布到微博？(y/N): ").strip().lower()
-        if confirm != "y":
-            print("已取消发布。")
-            return
-    _do_wb_publish(content, args.headless)
+    _republish(args, "wb_content.json", WeiboContent.from_dict,
+               _print_wb_preview, _do_wb_publish, "微博")
 
 
 def cmd_wb_local(args):
     settings = get_settings()
     settings.check_or_exit()
-    output_dir = Path(settings.output_dir)
+    output_dir = _output_dir()
     slug = args.slug
     asset_dir = output_dir / slug
     article_file = asset_dir / "article.json"
     image_dir = asset_dir / "images"
 
     if not article_file.exists():
-        available = [d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()] if output_dir.exists() else []
+        available = _available_slugs(output_dir)
         print(f"\n  素材不存在: {article_file}")
         if available:
             print(f"\n  可用的 slug:")
-            for s in sorted(available):
+            for s in available:
                 print(f"    - {s}")
         sys.exit(1)
 
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json_fields(article_file, ARTICLE_MESSAGE_FIELDS)
     logger.info("已加载本地素材: %s", slug)
 
-    image_paths = []
-    if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+    image_paths = _scan_images(image_dir)
     logger.info("本地图片 %d 张", len(image_paths))
 
-    llm = _make_llm(settings)
-    gen = WeiboContentGenerator(llm)
-    content = gen.generate_from_article(article, image_paths)
-    llm.close()
+    content = WeiboContentGenerator(_get_llm()).generate_from_article(article, image_paths)
 
     _print_wb_preview(content)
     _save_wb_content_local(content, slug, asset_dir)
@@ -1729,72 +1764,61 @@ def cmd_wb_local(args):
     if not args.publish:
         return
     if not args.yes:
-        confirm = input("\n确认发布到微博？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到微博？(y/N): "):
             print("已取消发布。")
             return
     _do_wb_publish(content, args.headless)
 
 
 def cmd_wb_local_list(args):
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     if not output_dir.exists():
         print(f"  共享素材目录不存在: {output_dir}")
         return
-    slugs = sorted([d.name for d in output_dir.iterdir() if d.is_dir() and (d / "article.json").exists()])
-    if not slugs:
+    assets = _scan_slugs(output_dir)
+    if not assets:
         print("  暂无共享素材")
         return
-    print(f"\n  共 {len(slugs)} 个素材:")
-    for s in slugs:
-        wb_json = output_dir / s / "wb_content.json"
-        status = "✓" if wb_json.exists() else " "
+    print(f"\n  共 {len(assets)} 个素材:")
+    for s, names in assets.items():
+        status = "✓" if "wb_content.json" in names else " "
         print(f"  [{status}] {s}")
     print(f"\n  [✓] = 已生成微博文案")
 
 
 def cmd_wb_video(args):
     """微博视频发布：从已有 JSON 文案 + 已有视频文件发布"""
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     source = args.source
-    filepath = Path(source)
+    filepath = _resolve_content_file(source, output_dir, "wb_content.json")
 
-    if filepath.exists() or (output_dir / source).exists():
-        if not filepath.exists():
-            filepath = output_dir / source
-    else:
+    if filepath is None:
         try:
             post_id = int(source)
-            filepath = output_dir / f"wb_post_{post_id}.json"
         except ValueError:
             print(f"无效参数: {source}")
             sys.exit(1)
+        filepath = output_dir / f"wb_post_{post_id}.json"
+        if not filepath.is_file():
+            print(f"文件不存在: {filepath}")
+            sys.exit(1)
 
-    if not filepath.exists():
-        print(f"文件不存在: {filepath}")
-        sys.exit(1)
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(filepath)
 
     # 查找视频文件
     post_id = data.get("post_id", 0)
     video_path = data.get("final_video_path") or data.get("video_path")
     if not video_path or not Path(video_path).exists():
-        candidates = [
-            output_dir / f"video_{post_id}" / f"wb_video_{post_id}_final.mp4",
-            output_dir / f"video_{post_id}" / f"wb_video_{post_id}.mp4",
-            output_dir / f"video_{post_id}" / f"xhs_video_{post_id}_final.mp4",
-            output_dir / f"video_{post_id}" / f"xhs_video_{post_id}.mp4",
-        ]
-        video_path = None
-        for c in candidates:
-            if c.exists():
-                video_path = str(c)
-                break
-        if not video_path:
+        found = _find_in_dir(output_dir / f"video_{post_id}", (
+            f"wb_video_{post_id}_final.mp4",
+            f"wb_video_{post_id}.mp4",
+            f"xhs_video_{post_id}_final.mp4",
+            f"xhs_video_{post_id}.mp4",
+        ))
+        if not found:
             print("未找到视频文件。请先用 xhs video 或其他命令生成视频。")
             sys.exit(1)
+        video_path = str(found)
 
     title = data.get("title", "")[:40]
     body = data.get("body", "")
@@ -1809,16 +1833,14 @@ def cmd_wb_video(args):
     print("=" * 50)
 
     if not args.yes:
-        confirm = input("\n确认发布到微博？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到微博？(y/N): "):
             print("已取消发布。")
             return
     _do_wb_publish_video(video_path, title, full_body, args.headless)
 
 
 def cmd_wb_debug(args):
-    from weibo.publisher import diagnose_weibo_page
-    diagnose_weibo_page()
+    _wb_publisher.diagnose_weibo_page()
 
 
 # ══════════════════════════════════════════════════════════════
@@ -1870,12 +1892,12 @@ def cmd_story_generate(args):
     print(f"  输出:     {output_dir}")
     print("=" * 60)
 
-    llm = _make_llm(settings)
+    from shared.media.story_video import run_story_video
 
     t0 = time.monotonic()
     result = run_story_video(
         settings=settings,
-        llm=llm,
+        llm=_get_llm(),
         theme=theme,
         output_dir=output_dir,
         scene=scene,
@@ -1888,7 +1910,6 @@ def cmd_story_generate(args):
         voice_rate=voice_rate,
         storyboard_json=storyboard_json,
     )
-    llm.close()
 
     elapsed = time.monotonic() - t0
     logger.info("总耗时: %.1fs", elapsed)
@@ -1896,12 +1917,15 @@ def cmd_story_generate(args):
     # 发布
     if args.publish and result.final_video_path:
         if not args.yes:
-            confirm = input("\n确认发布到所有平台？(y/N): ").strip().lower()
-            if confirm != "y":
+            if not confirm("\n确认发布到所有平台？(y/N): "):
                 print("已取消发布。文案已保存，可使用各平台 republish 命令单独发布。")
                 return
 
-        _story_publish_all(result, args.headless)
+        _story_publish_all(result, args.headless, parallel=args.parallel)
+
+
+# 故事视频成片的候选文件名（按优先级）
+_STORY_VIDEO_NAMES = ("final_final.mp4", "final.mp4", "concat.mp4")
 
 
 def cmd_story_publish(args):
@@ -1914,22 +1938,20 @@ def cmd_story_publish(args):
         print(f"  目录不存在: {args.dir}")
         sys.exit(1)
 
+    # 一次 scandir 取得目录内容，视频与各平台文案都用集合判断，不再逐个 stat
+    with os.scandir(output_dir) as it:
+        present = {e.name for e in it if e.is_file()}
+
+    # storyboard.json 只读一次：既用于回退查找视频，也用于构建 StoryBoard
+    storyboard_data = load_json(output_dir / "storyboard.json") if "storyboard.json" in present else None
+
     # 查找视频文件
-    video_path = None
-    for name in ["final_final.mp4", "final.mp4", "concat.mp4"]:
-        candidate = output_dir / name
-        if candidate.exists():
-            video_path = candidate
-            break
+    video_path = next((output_dir / name for name in _STORY_VIDEO_NAMES if name in present), None)
     # 尝试从 JSON 读取
-    if not video_path:
-        storyboard_file = output_dir / "storyboard.json"
-        if storyboard_file.exists():
-            with open(storyboard_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            vp = data.get("video_path", "")
-            if vp and Path(vp).exists():
-                video_path = Path(vp)
+    if not video_path and storyboard_data:
+        vp = storyboard_data.get("video_path", "")
+        if vp and Path(vp).exists():
+            video_path = Path(vp)
 
     if not video_path or not video_path.exists():
         print("  未找到视频文件。请先运行 story generate 生成视频。")
@@ -1940,10 +1962,8 @@ def cmd_story_publish(args):
 
     # 构建 result 对象
     from shared.media.story_video import StoryVideoResult, StoryBoard, PlatformContent
-    storyboard_file = output_dir / "storyboard.json"
-    if storyboard_file.exists():
-        with open(storyboard_file, "r", encoding="utf-8") as f:
-            board = StoryBoard.from_dict(json.load(f))
+    if storyboard_data is not None:
+        board = StoryBoard.from_dict(storyboard_data)
     else:
         board = StoryBoard(project="", theme="", scene="", style="")
 
@@ -1963,63 +1983,59 @@ def cmd_story_publish(args):
         "weibo": "wb_content.json",
     }
     for key, filename in file_map.items():
-        fp = output_dir / filename
-        if fp.exists():
-            with open(fp, "r", encoding="utf-8") as f:
-                result.platform_contents[key] = PlatformContent.from_dict(json.load(f))
+        if filename in present:
+            result.platform_contents[key] = PlatformContent.from_dict(load_json(output_dir / filename))
 
     if not result.platform_contents:
         print("  未找到平台文案 JSON。请先运行 story generate。")
         sys.exit(1)
 
     if not args.yes:
-        confirm = input("\n确认发布到所有平台？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到所有平台？(y/N): "):
             print("已取消发布。")
             return
 
-    _story_publish_all(result, args.headless)
+    _story_publish_all(result, args.headless, parallel=args.parallel)
 
 
 def cmd_story_list(args):
     """列出已生成的故事视频"""
-    output_dir = Path(get_settings().output_dir)
+    output_dir = _output_dir()
     if not output_dir.exists():
         print(f"  输出目录不存在: {output_dir}")
         return
     projects = []
-    for d in sorted(output_dir.iterdir()):
-        sb = d / "storyboard.json"
-        if d.is_dir() and sb.exists():
-            with open(sb, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            has_video = any(
-                (d / n).exists() for n in ["final_final.mp4", "final.mp4", "concat.mp4"]
-            ) or (data.get("video_path", "") and Path(data.get("video_path", "")).exists())
-            has_content = any((d / f).exists() for f in ["xhs_content.json", "dy_content.json"])
-            projects.append((d.name, data.get("project", "-"), len(data.get("shots", [])), has_video, has_content))
+    for slug, names in _scan_slugs(output_dir, marker="storyboard.json").items():
+        data = load_json(output_dir / slug / "storyboard.json")
+        video_path = data.get("video_path", "")
+        has_video = not names.isdisjoint(_STORY_VIDEO_NAMES) or bool(video_path and Path(video_path).exists())
+        has_content = not names.isdisjoint(("xhs_content.json", "dy_content.json"))
+        projects.append((slug, data.get("project", "-"), len(data.get("shots", [])), has_video, has_content))
 
     if not projects:
         print("  暂无故事视频项目")
         return
 
-    print(f"\n{'slug':<35}  {'镜头':>4}  {'视频':>4}  {'文案':>4}  项目名称")
-    print("-" * 90)
+    lines = [f"\n{'slug':<35}  {'镜头':>4}  {'视频':>4}  {'文案':>4}  项目名称", "-" * 90]
     for slug, project, shots, has_video, has_content in projects:
         v = "✓" if has_video else " "
         c = "✓" if has_content else " "
-        print(f"{slug:<35}  {shots:>4}  {v:>4}  {c:>4}  {project}")
-    print(f"\n共 {len(projects)} 个项目  目录: {output_dir}")
+        lines.append(f"{slug:<35}  {shots:>4}  {v:>4}  {c:>4}  {project}")
+    lines.append(f"\n共 {len(projects)} 个项目  目录: {output_dir}")
+    print("\n".join(lines))
 
 
-def _story_publish_all(result: StoryVideoResult, headless: bool = False):
-    """将故事视频发布到所有平台"""
+def _story_publish_all(result: StoryVideoResult, headless: bool = False, parallel: bool = False):
+    """
+    将故事视频发布到所有平台。
+    parallel 时各平台在独立线程中同时发布（各自启动浏览器、登录目录互不相同），
+    总耗时约等于最慢的一个平台；否则逐个发布，平台之间等待 PUBLISH_INTER_DELAY 秒（默认 0）。
+    """
     if not result.final_video_path or not result.final_video_path.exists():
         print("  无视频文件可发布")
         return
 
     video_path = str(result.final_video_path)
-    results = {}
 
     platform_publishers = {
         "xhs": ("小红书", lambda pc, vp: _do_xhs_publish_video(vp, pc.title[:20], pc.full_text())),
@@ -2034,14 +2050,22 @@ def _story_publish_all(result: StoryVideoResult, headless: bool = False):
     print("  发布到全平台")
     print("=" * 60)
 
+    jobs = []
     for key, (name, publish_fn) in platform_publishers.items():
         pc = result.platform_contents.get(key)
         if not pc:
             logger.info("[%s] 无文案，跳过", name)
             continue
+        jobs.append((name, publish_fn, pc))
+
+    def _publish_one(name, publish_fn, pc) -> bool:
+        logger.info("[%s] 开始发布...", name)
+        return publish_fn(pc, video_path)
+
+    def _report(name, get_result) -> None:
+        # 结果统一在主线程输出，并发发布时各平台的状态行不会互相穿插
         try:
-            logger.info("[%s] 开始发布...", name)
-            ok = publish_fn(pc, video_path)
+            ok = get_result()
             results[name] = ok
             status = "✓" if ok else "?"
             print(f"  [{status}] {name}")
@@ -2049,7 +2073,19 @@ def _story_publish_all(result: StoryVideoResult, headless: bool = False):
             results[name] = False
             logger.error("[%s] 发布失败: %s", name, e, exc_info=True)
             print(f"  [✗] {name}: {e}")
-        time.sleep(5)
+
+    results = {}
+    if parallel:
+        with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as pool:
+            futures = {pool.submit(_publish_one, name, fn, pc): name for name, fn, pc in jobs}
+            for future in as_completed(futures):
+                _report(futures[future], future.result)
+    else:
+        delay = get_settings().publish_inter_delay
+        for i, (name, publish_fn, pc) in enumerate(jobs):
+            if i and delay:
+                time.sleep(delay)
+            _report(name, partial(_publish_one, name, publish_fn, pc))
 
     success = sum(1 for v in results.values() if v)
     print(f"\n  总计: {success}/{len(results)} 个平台发布成功")
@@ -2057,23 +2093,19 @@ def _story_publish_all(result: StoryVideoResult, headless: bool = False):
 
 
 def _story_publish_dy_video(video_path: str, title: str, body: str) -> bool:
-    from douyin.publisher import publish_douyin_video
-    return publish_douyin_video(video_path, title, body, headless=False)
+    return _dy_publisher.publish_douyin_video(video_path, title, body, headless=False)
 
 
 def _story_publish_channels_video(video_path: str, body: str) -> bool:
-    from channels.publisher import publish_channels_video
-    return publish_channels_video(video_path, body, headless=False)
+    return _channels_publisher.publish_channels_video(video_path, body, headless=False)
 
 
 def _story_publish_zh_video(video_path: str, title: str, body: str) -> bool:
-    from zhihu.publisher import publish_zhihu_video
-    return publish_zhihu_video(video_path, title, body, headless=False)
+    return _zh_publisher.publish_zhihu_video(video_path, title, body, headless=False)
 
 
 def _story_publish_toutiao_video(video_path: str, title: str, body: str) -> bool:
-    from toutiao.publisher import publish_toutiao_video
-    return publish_toutiao_video(video_path, title, body, headless=False)
+    return _toutiao_publisher.publish_toutiao_video(video_path, title, body, headless=False)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -2090,22 +2122,50 @@ def _publish_to_platform(name: str, publish_fn, content, headless: bool) -> bool
         return False
 
 
+def _generate_platform_contents(article: dict, jobs: list) -> dict:
+    """
+    并发生成并保存多个平台的文案。
+    jobs 为 [(平台名, 生成器类, 配图列表, 保存函数)]；各平台的 LLM 请求互不依赖，
+    共用同一个 LLM 客户端的连接池同时发出，总耗时约等于最慢的一个平台；
+    每个平台生成后在同一线程内立即保存，写盘与其他平台的 LLM 等待重叠。
+    返回 {平台名: 文案}，生成失败的平台为 None。
+    """
+    llm = _get_llm()
+
+    def _generate_and_save(gen_cls, images, save_fn):
+        content = gen_cls(llm).generate_from_article(article, images)
+        save_fn(content)
+        return content
+
+    contents = {}
+    with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as pool:
+        futures = [
+            (name, pool.submit(_generate_and_save, gen_cls, images, save_fn))
+            for name, gen_cls, images, save_fn in jobs
+        ]
+        for name, future in futures:
+            try:
+                contents[name] = future.result()
+            except Exception as e:
+                logger.error("%s文案生成失败: %s", name, e)
+                contents[name] = None
+    return contents
+
+
 def _print_all_report(results: dict):
     sep = "=" * 60
-    print(f"\n{sep}")
-    print("  全平台发布结果")
-    print(sep)
-    for platform, success in results.items():
-        status = "✓" if success else "✗"
-        print(f"  [{status}] {platform}")
+    lines = [f"\n{sep}", "  全平台发布结果", sep]
+    lines += [f"  [{'✓' if success else '✗'}] {platform}" for platform, success in results.items()]
     success_count = sum(1 for v in results.values() if v)
-    total = len(results)
-    print(f"\n  总计: {success_count}/{total} 个平台发布成功")
-    print(sep)
+    lines += [f"\n  总计: {success_count}/{len(results)} 个平台发布成功", sep]
+    print("\n".join(lines))
 
 
 def cmd_all(args):
     """WordPress 发布 → 多平台发布全流程"""
+    if args.local:
+        cmd_all_local(args)
+        return
     settings = get_settings()
     settings.check_or_exit()
 
@@ -2122,15 +2182,10 @@ def cmd_all(args):
         return
 
     article_file = asset_dir / "article.json"
-    with open(article_file, "r", encoding="utf-8") as f:
-        article = json.load(f)
+    article = load_json(article_file)
 
     image_dir = asset_dir / "images"
-    image_paths = []        # 16:9 横版（WordPress/头条/知乎）
-    if image_dir.exists():
-        for ext in ("*.png", "*.jpg", "*.jpeg", "*.webp"):
-            image_paths.extend(sorted(image_dir.glob(ext)))
-    image_paths = [str(p) for p in image_paths[:9]]
+    image_paths = _scan_images(image_dir)      # 16:9 横版（WordPress/头条/知乎）
 
     # 为竖版平台（小红书/抖音/视频号）生成 3:4 图片
     vertical_image_paths = []
@@ -2139,19 +2194,24 @@ def cmd_all(args):
         v_image_dir = asset_dir / "images_vertical"
         v_image_dir.mkdir(parents=True, exist_ok=True)
         if settings.volc_ak and settings.volc_sk:
-            img_gen = ImageGenerator(settings.volc_ak, settings.volc_sk)
+            img_gen = _make_image_gen(settings)
             _art_gen = _AG(llm=None, max_content_images=settings.max_content_images)
             v_specs = _art_gen.image_prompts(article)
             # 统一种子：同一篇文章的所有图片使用相同基础 seed，确保视觉一致性
-            base_seed = sum(ord(c) for c in article.get("slug", article.get("title", ""))) % 2147483647
+            base_seed = image_seed(article.get("slug", article.get("title", "")))
             logger.info("生成竖版配图（3:4, 1080x1440, seed=%d）...", base_seed)
-            for i, spec in enumerate(v_specs):
+
+            def _generate_vertical(i, spec):
                 vp = v_image_dir / f"{spec['role']}_{i:02d}.png"
                 # 替换 prompt 中的 16:9 为 3:4 竖版描述
-                v_prompt = spec["prompt"].replace("16:9", "3:4 vertical portrait").replace("Wide ", "Vertical portrait ")
-                gen_path = img_gen.generate(v_prompt, vp, width=1080, height=1440, seed=base_seed + i)
-                if gen_path:
-                    vertical_image_paths.append(str(gen_path))
+                v_prompt = to_vertical_prompt(spec["prompt"])
+                return img_gen.generate(v_prompt, vp, width=1080, height=1440, seed=base_seed + i)
+
+            # 各张图的请求互不依赖，并发发出；map 保持原顺序，失败的图（None）跳过
+            workers = min(_VERTICAL_IMAGE_WORKERS, len(v_specs)) or 1
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                generated = pool.map(_generate_vertical, range(len(v_specs)), v_specs)
+                vertical_image_paths = [str(path) for path in generated if path]
             logger.info("竖版配图生成完成: %d 张", len(vertical_image_paths))
         else:
             logger.info("未配置火山引擎密钥，竖版平台使用横版图片")
@@ -2161,80 +2221,87 @@ def cmd_all(args):
     # 竖版平台使用竖版图（如果有），否则回退到横版
     v_images = vertical_image_paths if vertical_image_paths else image_paths
 
-    llm = _make_llm(settings)
-    results = {}
-
-    # Step 2: 生成各平台文案
-    print("\n" + "=" * 60)
-    print("  Step 2: 生成各平台文案")
-    print("=" * 60)
+    _publish_all_platforms(args, article, slug, asset_dir, image_paths, v_images)
 
-    # 小红书（竖版 3:4）
-    try:
-        xhs_gen = XHSContentGenerator(llm)
-        xhs_content = xhs_gen.generate_from_article(article, v_images)
-        _print_xhs_preview(xhs_content)
-        _save_xhs_content_local(xhs_content, slug, asset_dir)
-    except Exception as e:
-        logger.error("小红书文案生成失败: %s", e)
-        xhs_content = None
 
-    # 抖音（竖版 3:4）
-    try:
-        dy_gen = DouyinContentGenerator(llm)
-        dy_content = dy_gen.generate_from_article(article, v_images)
-        _print_dy_preview(dy_content)
-        _save_dy_content_local(dy_content, slug, asset_dir)
-    except Exception as e:
-        logger.error("抖音文案生成失败: %s", e)
-        dy_content = None
+def cmd_all_local(args):
+    """从已有共享素材生成各平台文案并发布（跳过 WordPress 发布与配图生成）"""
+    settings = get_settings()
+    settings.check_or_exit()
+    output_dir = _output_dir()
+    slug = args.local
+    asset_dir = output_dir / slug
+    article_file = asset_dir / "article.json"
 
-    # 头条（横版 16:9）
-    try:
-        tt_gen = ToutiaoContentGenerator(llm)
-        tt_content = tt_gen.generate_from_article(article, image_paths)
-        _print_toutiao_preview(tt_content)
-        _save_toutiao_content_local(tt_content, slug, asset_dir)
-    except Exception as e:
-        logger.error("头条文案生成失败: %s", e)
-        tt_content = None
+    if not article_file.exists():
+        available = _available_slugs(output_dir)
+        print(f"\n  素材不存在: {article_file}")
+        if available:
+            print(f"\n  可用的 slug:")
+            for s in available:
+                print(f"    - {s}")
+        sys.exit(1)
 
-    # 知乎（横版 16:9）
-    try:
-        zh_gen = ZhihuContentGenerator(llm)
-        zh_content = zh_gen.generate_from_article(article, image_paths)
-        _print_zh_preview(zh_content)
-        _save_zh_content_local(zh_content, slug, asset_dir)
-    except Exception as e:
-        logger.error("知乎文案生成失败: %s", e)
-        zh_content = None
+    article = load_json(article_file)
+    logger.info("已加载本地素材: %s", slug)
 
-    # 视频号（竖版 3:4）
-    try:
-        ch_gen = ChannelsContentGenerator(llm)
-        ch_content = ch_gen.generate_from_article(article, v_images)
-        _print_channels_preview(ch_content)
-        _save_channels_content_local(ch_content, slug, asset_dir)
-    except Exception as e:
-        logger.error("视频号文案生成失败: %s", e)
-        ch_content = None
+    image_paths = _scan_images(asset_dir / "images")
+    # 竖版平台优先使用已生成的 3:4 竖版图，没有则回退到横版
+    v_images = _scan_images(asset_dir / "images_vertical") or image_paths
+    logger.info("本地图片: 横版 %d 张，竖版 %d 张", len(image_paths), len(v_images))
+
+    _publish_all_platforms(args, article, slug, asset_dir, image_paths, v_images)
+
+
+def _publish_all_platforms(args, article: dict, slug: str, asset_dir: Path,
+                           image_paths: list, v_images: list) -> None:
+    """全流程的 Step 2 / Step 3：生成并保存各平台文案，确认后依次发布"""
+    # (代号, 平台, 生成器, 配图, 预览, 保存, 发布)
+    platforms = [
+        ("xhs", "小红书", XHSContentGenerator, v_images,
+         _print_xhs_preview, _save_xhs_content_local, _do_xhs_publish),
+        ("dy", "抖音", DouyinContentGenerator, v_images,
+         _print_dy_preview, _save_dy_content_local, _do_dy_publish),
+        ("toutiao", "头条", ToutiaoContentGenerator, image_paths,
+         _print_toutiao_preview, _save_toutiao_content_local, _do_toutiao_publish),
+        ("zh", "知乎", ZhihuContentGenerator, image_paths,
+         _print_zh_preview, _save_zh_content_local, _do_zh_publish),
+        ("channels", "视频号", ChannelsContentGenerator, v_images,
+         _print_channels_preview, _save_channels_content_local, _do_channels_publish),
+        ("wb", "微博", WeiboContentGenerator, image_paths,
+         _print_wb_preview, _save_wb_content_local, _do_wb_publish),
+    ]
 
-    # 微博（横版 16:9）
-    try:
-        wb_gen = WeiboContentGenerator(llm)
-        wb_content = wb_gen.generate_from_article(article, image_paths)
-        _print_wb_preview(wb_content)
-        _save_wb_content_local(wb_content, slug, asset_dir)
-    except Exception as e:
-        logger.error("微博文案生成失败: %s", e)
-        wb_content = None
+    # Step 2: 生成各平台文案
+    print("\n" + "=" * 60)
+    print("  Step 2: 生成各平台文案")
+    print("=" * 60)
 
-    llm.close()
+    if args.single_call:
+        # 多个平台合并为一次 LLM 请求（每次最多 4 个），合并结果不可用的平台自动单独生成
+        generated = MultiPlatformGenerator(_get_llm()).generate_from_article(
+            article, {key: images for key, _, _, images, *_ in platforms}
+        )
+        contents = {name: generated.get(key) for key, name, *_ in platforms}
+        for _, name, _, _, _, save_fn, _ in platforms:
+            if contents[name] is not None:
+                save_fn(contents[name], slug, asset_dir, fsync=False)
+    else:
+        contents = _generate_platform_contents(article, [
+            (name, gen_cls, images, partial(save_fn, slug=slug, asset_dir=asset_dir, fsync=False))
+            for _, name, gen_cls, images, _, save_fn, _ in platforms
+        ])
+    # 各平台文案逐个写入时跳过了 fsync，这里统一刷盘一次（Windows 无 os.sync，依赖系统回写）
+    if hasattr(os, "sync"):
+        os.sync()
+    # 预览按平台顺序统一输出，不受各平台生成完成的先后影响
+    for _, name, _, _, preview_fn, _, _ in platforms:
+        if contents[name] is not None:
+            preview_fn(contents[name])
 
     # Step 3: 发布到各平台
     if not args.yes:
-        confirm = input("\n确认发布到所有平台？(y/N): ").strip().lower()
-        if confirm != "y":
+        if not confirm("\n确认发布到所有平台？(y/N): "):
             print("已取消发布。文案已保存，可使用各平台的 republish 命令单独发布。")
             return
 
@@ -2242,20 +2309,17 @@ def cmd_all(args):
     print("  Step 3: 发布到各平台")
     print("=" * 60)
 
-    headless = args.headless
-
-    if xhs_content:
-        results["小红书"] = _publish_to_platform("小红书", _do_xhs_publish, xhs_content, headless)
-    if dy_content:
-        results["抖音"] = _publish_to_platform("抖音", _do_dy_publish, dy_content, headless)
-    if tt_content:
-        results["头条"] = _publish_to_platform("头条", _do_toutiao_publish, tt_content, headless)
-    if zh_content:
-        results["知乎"] = _publish_to_platform("知乎", _do_zh_publish, zh_content, headless)
-    if ch_content:
-        results["视频号"] = _publish_to_platform("视频号", _do_channels_publish, ch_content, headless)
-    if wb_content:
-        results["微博"] = _publish_to_platform("微博", _do_wb_publish, wb_content, headless)
+    jobs = [(name, publish_fn, contents[name])
+            for _, name, _, _, _, _, publish_fn in platforms if contents[name] is not None]
+    if args.parallel:
+        # 各平台的浏览器与登录目录互相独立，同时发布，总耗时约等于最慢的一个平台
+        with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as pool:
+            futures = [(name, pool.submit(_publish_to_platform, name, fn, content, args.headless))
+                       for name, fn, content in jobs]
+            results = {name: future.result() for name, future in futures}
+    else:
+        results = {name: _publish_to_platform(name, fn, content, args.headless)
+                   for name, fn, content in jobs}
 
     _print_all_report(results)
 
@@ -2264,16 +2328,8 @@ def cmd_all(args):
 #  CLI 解析
 # ══════════════════════════════════════════════════════════════
 
-def build_parser() -> argparse.ArgumentParser:
-    settings = get_settings()
-    parser = argparse.ArgumentParser(
-        description="Aineoo 内容自动发布工具 —— WordPress + 多平台统一入口",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__,
-    )
-    subparsers = parser.add_subparsers(dest="command", help="可用命令")
-
-    # ── wp 子命令 ──
+def _add_wp_parser(subparsers, settings) -> None:
+    """注册 wp 子命令"""
     p_wp = subparsers.add_parser("wp", help="生成文章并发布到 WordPress")
     p_wp.add_argument("--prompt", default="", help="完整提示词")
     p_wp.add_argument("--topic", default="", help="主题（自动套用模板）")
@@ -2292,14 +2348,20 @@ def build_parser() -> argparse.ArgumentParser:
     p_wp.add_argument("--no-deepseek", dest="use_deepseek", action="store_false")
     p_wp.add_argument("--timeout", type=int, default=settings.request_timeout)
     p_wp.add_argument("--max-images", type=int, default=settings.max_content_images)
+    p_wp.add_argument("--no-cache", dest="no_cache", action="store_true", default=argparse.SUPPRESS,
+                      help="跳过 LLM 本地缓存，强制重新生成")
     p_wp.add_argument("--video", action="store_true", help="同时生成视频并嵌入文章（火山引擎即梦AI）")
     p_wp.add_argument("--video-ratio", type=str, default="16:9", help="视频画面比例（默认 16:9 横屏）")
     p_wp.add_argument("--avatar", action="store_true", help="生成数字人解读视频（fal.ai）")
     p_wp.add_argument("--avatar-image", type=str, default="", help="数字人形象照 URL（公网可访问的正面照片）")
     p_wp.set_defaults(func=cmd_wp)
 
-    # ── xhs 子命令 ──
+
+def _add_xhs_parser(subparsers, settings) -> None:
+    """注册 xhs 子命令"""
     p_xhs = subparsers.add_parser("xhs", help="小红书相关操作")
+    p_xhs.add_argument("--no-cache", dest="no_cache", action="store_true", default=argparse.SUPPRESS,
+                       help="跳过 LLM 本地缓存，强制重新生成")
     xhs_sub = p_xhs.add_subparsers(dest="xhs_command", help="小红书子命令")
 
     # xhs list
@@ -2312,6 +2374,7 @@ def build_parser() -> argparse.ArgumentParser:
     for name in ("generate", "preview"):
         p = xhs_sub.add_parser(name, help="生成小红书文案")
         p.add_argument("post_id", type=int)
+        p.add_argument("--force-regen", action="store_true", help="忽略已有的 xhs_post_<id>.json，重新拉取文章并生成文案")
         p.set_defaults(func=cmd_xhs_generate)
 
     # xhs publish
@@ -2319,6 +2382,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_xp.add_argument("post_id", type=int)
     p_xp.add_argument("-y", "--yes", action="store_true")
     p_xp.add_argument("--headless", action="store_true")
+    p_xp.add_argument("--force-regen", action="store_true", help="忽略已有的 xhs_post_<id>.json，重新拉取文章并生成文案")
     p_xp.set_defaults(func=cmd_xhs_publish)
 
     # xhs republish
@@ -2333,6 +2397,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_xb.add_argument("post_ids", type=int, nargs="+")
     p_xb.add_argument("--publish", action="store_true")
     p_xb.add_argument("--headless", action="store_true")
+    p_xb.add_argument("--workers", type=int, default=1,
+                      help="并发发布的浏览器进程数（默认 1，串行；>1 需已有登录态快照）")
     p_xb.set_defaults(func=cmd_xhs_batch)
 
     # xhs local
@@ -2368,6 +2434,7 @@ def build_parser() -> argparse.ArgumentParser:
                        help="数字人缩放比例 0.0-1.0（默认 0.3 即 30%%）")
     p_xv.add_argument("--publish", action="store_true", help="生成后自动发布")
     p_xv.add_argument("--headless", action="store_true")
+    p_xv.add_argument("--force-regen", action="store_true", help="忽略已有的 xhs_post_<id>.json，重新拉取文章并生成文案")
     p_xv.set_defaults(func=cmd_xhs_video)
 
     # xhs audio（为已有视频配音）
@@ -2422,7 +2489,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_xd = xhs_sub.add_parser("debug", help="诊断发布页面")
     p_xd.set_defaults(func=cmd_xhs_debug)
 
-    # ── dy 子命令 ──
+
+def _add_dy_parser(subparsers, settings) -> None:
+    """注册 dy 子命令"""
     p_dy = subparsers.add_parser("dy", help="抖音相关操作")
     dy_sub = p_dy.add_subparsers(dest="dy_command", help="抖音子命令")
 
@@ -2458,7 +2527,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_dyd = dy_sub.add_parser("debug", help="诊断抖音发布页面")
     p_dyd.set_defaults(func=cmd_dy_debug)
 
-    # ── toutiao 子命令 ──
+
+def _add_toutiao_parser(subparsers, settings) -> None:
+    """注册 toutiao 子命令"""
     p_tt = subparsers.add_parser("toutiao", help="今日头条相关操作")
     tt_sub = p_tt.add_subparsers(dest="toutiao_command", help="头条子命令")
 
@@ -2494,7 +2565,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_ttd = tt_sub.add_parser("debug", help="诊断头条发布页面")
     p_ttd.set_defaults(func=cmd_toutiao_debug)
 
-    # ── zh 子命令 ──
+
+def _add_zh_parser(subparsers, settings) -> None:
+    """注册 zh 子命令"""
     p_zh = subparsers.add_parser("zh", help="知乎相关操作")
     zh_sub = p_zh.add_subparsers(dest="zh_command", help="知乎子命令")
 
@@ -2530,7 +2603,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_zhd = zh_sub.add_parser("debug", help="诊断知乎发布页面")
     p_zhd.set_defaults(func=cmd_zh_debug)
 
-    # ── channels 子命令 ──
+
+def _add_channels_parser(subparsers, settings) -> None:
+    """注册 channels 子命令"""
     p_ch = subparsers.add_parser("channels", help="微信视频号相关操作")
     ch_sub = p_ch.add_subparsers(dest="channels_command", help="视频号子命令")
 
@@ -2555,7 +2630,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_chd = ch_sub.add_parser("debug", help="诊断视频号发布页面")
     p_chd.set_defaults(func=cmd_channels_debug)
 
-    # ── wb 子命令 ──
+
+def _add_wb_parser(subparsers, settings) -> None:
+    """注册 wb 子命令"""
     p_wb = subparsers.add_parser("wb", help="微博相关操作")
     wb_sub = p_wb.add_subparsers(dest="wb_command", help="微博子命令")
 
@@ -2598,7 +2675,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_wbd = wb_sub.add_parser("debug", help="诊断微博发布页面")
     p_wbd.set_defaults(func=cmd_wb_debug)
 
-    # ── story 子命令 ──
+
+def _add_story_parser(subparsers, settings) -> None:
+    """注册 story 子命令"""
     p_story = subparsers.add_parser("story", help="故事视频生成（LLM 分镜脚本 + AI 视频 + 全平台文案）")
     story_sub = p_story.add_subparsers(dest="story_command", help="故事视频子命令")
 
@@ -2622,6 +2701,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_sg.add_argument("-y", "--yes", action="store_true", help="跳过确认")
     p_sg.add_argument("--headless", action="store_true")
     p_sg.add_argument("--no-headless", dest="headless", action="store_false")
+    p_sg.add_argument("--parallel", action="store_true", help="各平台同时发布（每个平台一个浏览器）")
     p_sg.set_defaults(func=cmd_story_generate)
 
     p_sp = story_sub.add_parser("publish", help="发布已有故事视频到全平台")
@@ -2629,12 +2709,15 @@ def build_parser() -> argparse.ArgumentParser:
     p_sp.add_argument("-y", "--yes", action="store_true")
     p_sp.add_argument("--headless", action="store_true")
     p_sp.add_argument("--no-headless", dest="headless", action="store_false")
+    p_sp.add_argument("--parallel", action="store_true", help="各平台同时发布（每个平台一个浏览器）")
     p_sp.set_defaults(func=cmd_story_publish)
 
     p_sl = story_sub.add_parser("list", help="列出已生成的故事视频")
     p_sl.set_defaults(func=cmd_story_list)
 
-    # ── all 子命令 ──
+
+def _add_all_parser(subparsers, settings) -> None:
+    """注册 all 子命令"""
     p_all = subparsers.add_parser("all", help="WordPress + 全平台发布")
     p_all.add_argument("--prompt", default="", help="完整提示词")
     p_all.add_argument("--topic", default="", help="主题")
@@ -2657,11 +2740,53 @@ def build_parser() -> argparse.ArgumentParser:
     p_all.add_argument("--video-ratio", type=str, default="16:9", help="视频画面比例")
     p_all.add_argument("--avatar", action="store_true", help="生成数字人解读视频（fal.ai）")
     p_all.add_argument("--avatar-image", type=str, default="", help="数字人形象照 URL")
+    p_all.add_argument("--local", metavar="SLUG", default="",
+                       help="跳过 WordPress 发布，直接用已有共享素材生成并发布各平台")
+    p_all.add_argument("--single-call", action="store_true",
+                       help="合并为一次 LLM 请求生成各平台文案（每次最多 4 个平台）")
+    p_all.add_argument("--parallel", action="store_true", help="各平台同时发布（每个平台一个浏览器）")
     p_all.add_argument("-y", "--yes", action="store_true")
     p_all.add_argument("--headless", action="store_true")
     p_all.add_argument("--no-headless", dest="headless", action="store_false")
     p_all.set_defaults(func=cmd_all)
 
+
+# 顶层命令 → 子解析器构建函数（顺序即帮助信息中的命令顺序）
+_PARSER_BUILDERS = {
+    "wp": _add_wp_parser,
+    "xhs": _add_xhs_parser,
+    "dy": _add_dy_parser,
+    "toutiao": _add_toutiao_parser,
+    "zh": _add_zh_parser,
+    "channels": _add_channels_parser,
+    "wb": _add_wb_parser,
+    "story": _add_story_parser,
+    "all": _add_all_parser,
+}
+
+
+def build_parser(argv=None) -> argparse.ArgumentParser:
+    """
+    构建命令行解析器。
+    argv 中已给出顶层命令时只构建该命令的子解析器，其余命令的参数定义不必每次启动都构建；
+    未给出（如 -h / 无参数）时构建完整解析器，保证帮助信息完整。
+    """
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Aineoo 内容自动发布工具 —— WordPress + 多平台统一入口",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--no-cache", dest="no_cache", action="store_true",
+                        help="跳过 LLM 本地缓存，强制重新生成")
+    subparsers = parser.add_subparsers(dest="command", help="可用命令")
+
+    command = next((a for a in (sys.argv[1:] if argv is None else argv) if not a.startswith("-")), None)
+    if command in _PARSER_BUILDERS:
+        _PARSER_BUILDERS[command](subparsers, settings)
+    else:
+        for add_parser in _PARSER_BUILDERS.values():
+            add_parser(subparsers, settings)
     return parser
 
 
@@ -2673,6 +2798,11 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    # get_settings() 进程内缓存（构建解析器时已读取过），修改环境变量后需清除缓存才对后续命令生效
+    if args.no_cache:
+        os.environ["LLM_CACHE"] = "false"
+        get_settings.cache_clear()
+
     # 检查有子命令的平台是否缺少子命令
     sub_commands = {
         "xhs": "xhs_command",
@@ -0,0 +1,78 @@
+"""
+共享浏览器池
+一个 Chromium(Edge) 进程 + 多个隔离的 BrowserContext：
+同一进程内先后发布多个平台时，只需冷启动一次浏览器，各平台的 Cookie / 存储互不影响。
+登录态通过各平台 USER_DATA_DIR 下的 storage_state.json 快照恢复。
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+from playwright.sync_api import sync_playwright, Browser, BrowserContext
+
+from shared.publisher_base import DEFAULT_UA, DEFAULT_VIEWPORT
+from shared.utils.logger import get_logger
+
+__all__ = ["BrowserPool"]
+
+logger = get_logger("browser-pool")
+
+
+class BrowserPool:
+    """
+    共享浏览器，按需为每个发布器创建独立的 BrowserContext。
+
+    注意：Playwright 同步 API 不能跨线程使用，一个池只在创建它的线程内使用；
+    多进程并发时每个进程各自持有一个池。
+    """
+
+    def __init__(self, headless: bool = False):
+        self.headless = headless
+        self._pw = None
+        self._browser: Optional[Browser] = None
+
+    def __enter__(self) -> "BrowserPool":
+        # 浏览器在首次 new_context 时才启动，全部发布器都走持久化上下文时不会多开一个
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def start(self) -> None:
+        """启动共享浏览器（已启动则忽略）"""
+        if self._browser is not None:
+            return
+        self._pw = sync_playwright().start()
+        self._browser = self._pw.chromium.launch(
+            channel="msedge",
+            headless=self.headless,
+            args=["--disable-blink-features=AutomationControlled"],
+        )
+        logger.info("共享浏览器已启动 (headless=%s)", self.headless)
+
+    def new_context(self, storage_state: Union[str, Path, None] = None) -> BrowserContext:
+        """创建一个隔离的上下文；storage_state 快照存在时恢复其中的登录态"""
+        self.start()
+        kwargs = {"viewport": DEFAULT_VIEWPORT, "user_agent": DEFAULT_UA}
+        if storage_state and Path(storage_state).exists():
+            kwargs["storage_state"] = str(storage_state)
+        return self._browser.new_context(**kwargs)
+
+    def close(self) -> None:
+        """关闭共享浏览器（未启动则忽略）"""
+        if self._browser is None and self._pw is None:
+            return
+        if self._browser:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._pw:
+            try:
+                self._pw.stop()
+            except Exception:
+                pass
+            self._pw = None
+        logger.info("共享浏览器已关闭")
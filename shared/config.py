@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -63,6 +64,8 @@ class Settings:
     deepseek_base_url: str
     deepseek_model: str
     deepseek_enabled: bool
+    llm_cache_enabled: bool      # 是否启用 LLM 响应本地缓存（默认关闭，LLM_CACHE=true 开启）
+    llm_cache_ttl: int           # 缓存有效期（秒），<= 0 表示永不过期
 
     # fal.ai（数字人 OmniHuman）
     fal_key: str
@@ -100,6 +103,9 @@ class Settings:
     weibo_cookie: str
     weibo_publish_delay: int
 
+    # 多平台依次发布时，相邻两个平台之间的等待（秒）；各平台互不相关，默认不等待
+    publish_inter_delay: int
+
     # 发布默认值
     default_categories: str
     default_tags: str
@@ -135,8 +141,13 @@ class Settings:
             raise ConfigError(msg)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """读取配置，环境变量优先。"""
+    """
+    读取配置，环境变量优先。
+    进程内只构建一次（Settings 不可变，可安全共享）；运行中修改了环境变量时
+    调用 get_settings.cache_clear() 重新读取。
+    """
     return Settings(
         # WordPress
         wp_base=_get_env("WP_BASE"),
@@ -153,6 +164,9 @@ def get_settings() -> Settings:
         deepseek_base_url=_get_env("DEEPSEEK_BASE_URL", "https://api.deepseek.com").rstrip("/"),
         deepseek_model=_get_env("DEEPSEEK_MODEL", "deepseek-chat"),
         deepseek_enabled=_get_env("DEEPSEEK_ENABLED", "true").lower() in ("1", "true", "yes", "on"),
+        # 各类生成均带采样温度，开启缓存后重复运行同一主题会得到完全相同的内容，因此默认关闭，仅调试提示词时手动开启
+        llm_cache_enabled=_get_env("LLM_CACHE", "false").lower() in ("1", "true", "yes", "on"),
+        llm_cache_ttl=int(_get_env("LLM_CACHE_TTL", "86400") or "86400"),
         # fal.ai
         fal_key=_get_env("FAL_KEY"),
         # 站点
@@ -180,6 +194,7 @@ def get_settings() -> Settings:
         # 微博
         weibo_cookie=_get_env("WEIBO_COOKIE"),
         weibo_publish_delay=int(_get_env("WEIBO_PUBLISH_DELAY", "5") or "5"),
+        publish_inter_delay=int(_get_env("PUBLISH_INTER_DELAY", "0") or "0"),
         # 发布默认值
         default_categories=_get_env("DEFAULT_CATEGORIES", "AI"),
         default_tags=_get_env("DEFAULT_TAGS", "AI"),
@@ -0,0 +1,134 @@
+"""
+LLM 响应本地缓存
+—— 相同的 (模型, 温度, json_mode, 提示词) 直接复用上次的回复
+缓存存放在 SQLite 文件中，跨进程 / 跨次运行复用；超过 TTL 的记录视为失效
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from shared.llm.client import LLMClient
+from shared.utils.logger import get_logger
+
+logger = get_logger("llm-cache")
+
+# 默认有效期：1 天（秒）
+DEFAULT_CACHE_TTL = 86400
+
+
+class CachingLLMClient(LLMClient):
+    """
+    带本地缓存的 LLMClient，接口与 LLMClient 完全一致，可直接替换。
+    仅缓存成功的非空回复；调用方解析失败时经 discard_last() / discarding_on_error() 删除该条，
+    下次运行会重新请求。ttl 为 None 或 <= 0 时缓存永不过期。
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        cache_path: Union[str, Path],
+        ttl: Optional[int] = DEFAULT_CACHE_TTL,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()  # 各线程最近一次回复对应的缓存 key / 是否跳过读缓存
+        self._db = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        super().close()
+        with self._cache_lock:
+            self._db.close()
+
+    def _cache_key(self, system_prompt: str, user_prompt: str,
+                   temperature: float, json_mode: bool) -> str:
+        raw = json.dumps(
+            [self.model, temperature, json_mode, system_prompt, user_prompt],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[str]:
+        oldest = time.time() - self.ttl if self.ttl else 0.0
+        try:
+            with self._cache_lock:
+                row = self._db.execute(
+                    "SELECT response FROM completions WHERE key = ? AND created_at >= ?",
+                    (key, oldest),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("LLM 缓存读取失败: %s", exc)
+            return None
+        return row[0] if row else None
+
+    def _store(self, key: str, content: str) -> None:
+        try:
+            with self._cache_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO completions (key, response, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, content, time.time()),
+                )
+                self._db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("LLM 缓存写入失败: %s", exc)
+
+    def discard_last(self) -> None:
+        key = getattr(self._local, "last_key", None)
+        if key is None:
+            return
+        self._local.last_key = None
+        try:
+            with self._cache_lock:
+                self._db.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self._db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("LLM 缓存删除失败: %s", exc)
+            return
+        logger.info("已丢弃无法使用的缓存回复（%s…）", key[:12])
+
+    @contextmanager
+    def bypass_cache(self, enabled: bool = True) -> Iterator[None]:
+        previous = getattr(self._local, "bypass", False)
+        self._local.bypass = previous or enabled
+        try:
+            yield
+        finally:
+            self._local.bypass = previous
+
+    def chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+    ) -> Optional[str]:
+        key = self._cache_key(system_prompt, user_prompt, temperature, json_mode)
+        self._local.last_key = None
+        cached = None if getattr(self._local, "bypass", False) else self._lookup(key)
+        if cached is not None:
+            logger.info("LLM 命中本地缓存（%s…）", key[:12])
+            self._local.last_key = key
+            return cached
+
+        content = super().chat(system_prompt, user_prompt, temperature, json_mode)
+        if content:
+            self._store(key, content)
+            self._local.last_key = key
+        return content
@@ -8,8 +8,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from shared.llm.client import LLMClient, extract_json_block
+from shared.llm.client import LLMClient, build_article_message, extract_json_block
 from shared.utils.exceptions import ContentGenError, LLMResponseError
+from shared.utils.helpers import format_hashtags
 from shared.utils.logger import get_logger
 from shared.wp.client import WPPost
 
@@ -37,7 +38,7 @@ class ChannelsContent:
 
     def full_text(self) -> str:
         """拼装完整发布文本（正文 + 话题标签），确保不超过字数限制"""
-        tags_str = " ".join(f"#{t}" for t in self.hashtags)
+        tags_str = format_hashtags(self.hashtags)
         if not tags_str:
             return self.body[:self.CHANNELS_MAX_BODY_LENGTH]
         full = f"{self.body}\n\n{tags_str}"
@@ -164,7 +165,8 @@ class ChannelsContentGenerator:
         logger.info("生成视频号文案，文章: [%s] %s", post.id, post.title)
 
         raw = self._call_llm(user_msg)
-        content = self._parse_response(raw, image_urls=post.all_image_urls[:9])
+        with self.llm.discarding_on_error():
+            content = self._parse_response(raw, image_urls=post.all_image_urls[:9])
         logger.info("文案生成完成: %s", content.summary())
         return content
 
@@ -175,7 +177,8 @@ class ChannelsContentGenerator:
 
         raw = self._call_llm(user_msg)
         images = (image_paths or [])[:9]
-        content = self._parse_response(raw, image_urls=images)
+        with self.llm.discarding_on_error():
+            content = self._parse_response(raw, image_urls=images)
         logger.info("文案生成完成（本地素材）: %s", content.summary())
         return content
 
@@ -232,26 +235,4 @@ class ChannelsContentGenerator:
 
     @staticmethod
     def _build_user_message_from_article(article: dict) -> str:
-        parts = [f"文章标题：{article.get('title', '')}"]
-        excerpt = article.get("excerpt", "")
-        if excerpt:
-            parts.append(f"文章摘要：{excerpt}")
-        sections = article.get("sections", [])
-        body_parts = []
-        for sec in sections:
-            heading = sec.get("title", sec.get("heading", ""))
-            paragraphs = sec.get("paragraphs", [])
-            if heading:
-                body_parts.append(heading)
-            body_parts.extend(paragraphs)
-        body_text = "\n".join(body_parts)
-        if len(body_text) > 3000:
-            body_text = body_text[:3000] + "\n...(正文已截断)"
-        parts.append(f"文章正文：\n{body_text}")
-        takeaways = article.get("key_takeaways", [])
-        if takeaways:
-            parts.append(f"关键要点：{', '.join(takeaways)}")
-        tags = article.get("tags", [])
-        if tags:
-            parts.append(f"文章标签：{', '.join(tags)}")
-        return "\n\n".join(parts)
+        return build_article_message(article, max_body_chars=3000)
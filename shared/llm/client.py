@@ -9,14 +9,18 @@ from __future__ import annotations
 import json
 import re
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from shared.utils.logger import get_logger
 
 logger = get_logger("llm-client")
 
+_POOL_SIZE = 16  # 每个主机保持的最大连接数
+
 
 class LLMClient:
     """DeepSeek / OpenAI 兼容的聊天补全客户端"""
@@ -35,6 +39,9 @@ class LLMClient:
         self.model = model
         self.timeout = timeout
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         if self.api_key:
             self._session.headers.update({
                 "Authorization": f"Bearer {self.api_key}",
@@ -55,6 +62,28 @@ class LLMClient:
     def __exit__(self, *exc: Any) -> None:
         self.close()
 
+    # ── 缓存协作（普通客户端无缓存，均为空操作，由 CachingLLMClient 覆盖） ──
+
+    def discard_last(self) -> None:
+        """丢弃当前线程最近一次回复的本地缓存"""
+
+    @contextmanager
+    def discarding_on_error(self) -> Iterator[None]:
+        """
+        包住对回复的解析：解析抛出异常时丢弃该回复的缓存再继续抛出，
+        避免截断 / 不合格的回复在缓存有效期内被反复复用
+        """
+        try:
+            yield
+        except Exception:
+            self.discard_last()
+            raise
+
+    @contextmanager
+    def bypass_cache(self, enabled: bool = True) -> Iterator[None]:
+        """enabled 时，块内（当前线程）的调用不读本地缓存，直接请求 API（新回复照常写回缓存）"""
+        yield
+
     # ── 核心调用 ──
 
     def chat(
@@ -139,9 +168,48 @@ class LLMClient:
         parsed = extract_json_block(raw)
         if parsed is None:
             logger.warning("LLM 返回内容无法解析为 JSON")
+            self.discard_last()
         return parsed
 
 
+# ── 提示词构建 ──
+
+# build_article_message 用到的 article.json 顶层字段（只加载这些即可生成文案）
+ARTICLE_MESSAGE_FIELDS = ("title", "excerpt", "sections", "body", "content", "key_takeaways", "tags")
+
+
+def build_article_message(article: dict, max_body_chars: int = 3000) -> str:
+    """
+    将 article.json 整理为各平台改写用的 user 消息：标题 / 摘要 / 正文 / 要点 / 标签。
+    正文优先由 sections 拼接，兼容 body / content 字段；超出 max_body_chars 时截断。
+    """
+    parts = [f"文章标题：{article.get('title', '')}"]
+    excerpt = article.get("excerpt", "")
+    if excerpt:
+        parts.append(f"文章摘要：{excerpt}")
+    sections = article.get("sections", [])
+    if sections:
+        body_parts: List[str] = []
+        for sec in sections:
+            heading = sec.get("title", sec.get("heading", ""))
+            if heading:
+                body_parts.append(heading)
+            body_parts.extend(sec.get("paragraphs", []))
+        body_text = "\n".join(body_parts)
+    else:
+        body_text = article.get("body", "") or article.get("content", "")
+    if len(body_text) > max_body_chars:
+        body_text = body_text[:max_body_chars] + "\n...(正文已截断)"
+    parts.append(f"文章正文：\n{body_text}")
+    takeaways = article.get("key_takeaways", [])
+    if takeaways:
+        parts.append(f"关键要点：{', '.join(takeaways)}")
+    tags = article.get("tags", [])
+    if tags:
+        parts.append(f"文章标签：{', '.join(tags)}")
+    return "\n\n".join(parts)
+
+
 # ── JSON 提取工具函数 ──
 
 def extract_json_block(text: str) -> Optional[Dict[str, Any]]:
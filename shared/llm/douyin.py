@@ -7,8 +7,9 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from shared.llm.client import LLMClient, extract_json_block
+from shared.llm.client import LLMClient, build_article_message, extract_json_block
 from shared.utils.exceptions import ContentGenError, LLMResponseError
+from shared.utils.helpers import format_hashtags
 from shared.wp.client import WPPost
 
 logger = logging.getLogger("douyin-content")
@@ -27,7 +28,7 @@ class DouyinContent:
 
     def full_text(self) -> str:
         """拼装完整发布文本（正文 + 话题标签），确保不超过抖音字数限制"""
-        tags_str = " ".join(f"#{t}" for t in self.hashtags)
+        tags_str = format_hashtags(self.hashtags)
         if not tags_str:
             return self.body[:self.DOUYIN_MAX_BODY_LENGTH]
         full = f"{self.body}\n\n{tags_str}"
@@ -140,7 +141,9 @@ class DouyinContentGenerator:
         logger.info("生成抖音文案，文章: [%s] %s", post.id, post.title)
 
         raw = self._call_llm(user_msg)
-        content = self._parse_response(raw, fallback_title=post.title, image_urls=post.all_image_urls[:9])
+        with self.llm.discarding_on_error():
+            content = self._parse_response(
+                raw, fallback_title=post.title, image_urls=post.all_image_urls[:9])
         logger.info("文案生成完成: %s", content.summary())
         return content
 
@@ -151,7 +154,9 @@ class DouyinContentGenerator:
 
         raw = self._call_llm(user_msg)
         images = (image_paths or [])[:9]
-        content = self._parse_response(raw, fallback_title=article.get("title", "")[:30], image_urls=images)
+        with self.llm.discarding_on_error():
+            content = self._parse_response(
+                raw, fallback_title=article.get("title", "")[:30], image_urls=images)
         logger.info("文案生成完成（本地素材）: %s", content.summary())
         return content
 
@@ -205,30 +210,4 @@ class DouyinContentGenerator:
 
     @staticmethod
     def _build_user_message_from_article(article: dict) -> str:
-        parts = [f"文章标题：{article.get('title', '')}"]
-        excerpt = article.get("excerpt", "")
-        if excerpt:
-            parts.append(f"文章摘要：{excerpt}")
-        # 优先从 sections 构建正文，兼容 body/content 字段
-        sections = article.get("sections", [])
-        if sections:
-            body_parts = []
-            for sec in sections:
-                heading = sec.get("title", sec.get("heading", ""))
-                paragraphs = sec.get("paragraphs", [])
-                if heading:
-                    body_parts.append(heading)
-                body_parts.extend(paragraphs)
-            body_text = "\n".join(body_parts)
-        else:
-            body_text = article.get("body", "") or article.get("content", "")
-        if len(body_text) > 3000:
-            body_text = body_text[:3000] + "\n...(正文已截断)"
-        parts.append(f"文章正文：\n{body_text}")
-        takeaways = article.get("key_takeaways", [])
-        if takeaways:
-            parts.append(f"关键要点：{', '.join(takeaways)}")
-        tags = article.get("tags", [])
-        if tags:
-            parts.append(f"文章标签：{', '.join(tags)}")
-        return "\n\n".join(parts)
+        return build_article_message(article, max_body_chars=3000)
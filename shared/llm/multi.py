@@ -0,0 +1,144 @@
+"""
+多平台文案合并生成器
+—— 一次 LLM 请求同时为多个平台改写同一篇文章，省去每个平台各自一次的网络往返与提示词预填充
+各平台的写作规范、解析与校验逻辑沿用对应的单平台生成器；合并结果缺失或不合格的平台自动回退为单独生成
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from shared.llm.channels import _CHANNELS_SYSTEM_PROMPT, ChannelsContentGenerator
+from shared.llm.client import LLMClient, build_article_message
+from shared.llm.douyin import _DOUYIN_SYSTEM_PROMPT, DouyinContentGenerator
+from shared.llm.toutiao import _TOUTIAO_SYSTEM_PROMPT, ToutiaoContentGenerator
+from shared.llm.weibo import _WEIBO_ARTICLE_SYSTEM_PROMPT, WeiboContentGenerator
+from shared.llm.xhs import _XHS_SYSTEM_PROMPT, XHSContentGenerator
+from shared.llm.zhihu import _ZHIHU_SYSTEM_PROMPT, ZhihuContentGenerator
+from shared.utils.exceptions import AppBaseError
+from shared.utils.logger import get_logger
+
+logger = get_logger("multi-content")
+
+# 单次请求最多合并的平台数：平台越多输出越长，超过后质量与截断风险明显上升，收益递减
+MAX_PLATFORMS_PER_CALL = 4
+
+
+# ────────── 平台注册表 ──────────
+
+# 平台代号 → (平台名, 单平台生成器, 写作规范, 解析函数)
+# 解析函数签名 (raw, 文章标题, 配图列表) -> 文案对象，截断规则与各生成器的 generate_from_article 一致
+_PLATFORMS: Dict[str, tuple] = {
+    "xhs": (
+        "小红书", XHSContentGenerator, _XHS_SYSTEM_PROMPT,
+        lambda raw, title, images: XHSContentGenerator._parse_response(
+            raw, fallback_title=title[:20], image_urls=images[:9]),
+    ),
+    "dy": (
+        "抖音", DouyinContentGenerator, _DOUYIN_SYSTEM_PROMPT,
+        lambda raw, title, images: DouyinContentGenerator._parse_response(
+            raw, fallback_title=title[:30], image_urls=images[:9]),
+    ),
+    "toutiao": (
+        "头条", ToutiaoContentGenerator, _TOUTIAO_SYSTEM_PROMPT,
+        lambda raw, title, images: ToutiaoContentGenerator._parse_response(
+            raw, fallback_title=title[:30], cover_urls=images[:3]),
+    ),
+    "zh": (
+        "知乎", ZhihuContentGenerator, _ZHIHU_SYSTEM_PROMPT,
+        lambda raw, title, images: ZhihuContentGenerator._parse_response(
+            raw, fallback_title=title, cover_urls=images[:1]),
+    ),
+    "channels": (
+        "视频号", ChannelsContentGenerator, _CHANNELS_SYSTEM_PROMPT,
+        lambda raw, title, images: ChannelsContentGenerator._parse_response(
+            raw, image_urls=images[:9]),
+    ),
+    "wb": (
+        "微博", WeiboContentGenerator, _WEIBO_ARTICLE_SYSTEM_PROMPT,
+        lambda raw, title, images: WeiboContentGenerator._parse_response(
+            raw, fallback_title=title[:40], cover_urls=images[:3]),
+    ),
+}
+
+PLATFORM_KEYS = tuple(_PLATFORMS)
+
+
+def _build_system_prompt(keys: Sequence[str]) -> str:
+    """拼装合并请求的系统提示词：各平台规范依次列出，最终输出一个以平台代号为键的 JSON 对象"""
+    parts = [
+        "你需要把同一篇文章分别改写为多个平台的内容。"
+        "下面依次给出每个平台的写作规范，各平台互相独立，严格按各自规范写作。",
+    ]
+    for key in keys:
+        name, _, system_prompt, _ = _PLATFORMS[key]
+        parts.append(f"# ═══ 平台「{key}」（{name}）写作规范 ═══\n\n{system_prompt}")
+    example = ", ".join(f'"{key}": {{...}}' for key in keys)
+    parts.append(
+        "# ═══ 最终输出格式 ═══\n\n"
+        "以上各规范中的「输出格式」描述的是该平台对应字段的 JSON 对象。\n"
+        "严格输出一个 JSON 对象，键为平台代号，值为该平台规范要求的 JSON 对象，"
+        "不要包裹在 markdown 代码块中，不要输出任何解释说明：\n"
+        f"{{{example}}}"
+    )
+    return "\n\n".join(parts)
+
+
+# ────────── 生成器 ──────────
+
+class MultiPlatformGenerator:
+    """调用 LLM 一次性为多个平台生成文案（每次请求最多 MAX_PLATFORMS_PER_CALL 个平台）"""
+
+    def __init__(self, llm: LLMClient) -> None:
+        self.llm = llm
+
+    def generate_from_article(
+        self,
+        article: dict,
+        images: Dict[str, List[str]],
+        platforms: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        从本地 article.json 为多个平台生成文案。
+        images: 平台代号 → 该平台使用的配图路径列表
+        platforms: 要生成的平台代号，默认全部；超过 MAX_PLATFORMS_PER_CALL 时分批请求
+        返回 {平台代号: 文案对象}，回退后仍失败的平台不在结果中
+        """
+        keys = [key for key in (platforms or PLATFORM_KEYS) if key in _PLATFORMS]
+        user_msg = build_article_message(article, max_body_chars=5000)
+        title = article.get("title", "")
+
+        results: Dict[str, Any] = {}
+        for start in range(0, len(keys), MAX_PLATFORMS_PER_CALL):
+            batch = keys[start:start + MAX_PLATFORMS_PER_CALL]
+            logger.info("合并生成 %s 文案，标题: %s", "/".join(batch), title)
+            data = self.llm.chat_json(
+                system_prompt=_build_system_prompt(batch),
+                user_prompt=user_msg,
+                temperature=0.7,
+            ) or {}
+
+            failed = []
+            for key in batch:
+                name, _, _, parse = _PLATFORMS[key]
+                section = data.get(key)
+                try:
+                    if not isinstance(section, dict):
+                        raise ValueError("合并结果中缺少该平台")
+                    # 复用单平台生成器的解析与校验（正文非空、标签清洗等）
+                    results[key] = parse(json.dumps(section, ensure_ascii=False), title, images.get(key, []))
+                except (AppBaseError, ValueError) as e:
+                    logger.warning("%s 合并结果不可用（%s），单独生成", name, e)
+                    failed.append(key)
+
+            if failed:
+                # 合并回复不完整：移出缓存，否则后续每次运行都会重放它并逐平台回退
+                self.llm.discard_last()
+            for key in failed:
+                name, generator_cls, _, _ = _PLATFORMS[key]
+                try:
+                    results[key] = generator_cls(self.llm).generate_from_article(article, images.get(key, []))
+                except Exception as e:
+                    logger.error("%s文案生成失败: %s", name, e)
+        return results
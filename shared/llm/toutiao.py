@@ -8,7 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from shared.llm.client import LLMClient, extract_json_block
+from shared.llm.client import LLMClient, build_article_message, extract_json_block
 from shared.utils.exceptions import ContentGenError, LLMResponseError
 from shared.utils.logger import get_logger
 from shared.wp.client import WPPost
@@ -141,7 +141,8 @@ class ToutiaoContentGenerator:
 
         raw = self._call_llm(user_msg)
         cover_urls = post.all_image_urls[:3] if hasattr(post, 'all_image_urls') else []
-        content = self._parse_response(raw, fallback_title=post.title, cover_urls=cover_urls)
+        with self.llm.discarding_on_error():
+            content = self._parse_response(raw, fallback_title=post.title, cover_urls=cover_urls)
         logger.info("文案生成完成: %s", content.summary())
         return content
 
@@ -152,7 +153,9 @@ class ToutiaoContentGenerator:
 
         raw = self._call_llm(user_msg)
         covers = (image_paths or [])[:3]
-        content = self._parse_response(raw, fallback_title=article.get("title", "")[:30], cover_urls=covers)
+        with self.llm.discarding_on_error():
+            content = self._parse_response(
+                raw, fallback_title=article.get("title", "")[:30], cover_urls=covers)
         logger.info("文案生成完成（本地素材）: %s", content.summary())
         return content
 
@@ -208,26 +211,4 @@ class ToutiaoContentGenerator:
 
     @staticmethod
     def _build_user_message_from_article(article: dict) -> str:
-        parts = [f"文章标题：{article.get('title', '')}"]
-        excerpt = article.get("excerpt", "")
-        if excerpt:
-            parts.append(f"文章摘要：{excerpt}")
-        sections = article.get("sections", [])
-        body_parts = []
-        for sec in sections:
-            heading = sec.get("title", sec.get("heading", ""))
-            paragraphs = sec.get("paragraphs", [])
-            if heading:
-                body_parts.append(heading)
-            body_parts.extend(paragraphs)
-        body_text = "\n".join(body_parts)
-        if len(body_text) > 5000:
-            body_text = body_text[:5000] + "\n...(正文已截断)"
-        parts.append(f"文章正文：\n{body_text}")
-        takeaways = article.get("key_takeaways", [])
-        if takeaways:
-            parts.append(f"关键要点：{', '.join(takeaways)}")
-        tags = article.get("tags", [])
-        if tags:
-            parts.append(f"文章标签：{', '.join(tags)}")
-        return "\n\n".join(parts)
+        return build_article_message(article, max_body_chars=5000)
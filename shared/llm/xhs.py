@@ -8,8 +8,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from shared.llm.client import LLMClient, extract_json_block
+from shared.llm.client import LLMClient, build_article_message, extract_json_block
 from shared.utils.exceptions import ContentGenError, LLMResponseError
+from shared.utils.helpers import format_hashtags
 from shared.utils.logger import get_logger
 from shared.wp.client import WPPost
 
@@ -31,7 +32,7 @@ class XHSContent:
 
     def full_text(self) -> str:
         """拼装完整发布文本（正文 + 话题标签），确保不超过小红书字数限制"""
-        tags_str = " ".join(f"#{t}" for t in self.hashtags)
+        tags_str = format_hashtags(self.hashtags)
         if not tags_str:
             return self.body[:self.XHS_MAX_BODY_LENGTH]
         full = f"{self.body}\n\n{tags_str}"
@@ -171,7 +172,9 @@ class XHSContentGenerator:
         logger.info("生成小红书文案，文章: [%s] %s", post.id, post.title)
 
         raw = self._call_llm(user_msg)
-        content = self._parse_response(raw, fallback_title=post.title, image_urls=post.all_image_urls[:9])
+        with self.llm.discarding_on_error():
+            content = self._parse_response(
+                raw, fallback_title=post.title, image_urls=post.all_image_urls[:9])
         logger.info("文案生成完成: %s", content.summary())
         return content
 
@@ -182,7 +185,9 @@ class XHSContentGenerator:
 
         raw = self._call_llm(user_msg)
         images = (image_paths or [])[:9]
-        content = self._parse_response(raw, fallback_title=article.get("title", "")[:20], image_urls=images)
+        with self.llm.discarding_on_error():
+            content = self._parse_response(
+                raw, fallback_title=article.get("title", "")[:20], image_urls=images)
         logger.info("文案生成完成（本地素材）: %s", content.summary())
         return content
 
@@ -324,26 +329,4 @@ class XHSContentGenerator:
 
     @staticmethod
     def _build_user_message_from_article(article: dict) -> str:
-        parts = [f"文章标题：{article.get('title', '')}"]
-        excerpt = article.get("excerpt", "")
-        if excerpt:
-            parts.append(f"文章摘要：{excerpt}")
-        sections = article.get("sections", [])
-        body_parts = []
-        for sec in sections:
-            heading = sec.get("title", sec.get("heading", ""))
-            paragraphs = sec.get("paragraphs", [])
-            if heading:
-                body_parts.append(heading)
-            body_parts.extend(paragraphs)
-        body_text = "\n".join(body_parts)
-        if len(body_text) > 3000:
-            body_text = body_text[:3000] + "\n...(正文已截断)"
-        parts.append(f"文章正文：\n{body_text}")
-        takeaways = article.get("key_takeaways", [])
-        if takeaways:
-            parts.append(f"关键要点：{', '.join(takeaways)}")
-        tags = article.get("tags", [])
-        if tags:
-            parts.append(f"文章标签：{', '.join(tags)}")
-        return "\n\n".join(parts)
+        return build_article_message(article, max_body_chars=3000)
@@ -425,6 +425,7 @@ class StoryVideoPipeline:
 
         data = extract_json_block(raw)
         if not data:
+            self.llm.discard_last()
             raise RuntimeError(f"无法解析分镜脚本 JSON:\n{raw[:500]}")
 
         board = StoryBoard(
@@ -575,6 +576,7 @@ class StoryVideoPipeline:
         data = extract_json_block(raw)
         if not data:
             logger.error("无法解析文案 JSON:\n%s", raw[:500])
+            self.llm.discard_last()
             return {}
 
         contents = {}
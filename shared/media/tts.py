@@ -510,16 +510,24 @@ class TTSGenerator:
 
     # ── 音视频合并 ──
 
+    @staticmethod
+    def _probe(file_path: str) -> str:
+        """
+        读取媒体文件头信息（ffmpeg 的 stderr 输出）。
+        只指定输入、不指定输出时 ffmpeg 解析完文件头即退出，不会解码任何帧。
+        """
+        result = subprocess.run(
+            [FFMPEG_EXE, "-hide_banner", "-i", file_path],
+            capture_output=True, timeout=30,
+            text=False,  # read as bytes to avoid GBK decode errors on Windows
+        )
+        return result.stderr.decode("utf-8", errors="replace")
+
     @staticmethod
     def get_duration(file_path: str) -> float:
         """用 ffmpeg 获取媒体文件时长（秒）"""
-        cmd = [FFMPEG_EXE, "-i", file_path, "-f", "null", "-"]
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, timeout=30,
-                text=False,  # read as bytes to avoid GBK decode errors on Windows
-            )
-            stderr = result.stderr.decode("utf-8", errors="replace")
+            stderr = TTSGenerator._probe(file_path)
             for line in stderr.split("\n"):
                 if "Duration:" in line:
                     dur_str = line.split("Duration:")[1].split(",")[0].strip()
@@ -532,12 +540,8 @@ class TTSGenerator:
     @staticmethod
     def get_video_resolution(file_path: str) -> Tuple[int, int]:
         """用 ffmpeg 获取视频分辨率 (width, height)，默认返回 (1080, 1920)"""
-        cmd = [FFMPEG_EXE, "-i", file_path, "-f", "null", "-"]
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, timeout=30, text=False,
-            )
-            stderr = result.stderr.decode("utf-8", errors="replace")
+            stderr = TTSGenerator._probe(file_path)
             # 匹配 "1920x1080" 或 "1080x1920" 等格式
             match = re.search(r'(\d{3,4})x(\d{3,4})', stderr)
             if match:
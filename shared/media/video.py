@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from volcengine.Credentials import Credentials
 from volcengine.auth.SignerV4 import SignerV4
 from volcengine.base.Request import Request
@@ -23,6 +24,15 @@ from shared.utils.retry import retry
 
 logger = get_logger("video-gen")
 
+_POOL_SIZE = 16  # 每个主机保持的最大连接数
+
+# 签名请求（提交 / 轮询任务）与视频下载共用一个 Session：
+# 轮询每隔几秒请求一次同一主机，复用连接省去每次的 TCP + TLS 握手
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
 
 # ────────── 视频 prompt 系统提示词 ──────────
 
@@ -83,7 +93,7 @@ def _sign_and_post(
     SignerV4.sign(request, creds)
 
     url = f"https://{host}/?Action={action}&Version=2022-08-31"
-    resp = requests.post(url, headers=request.headers, data=request.body, timeout=30)
+    resp = _session.post(url, headers=request.headers, data=request.body, timeout=30)
     return resp.json()
 
 
@@ -220,7 +230,7 @@ class VideoGenerator:
     def download(url: str, save_path: Path) -> Path:
         """下载视频到本地"""
         logger.info("下载视频: %s", url[:80])
-        resp = requests.get(url, timeout=120, stream=True)
+        resp = _session.get(url, timeout=120, stream=True)
         resp.raise_for_status()
         save_path.parent.mkdir(parents=True, exist_ok=True)
         with open(save_path, "wb") as f:
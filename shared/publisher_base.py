@@ -11,6 +11,7 @@ from typing import List, Optional
 
 from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext, Locator
 
+from shared.utils.helpers import save_json
 from shared.utils.logger import get_logger
 
 __all__ = [
@@ -32,6 +33,7 @@ ELEMENT_TIMEOUT = 60_000    # 等待元素超时 (ms)
 LOGIN_WAIT_SECONDS = 180    # 登录等待超时 (s)
 
 LOGS_DIR = Path(__file__).resolve().parent.parent / "logs"
+STORAGE_STATE_FILE = "storage_state.json"   # 登录态快照，供共享浏览器池恢复
 
 
 class BasePublisher:
@@ -46,6 +48,9 @@ class BasePublisher:
 
     子类需要实现的方法：
         _is_logged_in() -> bool     判断是否已登录
+
+    传入 pool（shared.browser_pool.BrowserPool）时，不再单独启动浏览器，
+    而是在共享浏览器中创建独立上下文，登录态由 USER_DATA_DIR 下的快照恢复。
     """
 
     PLATFORM_NAME: str = "未知平台"
@@ -53,8 +58,9 @@ class BasePublisher:
     LOGIN_URL: str = ""
     PLATFORM_URL: str = ""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, pool=None):
         self.headless = headless
+        self._pool = pool
         self._pw = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
@@ -75,17 +81,22 @@ class BasePublisher:
     # ────────── 浏览器生命周期 ──────────
 
     def start(self) -> None:
-        """启动浏览器（持久化上下文，保存完整登录态）"""
-        self._pw = sync_playwright().start()
+        """启动浏览器（持久化上下文，保存完整登录态；有共享池时改用池内独立上下文）"""
         self.USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        self._context = self._pw.chromium.launch_persistent_context(
-            user_data_dir=str(self.USER_DATA_DIR),
-            channel="msedge",
-            headless=self.headless,
-            args=["--disable-blink-features=AutomationControlled"],
-            viewport=DEFAULT_VIEWPORT,
-            user_agent=DEFAULT_UA,
-        )
+        state_file = self.USER_DATA_DIR / STORAGE_STATE_FILE
+        # 尚无登录态快照时仍走持久化上下文，避免在共享池里重新扫码
+        if self._pool is not None and state_file.exists():
+            self._context = self._pool.new_context(state_file)
+        else:
+            self._pw = sync_playwright().start()
+            self._context = self._pw.chromium.launch_persistent_context(
+                user_data_dir=str(self.USER_DATA_DIR),
+                channel="msedge",
+                headless=self.headless,
+                args=["--disable-blink-features=AutomationControlled"],
+                viewport=DEFAULT_VIEWPORT,
+                user_agent=DEFAULT_UA,
+            )
         self._context.add_init_script(
             "Object.defineProperty(navigator,'webdriver',{get:()=>undefined})"
         )
@@ -107,6 +118,13 @@ class BasePublisher:
                 pass
         self._temp_files.clear()
         if self._context:
+            try:
+                # 保存登录态快照，下次在共享浏览器池中可直接恢复；
+                # --workers 多进程会同时读写同一快照，经唯一临时文件 + os.replace 原子替换，
+                # 读方只会看到完整的旧版或新版
+                save_json(self.USER_DATA_DIR / STORAGE_STATE_FILE, self._context.storage_state())
+            except Exception:
+                pass
             try:
                 self._context.close()
             except Exception:
@@ -6,9 +6,24 @@ from __future__ import annotations
 
 import html
 import json
+import os
 import re
+import select
+import sys
+import tempfile
+import zlib
 from datetime import datetime
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # 可选依赖：未安装时回退标准库 json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # 可选依赖：未安装时回退为只读文件开头 + 正则
+    ijson = None
 
 
 def slugify(text: str) -> str:
@@ -106,6 +121,56 @@ def json_for_script(data: Dict[str, Any]) -> str:
     return json.dumps(data, ensure_ascii=False).replace("</", "<\\/")
 
 
+def format_hashtags(tags: Sequence[str]) -> str:
+    """话题标签拼成 "#标签1 #标签2"（小红书 / 抖音 / 视频号格式）"""
+    return " ".join(["#" + t for t in tags])
+
+
+def head_lines(text: str, n: int) -> Tuple[List[str], bool]:
+    """
+    取文本的前 n 行，返回 (行列表, 后面是否还有内容)。
+    逐行 find 到第 n 行即停，不切分、不扫描剩余正文（预览长文时使用）。
+    """
+    lines: List[str] = []
+    pos = 0
+    while len(lines) < n:
+        end = text.find("\n", pos)
+        if end < 0:
+            lines.append(text[pos:])
+            return lines, False
+        lines.append(text[pos:end])
+        pos = end + 1
+    return lines, pos < len(text)
+
+
+def confirm(prompt: str, timeout: float = 30.0, default: bool = False) -> bool:
+    """
+    命令行 y/N 确认：输入 y 返回 True，直接回车返回 default。
+    stdin 已关闭（管道 / CI）时立即返回 default；timeout 秒内没有输入也返回 default，
+    无人值守的批量任务不会卡死在确认上。Windows 控制台不支持对 stdin 使用 select，退化为普通 input()。
+    """
+    print(prompt, end="", flush=True)
+    if sys.stdin is None or sys.stdin.closed:
+        print()
+        return default
+    if os.name == "nt":
+        try:
+            answer = input()
+        except EOFError:
+            return default
+    else:
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if not ready:
+            print(f"\n  {timeout:.0f} 秒内无输入，按默认处理")
+            return default
+        answer = sys.stdin.readline()
+        if not answer:  # EOF
+            print()
+            return default
+    answer = answer.strip().lower()
+    return answer == "y" if answer else default
+
+
 def make_anchor_id(text: str, idx: int) -> str:
     """生成 HTML 锚点 ID"""
     token = re.sub(r"[^\w\s-]", " ", text, flags=re.UNICODE).strip().lower()
@@ -116,9 +181,112 @@ def make_anchor_id(text: str, idx: int) -> str:
     return f"section-{idx + 1}-{token[:30]}"
 
 
-def save_json(path, data: Any) -> None:
-    """保存 JSON 文件（自动创建父目录）"""
+# 横版配图 prompt → 竖版（3:4）的替换表，单次正则扫描完成全部替换
+_VERTICAL_PROMPT_MAP = {"16:9": "3:4 vertical portrait", "Wide ": "Vertical portrait "}
+_VERTICAL_PROMPT_RE = re.compile("|".join(map(re.escape, _VERTICAL_PROMPT_MAP)))
+
+
+def _vertical_repl(m: "re.Match[str]") -> str:
+    return _VERTICAL_PROMPT_MAP[m.group(0)]
+
+
+def to_vertical_prompt(prompt: str) -> str:
+    """将 16:9 横版配图 prompt 改写为 3:4 竖版描述"""
+    return _VERTICAL_PROMPT_RE.sub(_vertical_repl, prompt)
+
+
+def image_seed(text: str) -> int:
+    """由 slug/标题得到稳定的图片基础 seed（CRC32，非负 31 位）"""
+    return zlib.crc32(text.encode("utf-8")) & 0x7FFFFFFF
+
+
+def save_json(path, data: Any, fsync: bool = True) -> None:
+    """
+    保存 JSON 文件（自动创建父目录；已安装 orjson 时用其序列化）。
+    先整体序列化为字节，写入同目录临时文件并 fsync 后 os.replace 原子替换，
+    进程中途被杀或断电都不会留下半截文件。
+    连续写多个文件时可传 fsync=False 跳过逐个刷盘，写完后由调用方统一 os.sync()；
+    替换仍是原子的，只是断电时可能丢失最近的写入。
+    """
     from pathlib import Path
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        blob = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        blob = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+    # 临时文件名唯一，多个进程同时保存同一文件时不会互相覆盖对方的半成品
+    fd, tmp = tempfile.mkstemp(dir=str(p.parent), prefix=f"{p.name}.", suffix=".tmp")
+    try:
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.chmod(tmp, 0o644)  # mkstemp 默认 0600，保持与普通文件一致
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_json(path) -> Any:
+    """读取 JSON 文件：一次读出字节直接解析（已安装 orjson 时用其解析）"""
+    from pathlib import Path
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# load_json_fields 对不小于该大小的文件改用 ijson 流式读取
+_STREAM_MIN_BYTES = 256 * 1024
+
+
+def load_json_fields(path, fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    只取 JSON 对象顶层的指定字段，返回 {字段: 值}（缺失的字段不出现）。
+    小文件直接整体解析；大文件在已安装 ijson 时逐个顶层字段流式读取，
+    不需要的字段读完即丢弃，不会整篇常驻内存。
+    """
+    wanted = set(fields)
+    if ijson is None or os.path.getsize(path) < _STREAM_MIN_BYTES:
+        data = load_json(path)
+        return {k: v for k, v in data.items() if k in wanted}
+    with open(path, "rb") as f:
+        return {k: v for k, v in ijson.kvitems(f, "", use_float=True) if k in wanted}
+
+
+# peek_json_field 在未安装 ijson 时最多读取的文件开头字节数
+_PEEK_HEAD_BYTES = 256 * 1024
+
+
+def peek_json_field(path, key: str, default: Any = None) -> Any:
+    """
+    只读取 JSON 对象顶层的某个字段，不解析整个文件（列表视图取标题等场景）。
+    已安装 ijson 时流式解析、找到即停；否则在文件开头 256KB 内用正则查找该顶层字符串字段，
+    无法确认时回退为完整解析。
+    """
+    with open(path, "rb") as f:
+        if ijson is not None:
+            events = ijson.parse(f)
+            for prefix, event, value in events:
+                if prefix == "" and event == "map_key" and value == key:
+                    _, event, value = next(events)
+                    return value if event in ("string", "number", "boolean", "null") else default
+            return default
+        head = f.read(_PEEK_HEAD_BYTES)
+    pattern = rb'"' + re.escape(key.encode("utf-8")) + rb'"\s*:\s*("(?:[^"\\]|\\.)*")'
+    m = re.search(pattern, head)
+    # 命中位置之前只有最外层的 { 且没有 [ 时，才能确认是顶层字段
+    if m and head.count(b"{", 0, m.start()) == 1 and b"[" not in head[:m.start()]:
+        return json.loads(m.group(1))
+    data = load_json(path)
+    return data.get(key, default) if isinstance(data, dict) else default
@@ -12,9 +12,10 @@ import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from shared.utils.exceptions import WordPressError, WPAuthError, WPNotFoundError
@@ -24,6 +25,8 @@ from shared.utils.logger import get_logger
 logger = get_logger("wordpress")
 
 _USER_AGENT = "AineooPublisher/2.0 (WordPress Auto-Publish)"
+_POOL_SIZE = 16  # 每个主机保持的最大连接数
+_BULK_PAGE_SIZE = 100  # WP REST 列表接口 per_page 上限
 
 
 # ────────── 数据模型（只读端使用） ──────────
@@ -93,6 +96,10 @@ class WordPressClient:
         self.timeout = timeout
 
         self.session = requests.Session()
+        # 批量命令会在多个线程间共享同一个客户端，连接池上限放宽到 _POOL_SIZE
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "User-Agent": _USER_AGENT,
             "Accept": "application/json",
@@ -331,6 +338,36 @@ class WordPressClient:
         )
         return self._parse_post(data)
 
+    def get_posts_bulk(self, post_ids: Sequence[int]) -> Dict[int, WPPost]:
+        """
+        一次请求批量获取多篇已发布文章（/posts?include=...，每批最多 100 篇），返回 {id: WPPost}。
+        请求失败或未返回的 ID（如草稿）不在结果中，由调用方按需回退 get_post。
+        """
+        ids = list(dict.fromkeys(post_ids))
+        posts: Dict[int, WPPost] = {}
+        for i in range(0, len(ids), _BULK_PAGE_SIZE):
+            chunk = ids[i:i + _BULK_PAGE_SIZE]
+            try:
+                items = self._request_json(
+                    "get",
+                    f"{self.wp_api}/posts",
+                    params={
+                        "include": ",".join(str(pid) for pid in chunk),
+                        "per_page": len(chunk),
+                        "_embed": 1,
+                    },
+                    expected_status=(200,),
+                )
+            except Exception as exc:
+                logger.warning("批量获取文章失败，将逐篇获取: %s", exc)
+                continue
+            if isinstance(items, list):
+                for item in items:
+                    post = self._parse_post(item)
+                    posts[post.id] = post
+        logger.info("批量获取文章 %d/%d 篇", len(posts), len(ids))
+        return posts
+
     # ── 解析响应 ──
 
     @staticmethod
@@ -38,8 +38,9 @@ ELEMENT_TIMEOUT = 60_000
 class ToutiaoPublisher:
     """今日头条自动发布器，支持 with 语句"""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, pool=None):
         self.headless = headless
+        self._pool = pool
         self._pw = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
@@ -59,26 +60,29 @@ class ToutiaoPublisher:
     # ────────── 生命周期 ──────────
 
     def start(self):
-        """启动浏览器（使用系统 Edge）"""
-        self._pw = sync_playwright().start()
-        self._browser = self._pw.chromium.launch(
-            channel="msedge",
-            headless=self.headless,
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        ctx_opts = {
-            "viewport": {"width": 1280, "height": 800},
-            "user_agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0"
-            ),
-        }
+        """启动浏览器（使用系统 Edge；有共享池时改用池内独立上下文）"""
         if COOKIES_FILE.exists():
-            ctx_opts["storage_state"] = str(COOKIES_FILE)
             logger.info("从本地加载 cookies")
-
-        self._context = self._browser.new_context(**ctx_opts)
+        if self._pool is not None:
+            self._context = self._pool.new_context(COOKIES_FILE)
+        else:
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(
+                channel="msedge",
+                headless=self.headless,
+                args=["--disable-blink-features=AutomationControlled"],
+            )
+            ctx_opts = {
+                "viewport": {"width": 1280, "height": 800},
+                "user_agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0"
+                ),
+            }
+            if COOKIES_FILE.exists():
+                ctx_opts["storage_state"] = str(COOKIES_FILE)
+            self._context = self._browser.new_context(**ctx_opts)
         self._context.add_init_script(
             "Object.defineProperty(navigator,'webdriver',{get:()=>undefined})"
         )
@@ -630,9 +634,9 @@ class ToutiaoPublisher:
 
 # ────────── 便捷函数 ──────────
 
-def publish_toutiao_article(content: ToutiaoContent, headless: bool = False) -> bool:
-    """一键发布今日头条文章"""
-    with ToutiaoPublisher(headless=headless) as pub:
+def publish_toutiao_article(content: ToutiaoContent, headless: bool = False, pool=None) -> bool:
+    """一键发布今日头条文章（pool: 可选的共享浏览器池）"""
+    with ToutiaoPublisher(headless=headless, pool=pool) as pub:
         pub.login()
         time.sleep(settings.toutiao_publish_delay)
         return pub.publish(content)
@@ -41,8 +41,8 @@ class WeiboPublisher(BasePublisher):
 
     USER_DATA_DIR = Path(__file__).resolve().parent / "data" / "browser_profile"
 
-    def __init__(self, headless: bool = False):
-        super().__init__(headless)
+    def __init__(self, headless: bool = False, pool=None):
+        super().__init__(headless, pool=pool)
 
     # ────────── 登录 ──────────
 
@@ -1232,9 +1232,9 @@ class WeiboPublisher(BasePublisher):
 
 # ────────── 便捷函数 ──────────
 
-def publish_weibo_article(content: WeiboContent, headless: bool = False) -> bool:
-    """一键发布微博头条文章"""
-    with WeiboPublisher(headless=headless) as pub:
+def publish_weibo_article(content: WeiboContent, headless: bool = False, pool=None) -> bool:
+    """一键发布微博头条文章（pool: 可选的共享浏览器池）"""
+    with WeiboPublisher(headless=headless, pool=pool) as pub:
         pub.login()
         time.sleep(settings.weibo_publish_delay)
         return pub.publish(content)
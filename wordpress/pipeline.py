@@ -7,6 +7,7 @@ WordPress 发布流水线
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
@@ -16,13 +17,16 @@ from shared.media.avatar import AvatarGenerator
 from shared.media.image import ImageGenerator
 from shared.media.video import VideoGenerator
 from shared.utils.exceptions import QualityError
-from shared.utils.helpers import merge_unique, save_json, slugify_chinese
+from shared.utils.helpers import image_seed, merge_unique, save_json, slugify_chinese
 from shared.utils.logger import get_logger
 from shared.wp.client import WordPressClient
 from wordpress.html_builder import build_content_html, evaluate_quality, verify_published_page
 
 logger = get_logger("wp-pipeline")
 
+# 配图生成 + 上传的并发数（火山引擎与 WordPress 均为远程 I/O）
+IMAGE_WORKERS = 4
+
 
 class WPPublisher:
     """WordPress 自动发布器"""
@@ -116,15 +120,35 @@ class WPPublisher:
         local_images: List[Dict] = []
 
         # 统一种子：同一篇文章的所有图片使用相同基础 seed，确保视觉一致性
-        base_seed = sum(ord(c) for c in slug) % 2147483647
+        base_seed = image_seed(slug)
 
-        for i, spec in enumerate(img_specs):
+        def _gen_and_upload(item):
+            i, spec = item
             local_path = image_dir / f"{spec['role']}_{i:02d}.png"
 
             # 生成图片（传入基于文章的 seed 以保证风格一致）
             generated = None
             if self.image_gen:
                 generated = self.image_gen.generate(spec["prompt"], local_path, seed=base_seed + i)
+            if not generated:
+                return local_path, None, None
+
+            # 上传到 WordPress
+            media = self.wp.upload_media(
+                generated,
+                title=spec.get("alt_text", f"{article['focus_keyword']} image {i}"),
+                alt_text=spec.get("alt_text", article["focus_keyword"]),
+            )
+            return local_path, generated, media
+
+        # 每张图的生成 + 上传互不依赖，并发进行（共享 wp 的 Session 连接池）；
+        # map 保持原有顺序，特色图/正文图的归类与串行时一致
+        img_results = []
+        if img_specs:
+            with ThreadPoolExecutor(max_workers=min(len(img_specs), IMAGE_WORKERS)) as pool:
+                img_results = list(pool.map(_gen_and_upload, enumerate(img_specs)))
+
+        for spec, (local_path, generated, media) in zip(img_specs, img_results):
             if not generated:
                 continue
 
@@ -135,12 +159,6 @@ class WPPublisher:
                 "caption": spec.get("caption", ""),
             })
 
-            # 上传到 WordPress
-            media = self.wp.upload_media(
-                generated,
-                title=spec.get("alt_text", f"{article['focus_keyword']} image {i}"),
-                alt_text=spec.get("alt_text", article["focus_keyword"]),
-            )
             if not media:
                 continue
 
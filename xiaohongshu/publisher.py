@@ -34,8 +34,8 @@ class XHSPublisher(BasePublisher):
 
     USER_DATA_DIR = Path(__file__).resolve().parent / "data" / "browser_profile"
 
-    def __init__(self, headless: bool = False):
-        super().__init__(headless)
+    def __init__(self, headless: bool = False, pool=None):
+        super().__init__(headless, pool=pool)
 
     # ────────── 登录 ──────────
 
@@ -1101,7 +1101,10 @@ class XHSPublisher(BasePublisher):
         self._screenshot("video_page_ready.png")
 
     def _upload_video(self, video_path: str):
-        """上传视频文件"""
+        """
+        上传视频文件。
+        只把本地路径交给浏览器，由浏览器直接从磁盘分块读取上传，Python 进程不会把视频读入内存。
+        """
         page = self._page
         logger.info("上传视频...")
 
@@ -1257,17 +1260,18 @@ class XHSPublisher(BasePublisher):
 
 # ────────── 便捷函数 ──────────
 
-def publish_note(content: XHSContent, headless: bool = False) -> bool:
-    """一键发布小红书笔记"""
-    with XHSPublisher(headless=headless) as pub:
+def publish_note(content: XHSContent, headless: bool = False, pool=None) -> bool:
+    """一键发布小红书笔记（pool: 可选的共享浏览器池）"""
+    with XHSPublisher(headless=headless, pool=pool) as pub:
         pub.login()
         time.sleep(settings.xhs_publish_delay)
         return pub.publish(content)
 
 
-def publish_video_note(video_path: str, title: str, body: str, headless: bool = False) -> bool:
-    """一键发布小红书视频笔记"""
-    with XHSPublisher(headless=headless) as pub:
+def publish_video_note(video_path: str, title: str, body: str, headless: bool = False,
+                       pool=None) -> bool:
+    """一键发布小红书视频笔记（pool: 可选的共享浏览器池）"""
+    with XHSPublisher(headless=headless, pool=pool) as pub:
         pub.login()
         time.sleep(settings.xhs_publish_delay)
         return pub.publish_video(video_path, title, body)